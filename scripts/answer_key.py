@@ -0,0 +1,134 @@
+"""
+Ground-Truth Answer Key
+For Task 05: Descriptive Statistics and Large Language Models
+
+Computes the expected answer for every scorable question from
+BasketballAnalyzer (player_rankings, position_analysis, basic_team_stats),
+so the key follows the dataset instead of drifting from it. Keys are
+memoized by a fingerprint of the dataset's contents, so scoring any number
+of responses runs the analysis once per dataset.
+
+Each answer has an id (referenced by PromptJob.answer_id) and holds:
+    answer:  Display string, e.g. "Dyaisha Fair"
+    items:   Parts that must all appear in a response, in order for rankings
+    aliases: Other accepted spellings of the items (e.g. "G" for "Guard")
+    value:   Numeric value for count-style answers, else None
+    kind:    "number", "name", "ranked_list" or "text"
+
+The key also lists the entities a response may mention (every player and
+position), which the answer matcher needs to measure precision.
+"""
+
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from basketball_analyzer import BasketballAnalyzer
+
+POSITION_NAMES = {"G": "Guard", "F": "Forward", "C": "Center"}
+
+_ANSWER_KEYS = {}
+_ANSWER_KEYS_LOCK = threading.Lock()
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Content hash of a dataset
+
+    Args:
+        df (pd.DataFrame): Dataset
+
+    Returns:
+        str: SHA-256 hex digest of the column names and row hashes
+    """
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _answer(answer: str, kind: str, items: Optional[List[str]] = None,
+            aliases: Optional[Dict[str, List[str]]] = None, value: Optional[float] = None) -> Dict:
+    return {
+        "answer": answer,
+        "kind": kind,
+        "items": items if items is not None else [answer],
+        "aliases": aliases or {},
+        "value": value
+    }
+
+
+def _position_answer(code: str) -> Dict:
+    name = POSITION_NAMES.get(code, code)
+    return _answer(name, "name", aliases={name: [code]} if name != code else None)
+
+
+def compute_answer_key(df: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Run the analysis and derive every expected answer (not memoized)
+
+    Args:
+        df (pd.DataFrame): Basketball dataset
+
+    Returns:
+        Dict[str, Dict]: Answers by answer id
+    """
+    analyzer = BasketballAnalyzer(data_path=None)
+    analyzer.data = df.copy()
+    team = analyzer.basic_team_stats()
+    rankings = analyzer.player_rankings()
+    positions = analyzer.position_analysis()
+
+    position_of = dict(zip(df["Player"], df["Position"]))
+    overview = team["team_overview"]
+    leading_scorer = rankings["top_scorers"][0]["Player"]
+    top_rebounder = rankings["top_rebounders"][0]["Player"]
+    top_three = [row["Player"] for row in rankings["top_scorers"][:3]]
+    ppg_by_position = positions["position_stats"]["Points_Per_Game_mean"]
+    record = overview["season_record"].split()[0]
+    rebounder_position = _position_answer(position_of[top_rebounder])
+
+    key = {
+        "player_count": _answer(str(overview["total_players"]), "number",
+                                value=overview["total_players"]),
+        "games_played": _answer(str(overview["total_games"]), "number",
+                                value=overview["total_games"]),
+        "leading_scorer": _answer(leading_scorer, "name"),
+        "leading_scorer_position": _position_answer(position_of[leading_scorer]),
+        "season_record": _answer(record, "text"),
+        "top3_scorers": _answer(", ".join(top_three), "ranked_list", items=top_three),
+        "top_position_ppg": _position_answer(max(ppg_by_position, key=ppg_by_position.get)),
+        "top_rebounder": _answer(f"{top_rebounder} ({rebounder_position['answer']})", "name",
+                                 items=[top_rebounder, rebounder_position["answer"]],
+                                 aliases=rebounder_position["aliases"]),
+    }
+    if rankings["most_efficient_shooters"]:
+        key["top_fg_percentage"] = _answer(rankings["most_efficient_shooters"][0]["Player"], "name")
+    return key
+
+
+def build_answer_key(df: pd.DataFrame) -> Dict:
+    """
+    Answer key for a dataset, computed once per distinct dataset contents
+
+    Args:
+        df (pd.DataFrame): Basketball dataset
+
+    Returns:
+        Dict: {"fingerprint": str, "answers": {answer_id: answer},
+               "entities": {"player": [names], "position": {name: [codes]}}}
+    """
+    fingerprint = dataset_fingerprint(df)
+    with _ANSWER_KEYS_LOCK:
+        if fingerprint not in _ANSWER_KEYS:
+            positions = sorted(df["Position"].dropna().unique())
+            _ANSWER_KEYS[fingerprint] = {
+                "fingerprint": fingerprint,
+                "answers": compute_answer_key(df),
+                "entities": {
+                    "player": sorted(df["Player"].dropna().unique().tolist()),
+                    "position": {POSITION_NAMES.get(code, code): [code] for code in positions}
+                }
+            }
+        return _ANSWER_KEYS[fingerprint]
@@ -0,0 +1,376 @@
+"""
+Answer Matching Engine
+For Task 05: Descriptive Statistics and Large Language Models
+
+Scores LLM responses against the answer key in bulk. Every entity a
+response may mention (player names, positions, text answers such as the
+season record) is compiled into one alternation pattern; position codes
+(G/F/C) and numbers get their own compiled patterns. All responses are
+joined and scanned once per pattern, each match is attributed back to its
+response by offset, and scoring runs as numpy array operations.
+
+Per response this yields the expected items found (recall), how many of the
+same kind of entity it mentioned were right (precision), and an accuracy
+score:
+    number:      1.0 if any extracted number is within tolerance of the value
+    name / text: F1 of precision and recall, so naming a wrong entity beside
+                 the right one (or listing every option) scores below 1.0
+    ranked_list: longest in-order run of expected items / number of items
+
+Responses that miss an expected player get a second look through the fuzzy
+name index, so misspellings and abbreviations ("D. Fair") still count.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from name_index import NameIndex
+
+_SEPARATOR = "\n\x00\n"
+_NUMBER = re.compile(r"\d+(?:,\d{3})*(?:\.\d+)?")
+
+_MATCHERS = {}
+_MATCHERS_LOCK = threading.Lock()
+
+
+def _ordered_fraction(expected: List[int], mentioned: List[int]) -> float:
+    """Longest common subsequence of expected and mentioned order, as a fraction of expected"""
+    lengths = [0] * (len(mentioned) + 1)
+    for item in expected:
+        previous = 0
+        for j, entity in enumerate(mentioned, start=1):
+            current = lengths[j]
+            lengths[j] = previous + 1 if item == entity else max(lengths[j], lengths[j - 1])
+            previous = current
+    return lengths[-1] / len(expected) if expected else 0.0
+
+
+def _word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _join(texts: Sequence[str]) -> Tuple[str, np.ndarray]:
+    """Join texts (with a leading separator) and return each text's start offset"""
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    starts = len(_SEPARATOR) + np.concatenate(([0], np.cumsum(lengths + len(_SEPARATOR))[:-1]))
+    return _SEPARATOR + _SEPARATOR.join(texts), starts
+
+
+class AnswerMatcher:
+    """
+    Compiled multi-pattern matcher for one answer key
+    """
+
+    def __init__(self, answer_key: Dict, relative_tolerance: float = 0.01,
+                 absolute_tolerance: float = 0.05, fuzzy_confidence: Optional[float] = 0.7):
+        """
+        Compile the matcher
+
+        Args:
+            answer_key (Dict): Output of answer_key.build_answer_key()
+            relative_tolerance (float): Allowed relative error for numeric answers
+            absolute_tolerance (float): Allowed absolute error for numeric answers
+            fuzzy_confidence (float): Lowest name-index confidence accepted for a
+                misspelled player (None disables fuzzy matching)
+        """
+        self.answers = answer_key.get("answers", {})
+        self.answer_ids = list(self.answers)
+        self._answer_index = {answer_id: i for i, answer_id in enumerate(self.answer_ids)}
+
+        # Entity universe: every player and position, plus non-numeric expected items
+        entities = answer_key.get("entities", {})
+        entity_type = {name: "player" for name in entities.get("player", [])}
+        entity_type.update({name: "position" for name in entities.get("position", {})})
+        codes = {code: name for name, code_list in entities.get("position", {}).items()
+                 for code in code_list if code != name}
+        for answer in self.answers.values():
+            if answer["kind"] == "number":
+                continue
+            for item in answer["items"]:
+                entity_type.setdefault(item, "text")
+            for item, aliases in answer["aliases"].items():
+                codes.update({alias: item for alias in aliases if alias != item})
+
+        self.entities = list(entity_type)
+        self.entity_types = [entity_type[name] for name in self.entities]
+        index = {name: i for i, name in enumerate(self.entities)}
+        self._entity_index = index
+        self._is_player = np.array([t == "player" for t in self.entity_types], dtype=bool)
+        players = entities.get("player", [])
+        self.name_index = NameIndex(players) if players and fuzzy_confidence is not None else None
+        self.fuzzy_confidence = fuzzy_confidence
+
+        # Longer names match case-insensitively; short codes (G/F/C) only in their exact case
+        codes.update({name: name for name in self.entities if len(name) <= 2})
+        self._surface = {name.lower(): index[name] for name in self.entities if len(name) > 2}
+        self._codes = {code: index[name] for code, name in codes.items()}
+        # Positions and text answers may be plural ("Forwards"); player names may not
+        self._entity_pattern = self._literal_pattern(self._surface, r"(?:s|es)?(?!\w)")
+        self._code_pattern = self._literal_pattern(self._codes, r"(?![A-Za-z])")
+
+        # Lookup tables indexed [answer, entity]
+        n_answers, n_entities = len(self.answer_ids), len(self.entities)
+        self._expected = np.zeros((n_answers, n_entities), dtype=bool)
+        self._relevant = np.zeros((n_answers, n_entities), dtype=bool)
+        self._expected_order = []
+        types = np.array(self.entity_types, dtype=object)
+        for a, answer in enumerate(self.answers.values()):
+            items = [] if answer["kind"] == "number" else [index[item] for item in answer["items"]]
+            self._expected[a, items] = True
+            self._relevant[a] = np.isin(types, list({self.entity_types[i] for i in items}))
+            self._expected_order.append(items)
+        self._player_items = self._expected[:, self._is_player].sum(axis=1) if n_entities else np.zeros(n_answers)
+        self._item_counts = np.array([max(1, len(a["items"])) for a in self.answers.values()], dtype=float)
+        self._is_number = np.array([a["kind"] == "number" for a in self.answers.values()], dtype=bool)
+        self._is_ranked = np.array([a["kind"] == "ranked_list" for a in self.answers.values()], dtype=bool)
+        self._targets = np.array([float(a["value"]) if a["kind"] == "number" else np.nan
+                                  for a in self.answers.values()])
+        self._tolerances = np.maximum(absolute_tolerance, relative_tolerance * np.abs(self._targets))
+
+    @staticmethod
+    def _literal_pattern(forms: Dict[str, int], suffix: str) -> Optional[re.Pattern]:
+        # A plain alternation of literals keeps the regex engine's literal-prefix scan
+        if not forms:
+            return None
+        return re.compile("(%s)%s" % ("|".join(map(re.escape, sorted(forms, key=len, reverse=True))), suffix))
+
+    def scan_entities(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find mentioned entities in every text
+
+        Args:
+            texts (Sequence[str]): Responses
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Text index and entity index of each first mention, in text order
+        """
+        if not texts or not self.entities:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        owners, offsets, found = [], [], []
+        # Lower-casing can change a text's length, so each pattern gets its own offsets
+        for pattern, table, case_texts, boundary in (
+                (self._entity_pattern, self._surface, [t.lower() for t in texts], _word_char),
+                (self._code_pattern, self._codes, texts, str.isalpha)):
+            if pattern is None:
+                continue
+            joined, starts = _join(case_texts)
+            positions = []
+            for match in pattern.finditer(joined):
+                start, entity = match.start(), table[match.group(1)]
+                if match.end(1) < match.end() and self._is_player[entity]:
+                    continue
+                if not boundary(joined[start - 1]):
+                    positions.append(start)
+                    found.append(entity)
+            positions = np.asarray(positions, dtype=np.int64)
+            pattern_owners = np.searchsorted(starts, positions, side="right") - 1
+            owners.append(pattern_owners)
+            offsets.append(positions - starts[pattern_owners])
+
+        owners, offsets = np.concatenate(owners), np.concatenate(offsets)
+        found = np.asarray(found, dtype=np.int64)
+        order = np.lexsort((offsets, owners))
+        owners, found = owners[order], found[order]
+
+        # Keep each entity's first mention per text, still in mention order
+        _, first = np.unique(owners * max(1, len(self.entities)) + found, return_index=True)
+        first.sort()
+        return owners[first], found[first]
+
+    def scan_numbers(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract numbers from every text
+
+        Args:
+            texts (Sequence[str]): Responses
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Text index and value of each number
+        """
+        if not texts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=float)
+        joined, starts = _join(texts)
+        positions, values = [], []
+        for match in _NUMBER.finditer(joined):
+            positions.append(match.start())
+            values.append(match.group())
+        owners = np.searchsorted(starts, np.asarray(positions, dtype=np.int64), side="right") - 1
+        values = pd.to_numeric(pd.Series(values, dtype=object).str.replace(",", "", regex=False)).to_numpy(dtype=float)
+        return owners, values
+
+    def score(self, texts: Sequence[str], answer_ids: Sequence[Optional[str]]) -> Dict[str, np.ndarray]:
+        """
+        Score many responses in bulk
+
+        Args:
+            texts (Sequence[str]): Responses
+            answer_ids (Sequence[str]): Answer key id per response (None or unknown ids are not scored)
+
+        Returns:
+            Dict[str, np.ndarray]: "accuracy", "precision" and "recall" per response. NaN marks a
+                response that was not scored (and, for precision, one that mentioned nothing relevant).
+        """
+        n = len(texts)
+        answer_index = np.fromiter((self._answer_index.get(a, -1) for a in answer_ids), dtype=np.int64, count=n)
+        accuracy, precision, recall = np.full(n, np.nan), np.full(n, np.nan), np.full(n, np.nan)
+        if not self.answer_ids:
+            return {"accuracy": accuracy, "precision": precision, "recall": recall}
+
+        scorable = answer_index >= 0
+        numeric = np.flatnonzero(scorable & self._is_number[answer_index])
+        textual = np.flatnonzero(scorable & ~self._is_number[answer_index])
+
+        if numeric.size:
+            owners, values = self.scan_numbers([texts[i] for i in numeric])
+            answers = answer_index[numeric]
+            hits = np.abs(values - self._targets[answers[owners]]) <= self._tolerances[answers[owners]]
+            hit_counts = np.bincount(owners, weights=hits, minlength=numeric.size)
+            totals = np.bincount(owners, minlength=numeric.size)
+            recall[numeric] = (hit_counts > 0).astype(float)
+            accuracy[numeric] = recall[numeric]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                precision[numeric] = np.where(totals > 0, hit_counts / totals, np.nan)
+
+        if textual.size:
+            owners, found = self.scan_entities([texts[i] for i in textual])
+            answers = answer_index[textual]
+            row_answers = answers[owners]
+            relevant = self._relevant[row_answers, found]
+            correct = np.bincount(owners, weights=self._expected[row_answers, found], minlength=textual.size)
+            mentioned = np.bincount(owners, weights=relevant, minlength=textual.size)
+            recall[textual] = correct / self._item_counts[answers]
+            accuracy[textual] = 2 * correct / (mentioned + self._item_counts[answers])
+            with np.errstate(invalid="ignore", divide="ignore"):
+                precision[textual] = np.where(mentioned > 0, correct / mentioned, np.nan)
+
+            # Rankings also need the order in which the expected items were mentioned
+            ranked_rows = np.flatnonzero(self._is_ranked[row_answers] & relevant)
+            mentions = {}
+            for row in ranked_rows.tolist():
+                mentions.setdefault(int(owners[row]), []).append(int(found[row]))
+            for local in np.flatnonzero(self._is_ranked[answers]).tolist():
+                expected = self._expected_order[answers[local]]
+                accuracy[textual[local]] = _ordered_fraction(expected, mentions.get(local, []))
+
+            # Second look through the name index for responses missing an expected player
+            if self.name_index is not None:
+                expected_players = self._expected[row_answers, found] & self._is_player[found]
+                found_players = np.bincount(owners, weights=expected_players, minlength=textual.size)
+                for local in np.flatnonzero(found_players < self._player_items[answers]).tolist():
+                    lo, hi = np.searchsorted(owners, [local, local + 1])
+                    fuzzy = self._score_fuzzy(texts[textual[local]], answers[local], found[lo:hi])
+                    if fuzzy[2] > recall[textual[local]]:
+                        accuracy[textual[local]], precision[textual[local]], recall[textual[local]] = fuzzy
+
+        return {"accuracy": accuracy, "precision": precision, "recall": recall}
+
+    def extract(self, texts: Sequence[str], answer_ids: Sequence[Optional[str]]) -> List[str]:
+        """
+        Canonical form of the answer each response gives, for comparing responses
+
+        Numeric answers reduce to the expected value when any number is within
+        tolerance, else to the first number; name and list answers to the first
+        mentioned entities of the expected kind, in order. Unscored responses
+        fall back to their normalized text.
+
+        Args:
+            texts (Sequence[str]): Responses
+            answer_ids (Sequence[str]): Answer key id per response
+
+        Returns:
+            List[str]: Canonical answer per response ("" if it gives none)
+        """
+        n = len(texts)
+        answer_index = np.fromiter((self._answer_index.get(a, -1) for a in answer_ids), dtype=np.int64, count=n)
+        extracted = [" ".join(str(t).lower().split()).rstrip(".!") for t in texts]
+        if not self.answer_ids:
+            return extracted
+
+        scorable = answer_index >= 0
+        numeric = np.flatnonzero(scorable & self._is_number[answer_index])
+        textual = np.flatnonzero(scorable & ~self._is_number[answer_index])
+        if numeric.size:
+            owners, values = self.scan_numbers([texts[i] for i in numeric])
+            targets = self._targets[answer_index[numeric]]
+            hits = np.abs(values - targets[owners]) <= self._tolerances[answer_index[numeric]][owners]
+            firsts = dict(zip(owners[::-1].tolist(), values[::-1].tolist()))
+            hit_owners = set(owners[hits].tolist())
+            for local, i in enumerate(numeric.tolist()):
+                value = targets[local] if local in hit_owners else firsts.get(local)
+                extracted[i] = "" if value is None else f"{value:g}"
+        if textual.size:
+            owners, found = self.scan_entities([texts[i] for i in textual])
+            answers = answer_index[textual]
+            keep = self._relevant[answers[owners], found]
+            mentions = {}
+            for owner, entity in zip(owners[keep].tolist(), found[keep].tolist()):
+                mentions.setdefault(owner, []).append(self.entities[entity])
+            for local, i in enumerate(textual.tolist()):
+                extracted[i] = " | ".join(mentions.get(local, [])[:int(self._item_counts[answers[local]])])
+        return extracted
+
+    def _score_fuzzy(self, text: str, answer: int, exact: np.ndarray) -> Tuple[float, float, float]:
+        """Rescore one response with players resolved by the name index"""
+        players = []
+        for _, _, match in self.name_index.find_mentions(text, self.fuzzy_confidence):
+            entity = self._entity_index[match.name]
+            if entity not in players:
+                players.append(entity)
+        others = [e for e in exact.tolist() if not self._is_player[e]]
+        mentioned = [e for e in players + others if self._relevant[answer, e]]
+        correct = int(self._expected[answer, mentioned].sum()) if mentioned else 0
+        recall = correct / self._item_counts[answer]
+        precision = correct / len(mentioned) if mentioned else np.nan
+        if self._is_ranked[answer]:
+            return _ordered_fraction(self._expected_order[answer], mentioned), precision, recall
+        return 2 * correct / (len(mentioned) + self._item_counts[answer]), precision, recall
+
+
+def question_report(answer_ids: Sequence[Optional[str]], scores: Dict[str, np.ndarray]) -> Dict:
+    """
+    Mean accuracy, precision and recall per question
+
+    Args:
+        answer_ids (Sequence[str]): Answer key id per response
+        scores (Dict[str, np.ndarray]): Output of AnswerMatcher.score()
+
+    Returns:
+        Dict: Per answer id, scored response count and mean accuracy/precision/recall
+    """
+    frame = pd.DataFrame({"answer_id": pd.Series(answer_ids, dtype=object), **scores})
+    frame = frame[frame["accuracy"].notna()]
+    if frame.empty:
+        return {}
+    grouped = frame.groupby("answer_id", sort=True).agg(
+        responses=("accuracy", "size"), accuracy=("accuracy", "mean"),
+        precision=("precision", "mean"), recall=("recall", "mean"))
+    return {
+        answer_id: {
+            "responses": int(row.responses),
+            "accuracy": float(row.accuracy),
+            "precision": None if pd.isna(row.precision) else float(row.precision),
+            "recall": float(row.recall)
+        }
+        for answer_id, row in grouped.iterrows()
+    }
+
+
+def matcher_for(answer_key: Dict) -> AnswerMatcher:
+    """
+    Compiled matcher for an answer key, built once per dataset fingerprint
+
+    Args:
+        answer_key (Dict): Output of answer_key.build_answer_key()
+
+    Returns:
+        AnswerMatcher: Shared matcher
+    """
+    fingerprint = answer_key.get("fingerprint")
+    with _MATCHERS_LOCK:
+        if fingerprint not in _MATCHERS:
+            _MATCHERS[fingerprint] = AnswerMatcher(answer_key)
+        return _MATCHERS[fingerprint]
@@ -5,32 +5,48 @@ For Task 05: Descriptive Statistics and Large Language Models
 This script provides specialized analysis for the Syracuse Women's Basketball 2023-24 dataset.
 """
 
+import argparse
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Tuple
 import json
+import time
 from datetime import datetime
 
+from data_schema import SCHEMA_VERSION, describe_memory, memory_report, read_csv_with_schema, to_float64
+from dataset_cache import DatasetCache, describe_load
+from season_aggregate import SeasonAggregate, efficiency_columns
+
 class BasketballAnalyzer:
     """
     A specialized class for analyzing Syracuse Women's Basketball data
     and providing baseline statistics for validating LLM responses.
     """
     
-    def __init__(self, data_path: str = "data/syracuse_womens_basketball_2023_24.csv"):
+    def __init__(self, data_path: str = "data/syracuse_womens_basketball_2023_24.csv",
+                 use_cache: bool = True, chunk_size: int = None, use_schema: bool = True):
         """
         Initialize the basketball analyzer.
         
         Args:
             data_path (str): Path to the basketball dataset
+            use_cache (bool): Load the parsed dataset from its cache file when it is still valid
+            chunk_size (int): Stream the file in chunks of this many rows instead of loading it whole
+            use_schema (bool): Parse into the declared compact dtypes and reject rows that violate them
         """
         self.data = None
         self.data_path = data_path
         self.analysis_results = {}
-        
-        if data_path:
+        self.dataset_cache = DatasetCache(enabled=use_cache)
+        self.use_schema = use_schema
+        self.load_report = {}
+        self.aggregate = None
+        
+        if data_path and chunk_size:
+            self.load_data_chunked(data_path, chunk_size)
+        elif data_path:
             self.load_data(data_path)
     
     def load_data(self, data_path: str) -> bool:
@@ -44,16 +60,67 @@ class BasketballAnalyzer:
             bool: True if successful, False otherwise
         """
         try:
-            self.data = pd.read_csv(data_path)
-            print(f"Basketball data loaded successfully. Shape: {self.data.shape}")
+            if self.use_schema:
+                self.data, self.load_report = self.dataset_cache.load(data_path, read_csv_with_schema, SCHEMA_VERSION)
+                self.load_report["memory"] = memory_report(self.data)
+            else:
+                self.data, self.load_report = self.dataset_cache.load(data_path, pd.read_csv)
+            self.aggregate = None
+            print(f"Basketball data loaded successfully ({describe_load(self.load_report)}). Shape: {self.data.shape}")
             print(f"Players: {len(self.data)}")
             print(f"Columns: {list(self.data.columns)}")
+            if "memory" in self.load_report:
+                print(f"Memory: {describe_memory(self.load_report['memory'])}")
             return True
             
         except Exception as e:
             print(f"Error loading basketball data: {e}")
             return False
     
+    def load_data_chunked(self, data_path: str, chunk_size: int = 100000) -> bool:
+        """
+        Stream the dataset in chunks, keeping only a mergeable aggregate.
+        
+        Peak memory follows chunk_size rather than the file size. The analysis
+        methods work from the aggregate; visualizations need load_data().
+        
+        Args:
+            data_path (str): Path to the CSV file
+            chunk_size (int): Rows parsed at a time
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            start = time.perf_counter()
+            if self.use_schema:
+                self.aggregate, chunks = SeasonAggregate.from_chunks(
+                    read_csv_with_schema(data_path, chunksize=chunk_size))
+            else:
+                with pd.read_csv(data_path, chunksize=chunk_size) as reader:
+                    self.aggregate, chunks = SeasonAggregate.from_chunks(reader)
+            self.data = None
+            self.load_report = {"source": "streamed", "chunks": chunks, "chunk_size": chunk_size,
+                                "rows": self.aggregate.rows, "seconds": time.perf_counter() - start}
+            print(f"Basketball data streamed in {chunks} chunks of up to {chunk_size:,} rows "
+                  f"({self.load_report['seconds']:.3f}s). Rows: {self.aggregate.rows:,}")
+            return True
+            
+        except Exception as e:
+            print(f"Error streaming basketball data: {e}")
+            return False
+    
+    def _aggregate(self):
+        """
+        Aggregate the analysis methods read from (the loaded frame counts as one chunk).
+        
+        Returns:
+            SeasonAggregate: Aggregate of the data, or None if nothing is loaded
+        """
+        if self.data is not None:
+            return SeasonAggregate.from_frame(self.data)
+        return self.aggregate
+    
     def basic_team_stats(self) -> Dict:
         """
         Calculate basic team statistics.
@@ -61,18 +128,20 @@ class BasketballAnalyzer:
         Returns:
             Dict: Basic team statistics
         """
-        if self.data is None:
+        aggregate = self._aggregate()
+        if aggregate is None:
             print("No data loaded. Please load data first.")
             return {}
+        totals = aggregate.sums
         
         # Team totals
-        total_games = self.data['Games_Played'].max()  # Should be 32 for all players
-        total_points = self.data['Total_Points'].sum()
-        total_rebounds = self.data['Total_Rebounds'].sum()
-        total_assists = self.data['Assists'].sum()
-        total_steals = self.data['Steals'].sum()
-        total_blocks = self.data['Blocks'].sum()
-        total_turnovers = self.data['Turnovers'].sum()
+        total_games = aggregate.games_played_max  # Should be 32 for all players
+        total_points = totals['Total_Points']
+        total_rebounds = totals['Total_Rebounds']
+        total_assists = totals['Assists']
+        total_steals = totals['Steals']
+        total_blocks = totals['Blocks']
+        total_turnovers = totals['Turnovers']
         
         # Team averages
         avg_points_per_game = total_points / total_games
@@ -80,21 +149,21 @@ class BasketballAnalyzer:
         avg_assists_per_game = total_assists / total_games
         
         # Shooting percentages (weighted by attempts)
-        total_fg_attempted = self.data['Field_Goals_Attempted'].sum()
-        total_fg_made = self.data['Field_Goals_Made'].sum()
+        total_fg_attempted = totals['Field_Goals_Attempted']
+        total_fg_made = totals['Field_Goals_Made']
         team_fg_percentage = total_fg_made / total_fg_attempted if total_fg_attempted > 0 else 0
         
-        total_3pt_attempted = self.data['Three_Pointers_Attempted'].sum()
-        total_3pt_made = self.data['Three_Pointers_Made'].sum()
+        total_3pt_attempted = totals['Three_Pointers_Attempted']
+        total_3pt_made = totals['Three_Pointers_Made']
         team_3pt_percentage = total_3pt_made / total_3pt_attempted if total_3pt_attempted > 0 else 0
         
-        total_ft_attempted = self.data['Free_Throws_Attempted'].sum()
-        total_ft_made = self.data['Free_Throws_Made'].sum()
+        total_ft_attempted = totals['Free_Throws_Attempted']
+        total_ft_made = totals['Free_Throws_Made']
         team_ft_percentage = total_ft_made / total_ft_attempted if total_ft_attempted > 0 else 0
         
         stats = {
             'team_overview': {
-                'total_players': len(self.data),
+                'total_players': aggregate.rows,
                 'total_games': int(total_games),
                 'season_record': '24-8 (13-5 ACC)',  # From context provided
                 'ncaa_tournament': 'Reached second round',
@@ -133,32 +202,21 @@ class BasketballAnalyzer:
         Returns:
             Dict: Player rankings
         """
-        if self.data is None:
+        aggregate = self._aggregate()
+        if aggregate is None:
             print("No data loaded. Please load data first.")
             return {}
         
-        # Top scorers
-        top_scorers = self.data.nlargest(5, 'Points_Per_Game')[['Player', 'Points_Per_Game', 'Total_Points']].to_dict('records')
-        
-        # Top rebounders
-        top_rebounders = self.data.nlargest(5, 'Rebounds_Per_Game')[['Player', 'Rebounds_Per_Game', 'Total_Rebounds']].to_dict('records')
-        
-        # Top assist leaders
-        top_assists = self.data.nlargest(5, 'Assists')[['Player', 'Assists']].to_dict('records')
-        
-        # Top steal leaders
-        top_steals = self.data.nlargest(5, 'Steals')[['Player', 'Steals']].to_dict('records')
-        
-        # Top block leaders
-        top_blocks = self.data.nlargest(5, 'Blocks')[['Player', 'Blocks']].to_dict('records')
-        
-        # Most efficient shooters (minimum 50 attempts)
-        min_attempts = 50
-        efficient_shooters = self.data[self.data['Field_Goals_Attempted'] >= min_attempts].nlargest(5, 'Field_Goal_Percentage')[['Player', 'Field_Goal_Percentage', 'Field_Goals_Made', 'Field_Goals_Attempted']].to_dict('records')
-        
-        # Best 3-point shooters (minimum 20 attempts)
-        min_3pt_attempts = 20
-        best_3pt_shooters = self.data[self.data['Three_Pointers_Attempted'] >= min_3pt_attempts].nlargest(5, 'Three_Point_Percentage')[['Player', 'Three_Point_Percentage', 'Three_Pointers_Made', 'Three_Pointers_Attempted']].to_dict('records')
+        # Top scorers, rebounders, assist/steal/block leaders, and the most
+        # efficient (50+ attempts) and best 3-point (20+ attempts) shooters
+        ranked = lambda name: aggregate.ranking(name).to_dict('records')
+        top_scorers = ranked('top_scorers')
+        top_rebounders = ranked('top_rebounders')
+        top_assists = ranked('top_assists')
+        top_steals = ranked('top_steals')
+        top_blocks = ranked('top_blocks')
+        efficient_shooters = ranked('most_efficient_shooters')
+        best_3pt_shooters = ranked('best_3pt_shooters')
         
         rankings = {
             'top_scorers': top_scorers,
@@ -180,38 +238,26 @@ class BasketballAnalyzer:
         Returns:
             Dict: Position-based analysis
         """
-        if self.data is None:
+        aggregate = self._aggregate()
+        if aggregate is None:
             print("No data loaded. Please load data first.")
             return {}
         
-        # Group by position
-        position_stats = self.data.groupby('Position').agg({
-            'Points_Per_Game': ['mean', 'sum'],
-            'Rebounds_Per_Game': ['mean', 'sum'],
-            'Assists': ['mean', 'sum'],
-            'Steals': ['mean', 'sum'],
-            'Blocks': ['mean', 'sum'],
-            'Field_Goal_Percentage': 'mean',
-            'Three_Point_Percentage': 'mean',
-            'Free_Throw_Percentage': 'mean'
-        }).round(2)
-        
-        # Convert multi-level column names to strings for JSON serialization
-        position_stats.columns = [f"{col[0]}_{col[1]}" if isinstance(col, tuple) else col for col in position_stats.columns]
+        # Mean and sum of each stat by position
+        position_stats = aggregate.position_table().round(2)
         
         # Player count by position
-        position_counts = self.data['Position'].value_counts().to_dict()
+        position_counts = aggregate.position_count_series().to_dict()
         
         # Best player by position
-        best_by_position = {}
-        for position in self.data['Position'].unique():
-            pos_data = self.data[self.data['Position'] == position]
-            best_player = pos_data.loc[pos_data['Points_Per_Game'].idxmax()]
-            best_by_position[position] = {
+        best_by_position = {
+            position: {
                 'player': best_player['Player'],
                 'points_per_game': best_player['Points_Per_Game'],
                 'total_points': best_player['Total_Points']
             }
+            for position, best_player in aggregate.best_players().items()
+        }
         
         analysis = {
             'position_counts': position_counts,
@@ -229,39 +275,28 @@ class BasketballAnalyzer:
         Returns:
             Dict: Efficiency analysis
         """
-        if self.data is None:
+        aggregate = self._aggregate()
+        if aggregate is None:
             print("No data loaded. Please load data first.")
             return {}
         
-        # Calculate efficiency metrics
-        self.data['efficiency_rating'] = (
-            self.data['Points_Per_Game'] + 
-            self.data['Rebounds_Per_Game'] * 1.2 + 
-            self.data['Assists'] / self.data['Games_Played'] * 2 + 
-            self.data['Steals'] / self.data['Games_Played'] * 2 + 
-            self.data['Blocks'] / self.data['Games_Played'] * 2 - 
-            self.data['Turnovers'] / self.data['Games_Played']
-        )
-        
-        # Minutes per game
-        self.data['minutes_per_game'] = self.data['Minutes_Played'] / self.data['Games_Played']
-        
-        # Efficiency per minute
-        self.data['efficiency_per_minute'] = self.data['efficiency_rating'] / self.data['minutes_per_game']
+        # Efficiency rating, minutes per game and efficiency per minute
+        if self.data is not None:
+            for column, values in efficiency_columns(to_float64(self.data)).items():
+                self.data[column] = values
         
         # Most efficient players (minimum 10 minutes per game)
-        min_minutes = 10
-        most_efficient = self.data[self.data['minutes_per_game'] >= min_minutes].nlargest(5, 'efficiency_per_minute')[['Player', 'efficiency_per_minute', 'efficiency_rating', 'minutes_per_game']].to_dict('records')
+        most_efficient = aggregate.ranking('most_efficient_players').to_dict('records')
         
         # Players with most room for improvement (high minutes, lower efficiency)
-        improvement_candidates = self.data[self.data['minutes_per_game'] >= 15].nsmallest(3, 'efficiency_per_minute')[['Player', 'efficiency_per_minute', 'minutes_per_game', 'Points_Per_Game']].to_dict('records')
+        improvement_candidates = aggregate.ranking('improvement_candidates').to_dict('records')
         
         efficiency = {
             'most_efficient_players': most_efficient,
             'improvement_candidates': improvement_candidates,
             'efficiency_metrics': {
-                'avg_efficiency': round(self.data['efficiency_rating'].mean(), 2),
-                'avg_efficiency_per_minute': round(self.data['efficiency_per_minute'].mean(), 3)
+                'avg_efficiency': round(aggregate.mean('efficiency_rating'), 2),
+                'avg_efficiency_per_minute': round(aggregate.mean('efficiency_per_minute'), 3)
             }
         }
         
@@ -279,7 +314,10 @@ class BasketballAnalyzer:
             List[str]: List of generated plot filenames
         """
         if self.data is None:
-            print("No data loaded. Please load data first.")
+            if self.aggregate is not None:
+                print("Visualizations need the full dataset; load it with load_data() instead of streaming.")
+            else:
+                print("No data loaded. Please load data first.")
             return []
         
         plots = []
@@ -379,14 +417,15 @@ class BasketballAnalyzer:
         Returns:
             Dict: Data formatted for LLM validation
         """
+        aggregate = self._aggregate()
         return {
             'dataset_summary': {
                 'team': 'Syracuse Women\'s Basketball 2023-24',
-                'total_players': len(self.data) if self.data is not None else 0,
+                'total_players': aggregate.rows if aggregate is not None else 0,
                 'total_games': 32,
                 'season_record': '24-8 (13-5 ACC)',
-                'columns': list(self.data.columns) if self.data is not None else [],
-                'sample_data': self.data.head().to_dict() if self.data is not None else {}
+                'columns': aggregate.columns if aggregate is not None else [],
+                'sample_data': aggregate.sample.to_dict() if aggregate is not None else {}
             },
             'analysis_results': self.analysis_results
         }
@@ -414,11 +453,19 @@ def main():
     """
     Main function to demonstrate usage of the BasketballAnalyzer.
     """
+    parser = argparse.ArgumentParser(description="Analyze the basketball dataset")
+    parser.add_argument("--data", default="data/syracuse_womens_basketball_2023_24.csv", help="Dataset CSV")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Stream the file in chunks of this many rows (for inputs too large to load whole)")
+    parser.add_argument("--no-schema", action="store_true",
+                        help="Let pandas infer dtypes instead of applying the declared schema")
+    args = parser.parse_args()
+    
     print("Syracuse Women's Basketball Analyzer - Task 05")
     print("=" * 50)
     
     # Initialize analyzer
-    analyzer = BasketballAnalyzer()
+    analyzer = BasketballAnalyzer(args.data, chunk_size=args.chunk_size, use_schema=not args.no_schema)
     
     # Perform comprehensive analysis
     print("\n1. Basic Team Statistics...")
@@ -0,0 +1,199 @@
+"""
+Multi-Question Batching
+For Task 05: Descriptive Statistics and Large Language Models
+
+Packs several questions that share the same dataset context into a single
+request, asks for numbered answers, and splits the reply back into one
+result per question. The context is sent once per batch instead of once per
+question, which cuts prompt tokens and round trips.
+"""
+
+import re
+import uuid
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+
+from dispatcher import PromptJob
+
+_ANSWER_HEADING = re.compile(r"^\s*#{1,4}\s*Answer\s+(\d+)\s*:?\s*$", re.IGNORECASE | re.MULTILINE)
+_NUMBERED_LINE = re.compile(r"^\s*(?:\*\*)?(?:Answer|Question|Q)?\s*(\d+)\s*[.):](?:\*\*)?\s*", re.IGNORECASE | re.MULTILINE)
+
+
+@dataclass
+class PromptBatch:
+    """One request carrying several questions for the same model and context"""
+    job: PromptJob
+    members: List[PromptJob]
+    batch_id: str
+
+
+def build_batch_prompt(context: str, questions: List[str], instruction: str) -> str:
+    """
+    Build one prompt asking several numbered questions about the same data
+
+    Args:
+        context (str): Dataset context shared by every question
+        questions (List[str]): Questions to ask
+        instruction (str): Answer-style instruction shared by every question
+
+    Returns:
+        str: Combined prompt
+    """
+    numbered = "\n".join(f"Question {i}: {q}" for i, q in enumerate(questions, 1))
+    headings = "\n".join(f"### Answer {i}\n<answer to question {i}>" for i in range(1, len(questions) + 1))
+    return (
+        f"{context}\n\n"
+        f"Answer each of the following {len(questions)} questions separately. {instruction}\n\n"
+        f"{numbered}\n\n"
+        f"Format your reply exactly like this, with one heading per question:\n{headings}"
+    )
+
+
+def split_batch_response(text: str, count: int) -> List[Optional[str]]:
+    """
+    Split a batched reply into per-question answers
+
+    "### Answer N" headings are used when present; otherwise numbered lines
+    such as "1." or "Q1:" are used as a fallback.
+
+    Args:
+        text (str): Model reply
+        count (int): Number of questions in the batch
+
+    Returns:
+        List[Optional[str]]: Answer per question, None where it could not be found
+    """
+    for pattern in (_ANSWER_HEADING, _NUMBERED_LINE):
+        matches = [m for m in pattern.finditer(text) if 1 <= int(m.group(1)) <= count]
+        if matches:
+            break
+    else:
+        return [text.strip() or None] if count == 1 else [None] * count
+
+    answers = [None] * count
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(text)
+        answer = text[match.end():end].strip()
+        index = int(match.group(1)) - 1
+        if answer and answers[index] is None:
+            answers[index] = answer
+    return answers
+
+
+def plan_batches(jobs: List[PromptJob], batch_size: int,
+                 max_batch_tokens: int = 4096) -> List[PromptBatch]:
+    """
+    Group jobs that share model, context and instruction into batches
+
+    Jobs without a separate context, or asking for several completions,
+    cannot be batched and become single-member batches that send their
+    original prompt.
+
+    Args:
+        jobs (List[PromptJob]): Jobs to group
+        batch_size (int): Maximum questions per request
+        max_batch_tokens (int): Cap on max_tokens for a batched request
+
+    Returns:
+        List[PromptBatch]: Batches in order of their first member
+    """
+    groups = {}
+    order = []
+    for job in jobs:
+        # Repeated samples of a question are never packed together
+        key = (job.model, job.context, job.instruction, job.sample) if job.context is not None and job.n == 1 else id(job)
+        if key not in groups:
+            groups[key] = []
+            order.append(key)
+        groups[key].append(job)
+
+    batches = []
+    for key in order:
+        group = groups[key]
+        for start in range(0, len(group), batch_size):
+            members = group[start:start + batch_size]
+            if len(members) == 1:
+                batches.append(PromptBatch(job=members[0], members=members, batch_id=None))
+                continue
+
+            first = members[0]
+            batch_job = replace(
+                first,
+                question=" | ".join(m.question for m in members),
+                prompt=build_batch_prompt(first.context, [m.question for m in members], first.instruction),
+                max_tokens=min(sum(m.max_tokens for m in members), max_batch_tokens),
+                category="batch"
+            )
+            batches.append(PromptBatch(job=batch_job, members=members, batch_id=uuid.uuid4().hex[:12]))
+    return batches
+
+
+def expand_batch_result(batch: PromptBatch, result: Dict) -> List[Tuple[PromptJob, Dict]]:
+    """
+    Turn one batched API result into a result per member question
+
+    Prompt tokens are split evenly across the answered questions; completion
+    tokens are split in proportion to each answer's length. A question whose
+    answer cannot be found becomes a failure, and the answered questions carry
+    its share of the bill. If no answer can be found at all, each failure
+    carries an even share of the usage instead, so the run still counts it.
+
+    Args:
+        batch (PromptBatch): The batch that was sent
+        result (Dict): API result for the batch request
+
+    Returns:
+        List[Tuple[PromptJob, Dict]]: (member job, result) pairs in batch order
+    """
+    if batch.batch_id is None:
+        return [(batch.members[0], result)]
+
+    size = len(batch.members)
+    if not result.get("success"):
+        return [(member, result) for member in batch.members]
+
+    answers = split_batch_response(result["response"], size)
+    usage = result.get("usage", {})
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    completion_tokens = usage.get("completion_tokens", 0)
+    if not (prompt_tokens or completion_tokens):
+        # Provider only reported a total; treat it all as prompt-side
+        prompt_tokens = usage.get("total_tokens", 0)
+    answer_chars = sum(len(a) for a in answers if a) or 1
+    answered = sum(1 for a in answers if a is not None)
+
+    expanded = []
+    for member, answer in zip(batch.members, answers):
+        if answer is None:
+            failure = {
+                "success": False,
+                "error": f"No answer found for this question in batch {batch.batch_id}",
+                "model": member.model,
+                "batch_id": batch.batch_id,
+                "batch_size": size
+            }
+            if not answered:
+                # Billed, but nothing to attach the usage to
+                failure["usage"] = {
+                    "prompt_tokens": round(prompt_tokens / size),
+                    "completion_tokens": round(completion_tokens / size),
+                    "total_tokens": round((prompt_tokens + completion_tokens) / size)
+                }
+            expanded.append((member, failure))
+            continue
+
+        member_prompt = prompt_tokens / answered
+        member_completion = completion_tokens * len(answer) / answer_chars
+        member_result = dict(result)
+        member_result.update({
+            "response": answer,
+            "usage": {
+                "prompt_tokens": round(member_prompt),
+                "completion_tokens": round(member_completion),
+                "total_tokens": round(member_prompt + member_completion)
+            },
+            "batch_id": batch.batch_id,
+            "batch_size": size
+        })
+        expanded.append((member, member_result))
+    return expanded
@@ -0,0 +1,201 @@
+"""
+Offline Throughput Benchmark for LLMTester
+For Task 05: Descriptive Statistics and Large Language Models
+
+Drives LLMTester.run_comprehensive_test against the local mock OpenRouter
+server at increasing request counts and reports throughput and
+p50/p95/p99 latency. Because the mock's latency is known, anything beyond
+it is the tester's own overhead (scheduling, encoding, evaluation, export).
+
+Usage:
+    python3 scripts/benchmark_tester.py --requests 10 100 1000 10000
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from dispatcher import PromptJob
+from llm_tester_updated import LLMTester
+from mock_openrouter import LATENCY_DISTRIBUTIONS, MockConfig, MockOpenRouterServer
+from rate_limiter import RateLimit
+
+UNLIMITED = RateLimit(requests_per_second=1e9, tokens_per_minute=1e12)
+
+
+class BenchmarkTester(LLMTester):
+    """
+    LLMTester whose question matrix is tiled out to a fixed number of requests
+    """
+
+    def __init__(self, api_key: str, target_requests: int, **kwargs):
+        """
+        Initialize the benchmark tester
+
+        Args:
+            api_key (str): Any string; the mock server ignores it
+            target_requests (int): Number of requests the matrix should contain
+            **kwargs: Passed through to LLMTester
+        """
+        super().__init__(api_key, **kwargs)
+        self.target_requests = target_requests
+
+    def question_jobs(self, data_str: str, tiers: Optional[List[str]] = None) -> List[PromptJob]:
+        base = super().question_jobs(data_str, tiers)
+        # Fresh copies: outcomes are matched to jobs by identity, so a repeated object would share one result
+        return [dataclasses.replace(base[i % len(base)]) for i in range(self.target_requests)]
+
+
+def write_synthetic_roster(path: str, players: int = 11, seed: int = 0) -> str:
+    """
+    Write a roster CSV with the same columns as the real dataset
+
+    Args:
+        path (str): Output CSV path
+        players (int): Number of players
+        seed (int): Random seed
+
+    Returns:
+        str: The path written
+    """
+    rng = np.random.default_rng(seed)
+    games = rng.integers(20, 33, players)
+    fga = rng.integers(20, 700, players)
+    fgm = (fga * rng.uniform(0.35, 0.55, players)).astype(int)
+    tpa = rng.integers(0, 200, players)
+    tpm = (tpa * rng.uniform(0.2, 0.4, players)).astype(int)
+    fta = rng.integers(5, 150, players)
+    ftm = (fta * rng.uniform(0.6, 0.9, players)).astype(int)
+    points = 2 * (fgm - tpm) + 3 * tpm + ftm
+    rebounds = rng.integers(20, 250, players)
+
+    df = pd.DataFrame({
+        "Player": [f"Player {i + 1}" for i in range(players)],
+        "Position": rng.choice(["G", "F", "C"], players),
+        "Games_Played": games,
+        "Games_Started": (games * rng.uniform(0, 1, players)).astype(int),
+        "Minutes_Played": games * rng.integers(5, 36, players),
+        "Points_Per_Game": np.round(points / games, 1),
+        "Total_Points": points,
+        "Field_Goals_Made": fgm,
+        "Field_Goals_Attempted": fga,
+        "Field_Goal_Percentage": np.round(fgm / fga, 3),
+        "Three_Pointers_Made": tpm,
+        "Three_Pointers_Attempted": tpa,
+        "Three_Point_Percentage": np.round(np.divide(tpm, tpa, out=np.zeros(players), where=tpa > 0), 3),
+        "Free_Throws_Made": ftm,
+        "Free_Throws_Attempted": fta,
+        "Free_Throw_Percentage": np.round(ftm / fta, 3),
+        "Rebounds_Per_Game": np.round(rebounds / games, 1),
+        "Total_Rebounds": rebounds,
+        "Assists": rng.integers(0, 120, players),
+        "Steals": rng.integers(0, 80, players),
+        "Blocks": rng.integers(0, 50, players),
+        "Turnovers": rng.integers(5, 100, players),
+    })
+    df.to_csv(path, index=False)
+    return path
+
+
+def run_benchmark(server: MockOpenRouterServer, requests_count: int, data_path: str,
+                  output_dir: str, concurrency: int, stream: bool = False) -> Dict:
+    """
+    Run one comprehensive test of the given size against the mock server
+
+    Args:
+        server (MockOpenRouterServer): Running mock server
+        requests_count (int): Requests in the matrix
+        data_path (str): Dataset CSV
+        output_dir (str): Directory for the tester's JSON export
+        concurrency (int): Per-model concurrency limit
+        stream (bool): Use streaming responses
+
+    Returns:
+        Dict: Wall time, throughput and latency percentiles
+    """
+    tester = BenchmarkTester(
+        "mock-key", requests_count, base_url=server.base_url,
+        max_concurrency_per_model=concurrency, pool_size=concurrency,
+        rate_limits={}, default_rate_limit=UNLIMITED,
+        use_cache=False, stream=stream, verbose=False, backoff_base=0.05,
+        journal_path=os.path.join(output_dir, f"journal_{requests_count}.jsonl")
+    )
+
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            tester.run_comprehensive_test(data_path, os.path.join(output_dir, f"results_{requests_count}.json"))
+    finally:
+        tester.close()
+    wall_time = time.perf_counter() - start
+
+    latencies = tester.responses.column("response_time")
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies.size else (0.0, 0.0, 0.0)
+    return {
+        "requests": requests_count,
+        "successful": int(latencies.size),
+        "wall_time": wall_time,
+        "throughput": latencies.size / wall_time if wall_time > 0 else 0.0,
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99)
+    }
+
+
+def main():
+    """
+    Main function to run the benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark LLMTester against a local mock OpenRouter server")
+    parser.add_argument("--requests", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--data", default="data/syracuse_womens_basketball_2023_24.csv",
+                        help="Dataset CSV (a synthetic roster is used if it does not exist)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Per-model concurrency limit")
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-mean", type=float, default=0.05)
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--stream", action="store_true", help="Benchmark streaming responses")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="results/benchmark_results.json")
+    args = parser.parse_args()
+
+    print("⏱️ LLMTester Offline Benchmark")
+    print("=" * 60)
+
+    config = MockConfig(latency=args.latency, latency_mean=args.latency_mean,
+                        latency_spread=args.latency_spread, error_rate=args.error_rate,
+                        seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as scratch, MockOpenRouterServer(config) as server:
+        data_path = args.data
+        if not os.path.exists(data_path):
+            data_path = write_synthetic_roster(os.path.join(scratch, "roster.csv"), seed=args.seed)
+            print(f"Dataset not found, using a synthetic roster")
+        print(f"Mock server: {server.base_url} ({args.latency}, mean {args.latency_mean}s)\n")
+
+        print(f"{'Requests':>9} {'OK':>7} {'Wall (s)':>9} {'Req/s':>9} {'p50 (s)':>8} {'p95 (s)':>8} {'p99 (s)':>8}")
+        results = []
+        for count in args.requests:
+            result = run_benchmark(server, count, data_path, scratch, args.concurrency, args.stream)
+            results.append(result)
+            print(f"{result['requests']:>9} {result['successful']:>7} {result['wall_time']:>9.2f} "
+                  f"{result['throughput']:>9.1f} {result['p50']:>8.3f} {result['p95']:>8.3f} {result['p99']:>8.3f}")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"config": vars(args), "results": results}, f, indent=2)
+    print(f"\nBenchmark results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
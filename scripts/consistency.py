@@ -0,0 +1,109 @@
+"""
+Repeated-Sampling Consistency Mode
+For Task 05: Descriptive Statistics and Large Language Models
+
+Asks every (model, question) cell K times so a stable answer can be told
+apart from a lucky one. Models that honour the chat completions `n`
+parameter get their K samples in as few requests as possible; the rest get
+K independent requests, which the concurrent dispatcher runs in parallel
+like any other part of the matrix.
+
+Each sample is reduced to its canonical answer (AnswerMatcher.extract) and
+the cell reports:
+    agreement:       share of samples giving the most common answer
+    entropy:         Shannon entropy of the answers, in bits (0 = all agree)
+    latency_var:     variance of response time across samples
+plus the modal answer and mean accuracy.
+"""
+
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from dispatcher import PromptJob
+
+# Models routed to providers that return several choices for one request
+N_PARAMETER_MODELS = frozenset({
+    "openai/gpt-3.5-turbo",
+    "openai/gpt-4",
+})
+
+
+def expand_samples(jobs: List[PromptJob], samples: int,
+                   n_models: Iterable[str] = N_PARAMETER_MODELS,
+                   max_n: int = 16) -> List[PromptJob]:
+    """
+    Repeat every job so each cell gets `samples` completions
+
+    Args:
+        jobs (List[PromptJob]): One job per cell
+        samples (int): Completions wanted per cell (K)
+        n_models (Iterable[str]): Models that accept the `n` parameter
+        max_n (int): Most completions requested in one call
+
+    Returns:
+        List[PromptJob]: Jobs with sample set to the first sample index each covers
+            and n to the number of completions it asks for
+    """
+    if samples <= 1:
+        return list(jobs)
+    n_models = set(n_models)
+    expanded = []
+    for job in jobs:
+        step = max(1, max_n) if job.model in n_models else 1
+        for first in range(0, samples, step):
+            expanded.append(replace(job, sample=first, n=min(step, samples - first)))
+    return expanded
+
+
+def consistency_report(models: Sequence[str], questions: Sequence[str], answers: Sequence[str],
+                       response_times: Sequence[Optional[float]],
+                       accuracy: Optional[Sequence[float]] = None) -> List[Dict]:
+    """
+    Agreement, answer entropy and latency spread per (model, question) cell
+
+    Args:
+        models (Sequence[str]): Model per sample
+        questions (Sequence[str]): Question per sample
+        answers (Sequence[str]): Canonical answer per sample
+        response_times (Sequence[float]): Latency per sample
+        accuracy (Sequence[float]): Score per sample (NaN if unscored)
+
+    Returns:
+        List[Dict]: One entry per cell with samples, distinct_answers, modal_answer,
+            agreement, entropy, latency_mean, latency_var and accuracy
+    """
+    frame = pd.DataFrame({
+        "model": pd.Series(models, dtype=object),
+        "question": pd.Series(questions, dtype=object),
+        "answer": pd.Series(answers, dtype=object),
+        "response_time": pd.Series(response_times, dtype=float),
+        "accuracy": pd.Series(accuracy if accuracy is not None else np.full(len(models), np.nan), dtype=float)
+    })
+    if frame.empty:
+        return []
+
+    cells = ["model", "question"]
+    counts = frame.groupby(cells + ["answer"], sort=False).size().rename("count").reset_index()
+    totals = counts.groupby(cells, sort=False)["count"].transform("sum")
+    counts["share"] = counts["count"] / totals
+    counts["surprise"] = -counts["share"] * np.log2(counts["share"])
+    modal = counts.loc[counts.groupby(cells, sort=False)["count"].idxmax(), cells + ["answer", "share"]]
+    answer_stats = counts.groupby(cells, sort=False).agg(
+        distinct_answers=("answer", "size"), entropy=("surprise", "sum"))
+
+    stats = frame.groupby(cells, sort=False).agg(
+        samples=("answer", "size"),
+        latency_mean=("response_time", "mean"),
+        latency_var=("response_time", "var"),
+        accuracy=("accuracy", "mean"))
+    report = (stats.join(answer_stats)
+              .join(modal.set_index(cells).rename(columns={"answer": "modal_answer", "share": "agreement"}))
+              .reset_index())
+    report["entropy"] = report["entropy"].abs()
+    report["latency_var"] = report["latency_var"].fillna(0.0)
+    report = report.astype(object).where(report.notna(), None)
+    return report[["model", "question", "samples", "distinct_answers", "modal_answer", "agreement",
+                   "entropy", "latency_mean", "latency_var", "accuracy"]].to_dict("records")
@@ -0,0 +1,241 @@
+"""
+Compact Dataset Encoder
+For Task 05: Descriptive Statistics and Large Language Models
+
+Turns the basketball DataFrame into prompt text without per-row Python loops.
+Several formats are available (CSV, markdown table, compact key-value and the
+original verbose layout), and the encoder can shrink the table to fit a
+token budget by rounding floats and dropping the least useful columns.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+DATASET_HEADER = (
+    "Syracuse Women's Basketball 2023-24 Season Statistics:\n\n"
+    "Team Overview: 24-8 record (13-5 ACC), #20 AP ranking, NCAA tournament second round\n\n"
+)
+
+# Short column names used by the compact formats
+COLUMN_ALIASES = {
+    "Player": "Player",
+    "Position": "Pos",
+    "Games_Played": "GP",
+    "Games_Started": "GS",
+    "Minutes_Played": "MIN",
+    "Points_Per_Game": "PPG",
+    "Total_Points": "PTS",
+    "Rebounds_Per_Game": "RPG",
+    "Total_Rebounds": "REB",
+    "Assists": "AST",
+    "Steals": "STL",
+    "Blocks": "BLK",
+    "Turnovers": "TO",
+    "Field_Goals_Made": "FGM",
+    "Field_Goals_Attempted": "FGA",
+    "Field_Goal_Percentage": "FG%",
+    "Three_Pointers_Made": "3PM",
+    "Three_Pointers_Attempted": "3PA",
+    "Three_Point_Percentage": "3P%",
+    "Free_Throws_Made": "FTM",
+    "Free_Throws_Attempted": "FTA",
+    "Free_Throw_Percentage": "FT%",
+}
+
+# Columns dropped first when shrinking to a token budget. Totals and made
+# counts go early because they can be recovered from per-game and
+# percentage columns; Player and Position are never dropped.
+DROP_ORDER = [
+    "Free_Throws_Made",
+    "Three_Pointers_Made",
+    "Field_Goals_Made",
+    "Total_Rebounds",
+    "Total_Points",
+    "Games_Started",
+    "Free_Throws_Attempted",
+    "Turnovers",
+    "Free_Throw_Percentage",
+    "Three_Pointers_Attempted",
+    "Three_Point_Percentage",
+    "Blocks",
+    "Steals",
+    "Minutes_Played",
+    "Assists",
+    "Field_Goals_Attempted",
+    "Field_Goal_Percentage",
+    "Games_Played",
+    "Rebounds_Per_Game",
+    "Points_Per_Game",
+]
+
+FORMATS = ("csv", "markdown", "kv", "verbose")
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Fast token estimate for BPE tokenizers
+
+    Counts letter runs, digit groups of up to three and individual
+    punctuation marks, which tracks GPT-style tokenizers closely on
+    number-heavy tables.
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        int: Estimated token count
+    """
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+def _format_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Render every cell as a string, dropping trailing zeros from floats"""
+    formatted = {}
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_float_dtype(series):
+            formatted[column] = series.map("{:g}".format)
+        else:
+            formatted[column] = series.astype(str)
+    return pd.DataFrame(formatted, index=df.index)
+
+
+def _join_columns(parts: List[pd.Series], sep: str) -> pd.Series:
+    """Concatenate string columns row-wise in one vectorized pass"""
+    return parts[0].str.cat(parts[1:], sep=sep) if len(parts) > 1 else parts[0]
+
+
+def _legend(columns: List[str]) -> str:
+    aliases = [f"{COLUMN_ALIASES[c]}={c}" for c in columns
+               if c in COLUMN_ALIASES and COLUMN_ALIASES[c] != c]
+    return f"Columns: {', '.join(aliases)}\n" if aliases else ""
+
+
+def encode_table(df: pd.DataFrame, fmt: str = "csv") -> str:
+    """
+    Encode the player table in one of the supported formats
+
+    Args:
+        df (pd.DataFrame): Player statistics
+        fmt (str): One of "csv", "markdown", "kv" or "verbose"
+
+    Returns:
+        str: Encoded table (without the dataset header)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown data format '{fmt}', expected one of {FORMATS}")
+
+    if fmt == "verbose":
+        return _encode_verbose(df)
+
+    columns = list(df.columns)
+    headers = [COLUMN_ALIASES.get(c, c) for c in columns]
+    cells = _format_values(df)
+    parts = [cells[c] for c in columns]
+
+    if fmt == "csv":
+        rows = _join_columns(parts, ",")
+        body = ",".join(headers) + "\n" + "\n".join(rows) + "\n"
+    elif fmt == "markdown":
+        rows = "|" + _join_columns(parts, "|") + "|"
+        body = ("|" + "|".join(headers) + "|\n" +
+                "|" + "|".join("-" * 3 for _ in headers) + "|\n" +
+                "\n".join(rows) + "\n")
+    else:
+        # Player name first, then alias=value pairs
+        keyed = [cells[c] if c == "Player" else f"{COLUMN_ALIASES.get(c, c)}=" + cells[c]
+                 for c in columns]
+        body = "\n".join(_join_columns(keyed, " ")) + "\n"
+
+    return _legend(columns) + body
+
+
+def _encode_verbose(df: pd.DataFrame) -> str:
+    """The original multi-line-per-player layout, built column-wise"""
+    cells = _format_values(df)
+    pct = {c: df[c].map("{:.3f}".format) for c in
+           ("Field_Goal_Percentage", "Three_Point_Percentage", "Free_Throw_Percentage")}
+    separator = "-" * 80
+    blocks = (
+        "Player: " + cells["Player"] + "\n" +
+        "Position: " + cells["Position"] + "\n" +
+        "Games: " + cells["Games_Played"] + " (Started: " + cells["Games_Started"] + ")\n" +
+        "Minutes: " + cells["Minutes_Played"] + "\n" +
+        "Points: " + cells["Points_Per_Game"] + " PPG (" + cells["Total_Points"] + " total)\n" +
+        "Rebounds: " + cells["Rebounds_Per_Game"] + " RPG (" + cells["Total_Rebounds"] + " total)\n" +
+        "Assists: " + cells["Assists"] + ", Steals: " + cells["Steals"] +
+        ", Blocks: " + cells["Blocks"] + ", Turnovers: " + cells["Turnovers"] + "\n" +
+        "Shooting: FG " + pct["Field_Goal_Percentage"] +
+        " (" + cells["Field_Goals_Made"] + "/" + cells["Field_Goals_Attempted"] + "), " +
+        "3P " + pct["Three_Point_Percentage"] +
+        " (" + cells["Three_Pointers_Made"] + "/" + cells["Three_Pointers_Attempted"] + "), " +
+        "FT " + pct["Free_Throw_Percentage"] +
+        " (" + cells["Free_Throws_Made"] + "/" + cells["Free_Throws_Attempted"] + ")\n" +
+        separator + "\n"
+    )
+    return separator + "\n" + "".join(blocks)
+
+
+def encode_dataset(df: pd.DataFrame, fmt: str = "csv",
+                   token_budget: Optional[int] = None) -> Tuple[str, Dict]:
+    """
+    Encode the dataset for an LLM prompt, optionally within a token budget
+
+    When the encoded text is over budget, percentages are first rounded to
+    two decimal places and other floats to one, and then columns are
+    dropped in DROP_ORDER until it fits.
+
+    Args:
+        df (pd.DataFrame): Player statistics
+        fmt (str): Output format (see FORMATS)
+        token_budget (int): Maximum estimated tokens for the whole data string
+
+    Returns:
+        Tuple[str, Dict]: Data string and a report of tokens, rounding and dropped columns
+    """
+    def render(frame):
+        text = DATASET_HEADER + "Player Statistics:\n" + encode_table(frame, fmt)
+        return text, estimate_tokens(text)
+
+    data_str, tokens = render(df)
+    report = {"format": fmt, "tokens": tokens, "original_tokens": tokens,
+              "rounded": False, "dropped_columns": [], "within_budget": True}
+
+    if token_budget is None or tokens <= token_budget or fmt == "verbose":
+        report["within_budget"] = token_budget is None or tokens <= token_budget
+        return data_str, report
+
+    float_columns = df.select_dtypes(include="float").columns
+    frame = df.assign(**{c: df[c].round(2 if c.endswith("_Percentage") else 1)
+                         for c in float_columns})
+    data_str, tokens = render(frame)
+    report["rounded"] = True
+
+    for column in DROP_ORDER:
+        if tokens <= token_budget:
+            break
+        if column in frame.columns:
+            frame = frame.drop(columns=column)
+            report["dropped_columns"].append(column)
+            data_str, tokens = render(frame)
+
+    report["tokens"] = tokens
+    report["within_budget"] = tokens <= token_budget
+    return data_str, report
+
+
+def token_report(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Estimated prompt tokens of the full dataset in every format
+
+    Args:
+        df (pd.DataFrame): Player statistics
+
+    Returns:
+        Dict[str, int]: Token estimate per format
+    """
+    return {fmt: encode_dataset(df, fmt)[1]["tokens"] for fmt in FORMATS}
@@ -17,22 +17,31 @@ from typing import Dict, List, Tuple
 import json
 from datetime import datetime
 
+from data_schema import (SCHEMA_VERSION, describe_memory, enforce_schema, memory_report, read_csv_with_schema,
+                         to_float64)
+from dataset_cache import DatasetCache, describe_load, reader_for
+
 class SportsDataAnalyzer:
     """
     A class to handle sports data analysis and provide baseline statistics
     for validating LLM responses.
     """
     
-    def __init__(self, data_path: str = None):
+    def __init__(self, data_path: str = None, use_cache: bool = True, use_schema: bool = True):
         """
         Initialize the analyzer with optional data path.
         
         Args:
             data_path (str): Path to the dataset file
+            use_cache (bool): Load the parsed dataset from its cache file when it is still valid
+            use_schema (bool): Give basketball columns their declared compact dtypes and reject invalid values
         """
         self.data = None
         self.data_path = data_path
         self.analysis_results = {}
+        self.dataset_cache = DatasetCache(enabled=use_cache)
+        self.use_schema = use_schema
+        self.load_report = {}
         
         if data_path:
             self.load_data(data_path)
@@ -48,23 +57,44 @@ class SportsDataAnalyzer:
             bool: True if successful, False otherwise
         """
         try:
-            if data_path.endswith('.csv'):
-                self.data = pd.read_csv(data_path)
-            elif data_path.endswith('.xlsx'):
-                self.data = pd.read_excel(data_path)
-            elif data_path.endswith('.json'):
-                self.data = pd.read_json(data_path)
-            else:
+            reader = reader_for(data_path)
+            if reader is None:
                 print(f"Unsupported file format: {data_path}")
                 return False
             
-            print(f"Data loaded successfully. Shape: {self.data.shape}")
+            # Parsed frames (Excel especially) are cached next to the source. Only the columns
+            # present are checked, so the cache is kept apart from BasketballAnalyzer's strict parse
+            if self.use_schema:
+                self.data, self.load_report = self.dataset_cache.load(
+                    data_path, lambda path: self._read_with_schema(path, reader), f"{SCHEMA_VERSION}:lenient")
+                self.load_report["memory"] = memory_report(self.data)
+            else:
+                self.data, self.load_report = self.dataset_cache.load(data_path, reader)
+            print(f"Data loaded successfully ({describe_load(self.load_report)}). Shape: {self.data.shape}")
+            if "memory" in self.load_report:
+                print(f"Memory: {describe_memory(self.load_report['memory'])}")
             return True
             
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
     
+    @staticmethod
+    def _read_with_schema(data_path: str, reader) -> pd.DataFrame:
+        """
+        Parse a file, applying the basketball schema to whichever of its columns are present.
+        
+        Args:
+            data_path (str): Path to the data file
+            reader: pandas reader for the file's format
+            
+        Returns:
+            pd.DataFrame: The parsed data
+        """
+        if reader is pd.read_csv:
+            return read_csv_with_schema(data_path, required=False)
+        return enforce_schema(reader(data_path), required=False)
+    
     def basic_descriptive_stats(self) -> Dict:
         """
         Calculate basic descriptive statistics for the dataset.
@@ -82,7 +112,7 @@ class SportsDataAnalyzer:
                 'columns': list(self.data.columns),
                 'data_types': self.data.dtypes.to_dict()
             },
-            'basic_stats': self.data.describe().to_dict(),
+            'basic_stats': to_float64(self.data).describe().to_dict(),
             'missing_values': self.data.isnull().sum().to_dict()
         }
         
@@ -0,0 +1,285 @@
+"""
+Basketball Dataset Schema
+For Task 05: Descriptive Statistics and Large Language Models
+
+Declares the dtype, valid range and precision of every basketball column so
+the analyzers load compact types instead of the int64/float64/str pandas
+infers:
+    - Player and Position are categoricals, unless most values are unique
+      (a roster of one row per player), where the strings are smaller
+    - games are int8; season counts (points, minutes, attempts, ...) are int16
+    - per-game averages and percentages are float32, stored at no more than
+      their declared decimals so the float64 value can be recovered exactly
+
+The numeric and Position columns come out about 4.4x smaller. On a
+generated 20,000-row roster, without pyarrow, the whole frame is 5.7x
+smaller when names repeat. It is only 2.4x smaller when every name is
+unique: nothing shrinks unique strings, and they are over half of the
+typed frame.
+
+Floats are parsed as float32 directly. Integers are parsed as int64 and
+narrowed only after their range is checked, because pandas wraps
+out-of-range values silently when parsing directly into a narrow type.
+Categories are built after parsing too (faster than dtype="category" in
+read_csv). Any violation (missing column, non-numeric value, value out of
+range, too many decimals, made > attempted, ...) raises SchemaError naming
+the column and the offending rows.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_VERSION = "basketball-v2"
+
+
+class SchemaError(ValueError):
+    """Raised when a dataset does not match its declared schema"""
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Declared type and valid values of one column"""
+    dtype: str
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    decimals: Optional[int] = None
+
+
+_GAMES = ColumnSpec("int8", 0, 127)
+_COUNT = ColumnSpec("int16", 0, 32767)
+_PER_GAME = ColumnSpec("float32", 0, None, 2)
+_PERCENTAGE = ColumnSpec("float32", 0, 1, 4)
+
+BASKETBALL_SCHEMA = {
+    "Player": ColumnSpec("category"),
+    "Position": ColumnSpec("category"),
+    "Games_Played": _GAMES,
+    "Games_Started": _GAMES,
+    "Minutes_Played": _COUNT,
+    "Points_Per_Game": _PER_GAME,
+    "Total_Points": _COUNT,
+    "Field_Goals_Made": _COUNT,
+    "Field_Goals_Attempted": _COUNT,
+    "Field_Goal_Percentage": _PERCENTAGE,
+    "Three_Pointers_Made": _COUNT,
+    "Three_Pointers_Attempted": _COUNT,
+    "Three_Point_Percentage": _PERCENTAGE,
+    "Free_Throws_Made": _COUNT,
+    "Free_Throws_Attempted": _COUNT,
+    "Free_Throw_Percentage": _PERCENTAGE,
+    "Rebounds_Per_Game": _PER_GAME,
+    "Total_Rebounds": _COUNT,
+    "Assists": _COUNT,
+    "Steals": _COUNT,
+    "Blocks": _COUNT,
+    "Turnovers": _COUNT
+}
+
+# (part, whole): part may never exceed whole
+BASKETBALL_RELATIONS = (
+    ("Games_Started", "Games_Played"),
+    ("Field_Goals_Made", "Field_Goals_Attempted"),
+    ("Three_Pointers_Made", "Three_Pointers_Attempted"),
+    ("Free_Throws_Made", "Free_Throws_Attempted")
+)
+
+_MAX_EXAMPLES = 5
+
+
+def _parse_dtypes(columns: pd.Index, schema: Dict[str, ColumnSpec]) -> Dict[str, str]:
+    # Integers are inferred as int64 and narrowed after the range check; categories are built
+    # after parsing too, which is several times faster than dtype="category"
+    return {name: spec.dtype for name, spec in schema.items()
+            if name in columns and spec.dtype.startswith("float")}
+
+
+def _rows(mask: pd.Series) -> str:
+    index = mask.index[mask.to_numpy()]
+    shown = ", ".join(str(label) for label in index[:_MAX_EXAMPLES])
+    return f"rows {shown}" + (f" and {len(index) - _MAX_EXAMPLES} more" if len(index) > _MAX_EXAMPLES else "")
+
+
+def _check_column(name: str, values: pd.Series, spec: ColumnSpec) -> Tuple[pd.Series, List[str]]:
+    problems = []
+    if spec.dtype == "category":
+        # Codes plus one copy of each string only pay off when values repeat
+        if values.nunique() > len(values) // 2:
+            return values.astype("str"), problems
+        return values.astype("category"), problems
+
+    numeric = pd.to_numeric(values, errors="coerce").astype("float64")
+    checks = {"non-numeric values": numeric.isna() & values.notna(),
+              "infinite values": np.isinf(numeric)}
+    if spec.dtype.startswith("int"):
+        checks["missing values"] = values.isna()
+        checks["fractional values"] = numeric.notna() & (numeric % 1 != 0)
+    if spec.minimum is not None:
+        checks[f"values below {spec.minimum:g}"] = numeric < spec.minimum
+    if spec.maximum is not None:
+        checks[f"values above {spec.maximum:g}"] = numeric > spec.maximum
+    if spec.decimals is not None:
+        # Allow for float32 rounding: about 2^-23 relative
+        scaled = numeric * 10 ** spec.decimals
+        checks[f"more than {spec.decimals} decimals"] = \
+            (scaled - scaled.round()).abs() > np.maximum(scaled.abs() * 2.0 ** -22, 1e-9)
+    for label, mask in checks.items():
+        if mask.any():
+            problems.append(f"{name}: {label} in {_rows(mask)}")
+    if problems:
+        return values, problems
+    return numeric.astype(spec.dtype), problems
+
+
+def enforce_schema(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = BASKETBALL_SCHEMA,
+                   required: bool = True,
+                   relations: Tuple[Tuple[str, str], ...] = BASKETBALL_RELATIONS) -> pd.DataFrame:
+    """
+    Validate a frame against the schema and convert it to the declared dtypes
+
+    Args:
+        df (pd.DataFrame): Parsed frame (columns not in the schema are left alone)
+        schema (Dict[str, ColumnSpec]): Column declarations
+        required (bool): Every declared column must be present
+        relations (Tuple[Tuple[str, str], ...]): (part, whole) pairs where part <= whole
+
+    Returns:
+        pd.DataFrame: The frame with declared columns converted
+
+    Raises:
+        SchemaError: Listing every violation found
+    """
+    problems = []
+    if required:
+        missing = [name for name in schema if name not in df.columns]
+        if missing:
+            raise SchemaError(f"Missing columns: {', '.join(missing)}")
+
+    converted = {}
+    for name, spec in schema.items():
+        if name in df.columns:
+            converted[name], column_problems = _check_column(name, df[name], spec)
+            problems.extend(column_problems)
+    for part, whole in relations:
+        if part in converted and whole in converted and not problems:
+            over = converted[part] > converted[whole]
+            if over.any():
+                problems.append(f"{part} above {whole} in {_rows(over)}")
+    if problems:
+        raise SchemaError("Dataset does not match the schema:\n  - " + "\n  - ".join(problems))
+    return df.assign(**converted)
+
+
+def read_csv_with_schema(path: str, schema: Dict[str, ColumnSpec] = BASKETBALL_SCHEMA,
+                         required: bool = True, chunksize: Optional[int] = None,
+                         **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Parse a CSV straight into the declared dtypes
+
+    Args:
+        path (str): CSV file
+        schema (Dict[str, ColumnSpec]): Column declarations
+        required (bool): Every declared column must be present
+        chunksize (int): Yield validated chunks of this many rows instead of one frame
+        **kwargs: Passed to pd.read_csv
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The frame, or its chunks when chunksize is set
+
+    Raises:
+        SchemaError: On a missing column, an unparseable value or any other violation
+    """
+    dtype = _parse_dtypes(pd.read_csv(path, nrows=0, **kwargs).columns, schema)
+    if chunksize is None:
+        try:
+            df = pd.read_csv(path, dtype=dtype, **kwargs)
+        except ValueError:
+            # Text in a float column: parse without dtypes so the checks can name the rows
+            df = pd.read_csv(path, **kwargs)
+        return enforce_schema(df, schema, required)
+    return _read_chunks(path, dtype, schema, required, chunksize, kwargs)
+
+
+def _read_chunks(path: str, dtype: Dict[str, str], schema: Dict[str, ColumnSpec], required: bool,
+                 chunksize: int, kwargs: Dict) -> Iterator[pd.DataFrame]:
+    try:
+        with pd.read_csv(path, dtype=dtype, chunksize=chunksize, **kwargs) as reader:
+            for chunk in reader:
+                yield enforce_schema(chunk, schema, required)
+    except SchemaError:
+        raise
+    except ValueError as e:
+        # Earlier chunks are already consumed, so re-scan without dtypes to name the rows
+        with pd.read_csv(path, chunksize=chunksize, **kwargs) as reader:
+            for chunk in reader:
+                enforce_schema(chunk, schema, required)
+        raise SchemaError(f"{path}: {e}") from e
+
+
+def to_float64(df: pd.DataFrame, schema: Dict[str, ColumnSpec] = BASKETBALL_SCHEMA) -> pd.DataFrame:
+    """
+    Widen float32 columns back to float64 at their declared precision
+
+    Args:
+        df (pd.DataFrame): Frame with schema dtypes
+        schema (Dict[str, ColumnSpec]): Column declarations
+
+    Returns:
+        pd.DataFrame: The frame with exact float64 values (e.g. 16.6, not 16.600000381)
+    """
+    widened = {name: df[name].astype("float64").round(spec.decimals) for name, spec in schema.items()
+               if name in df.columns and df[name].dtype == np.float32 and spec.decimals is not None}
+    return df.assign(**widened) if widened else df
+
+
+def _inferred_bytes(values: pd.Series) -> int:
+    # What pd.read_csv without a schema would hold: 8 bytes per number, or a pointer plus a str per cell
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        sizes = np.array([sys.getsizeof(c) for c in values.cat.categories] + [sys.getsizeof(np.nan)], dtype=np.int64)
+        return 8 * len(values) + int(sizes[values.cat.codes.to_numpy()].sum())
+    if values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+        return int(values.memory_usage(deep=True, index=False))
+    return 8 * len(values)
+
+
+def memory_report(df: pd.DataFrame) -> Dict:
+    """
+    Memory of a schema-typed frame against the same data with inferred dtypes
+
+    The inferred size is computed from the typed frame, without parsing the file again.
+
+    Args:
+        df (pd.DataFrame): Frame with schema dtypes
+
+    Returns:
+        Dict: "bytes", "inferred_bytes", "reduction" (inferred / actual) and per-column sizes
+    """
+    columns = {}
+    for name in df.columns:
+        columns[name] = {
+            "dtype": str(df[name].dtype),
+            "bytes": int(df[name].memory_usage(deep=True, index=False)),
+            "inferred_bytes": _inferred_bytes(df[name])
+        }
+    total = sum(c["bytes"] for c in columns.values())
+    inferred = sum(c["inferred_bytes"] for c in columns.values())
+    return {"bytes": total, "inferred_bytes": inferred,
+            "reduction": inferred / total if total else None, "columns": columns}
+
+
+def describe_memory(report: Dict) -> str:
+    """
+    One-line summary of a memory report
+
+    Args:
+        report (Dict): Report from memory_report()
+
+    Returns:
+        str: e.g. "2.1 KB with declared dtypes vs 9.6 KB inferred (4.6x smaller)"
+    """
+    kb = lambda size: f"{size / 1024:,.1f} KB"
+    reduction = f" ({report['reduction']:.1f}x smaller)" if report["reduction"] else ""
+    return f"{kb(report['bytes'])} with declared dtypes vs {kb(report['inferred_bytes'])} inferred{reduction}"
@@ -0,0 +1,256 @@
+"""
+Parsed Dataset Cache
+For Task 05: Descriptive Statistics and Large Language Models
+
+Keeps a binary copy of each parsed dataset next to its source so later loads
+skip CSV/Excel/JSON parsing:
+
+    data/roster.csv
+    data/roster.csv.cache.1a2b3c4d.parquet   (or .pkl when pyarrow is not installed)
+    data/roster.csv.cache.1a2b3c4d.json      (key and timings)
+
+The key is the source's absolute path, size, mtime and SHA-256, plus a
+reader variant (for example a dtype schema version). Each variant gets its
+own files (1a2b3c4d is a digest of the variant), so loads of one source
+with different readers do not overwrite each other. If size and mtime
+match, the cache is used without reading the source. If only the mtime
+moved (a touch or a fresh checkout), the content hash decides. Any other
+change re-parses the source and rewrites the cache. A cache that cannot be
+read or written is ignored and the source is parsed as usual.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+CACHE_VERSION = 1
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+READERS = {
+    ".csv": pd.read_csv,
+    ".xlsx": pd.read_excel,
+    ".xls": pd.read_excel,
+    ".json": pd.read_json
+}
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file's contents
+
+    Args:
+        path (str): File to hash
+        chunk_size (int): Bytes read at a time
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def reader_for(path: str) -> Optional[Callable[[str], pd.DataFrame]]:
+    """
+    pandas reader for a file extension
+
+    Args:
+        path (str): Source file
+
+    Returns:
+        Callable: read_csv, read_excel or read_json, or None if the format is unsupported
+    """
+    return READERS.get(os.path.splitext(path)[1].lower())
+
+
+def _write_atomic(path: str, write: Callable[[str], None]):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class DatasetCache:
+    """
+    Cache of parsed DataFrames stored beside their source files
+    """
+
+    def __init__(self, enabled: bool = True, fmt: Optional[str] = None):
+        """
+        Initialize the cache
+
+        Args:
+            enabled (bool): Set to False to always parse the source
+            fmt (str): "parquet" or "pickle" (defaults to parquet when pyarrow is installed)
+        """
+        self.enabled = enabled
+        self.format = fmt or ("parquet" if HAS_PYARROW else "pickle")
+        if self.format not in ("parquet", "pickle"):
+            raise ValueError(f"Unknown cache format '{self.format}', expected 'parquet' or 'pickle'")
+
+    @staticmethod
+    def paths(source: str, fmt: str, variant: str = "") -> Tuple[str, str]:
+        """
+        Cache and metadata files for a source
+
+        Args:
+            source (str): Source file
+            fmt (str): "parquet" or "pickle"
+            variant (str): Reader variant; each one is cached in its own files
+
+        Returns:
+            Tuple[str, str]: (data file, metadata file)
+        """
+        suffix = "parquet" if fmt == "parquet" else "pkl"
+        tag = hashlib.sha256(variant.encode("utf-8")).hexdigest()[:8]
+        return f"{source}.cache.{tag}.{suffix}", f"{source}.cache.{tag}.json"
+
+    def _read_meta(self, meta_path: str) -> Optional[Dict]:
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if isinstance(meta, dict) and meta.get("version") == CACHE_VERSION else None
+
+    def _valid(self, meta: Dict, source: str, stat: os.stat_result, variant: str) -> bool:
+        key = meta.get("key", {})
+        if key.get("path") != os.path.abspath(source) or key.get("size") != stat.st_size \
+                or key.get("variant") != variant or key.get("format") not in ("parquet", "pickle"):
+            return False
+        if key.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        # Same size, new mtime: only the contents can tell
+        return file_digest(source) == key.get("sha256")
+
+    def load(self, source: str, reader: Optional[Callable[[str], pd.DataFrame]] = None,
+             variant: str = "") -> Tuple[pd.DataFrame, Dict]:
+        """
+        Load a dataset, from the cache when it is still valid
+
+        Args:
+            source (str): Source file (CSV, Excel or JSON)
+            reader (Callable[[str], pd.DataFrame]): Parser for the source (chosen by extension if None)
+            variant (str): Extra key for readers that parse the same file differently
+
+        Returns:
+            Tuple[pd.DataFrame, Dict]: The frame and a report with "source" ("cache" or "parsed"),
+                "seconds", "parse_seconds" (time of the last full parse) and "cache_path"
+
+        Raises:
+            ValueError: If no reader is given and the format is unsupported
+        """
+        reader = reader or reader_for(source)
+        if reader is None:
+            raise ValueError(f"Unsupported file format: {source}")
+
+        start = time.perf_counter()
+        stat = os.stat(source)
+        if self.enabled:
+            meta = self._read_meta(self.paths(source, self.format, variant)[1])
+            if meta is not None and self._valid(meta, source, stat, variant):
+                fmt = meta["key"]["format"]
+                data_path, meta_path = self.paths(source, fmt, variant)
+                try:
+                    df = pd.read_parquet(data_path) if fmt == "parquet" else pd.read_pickle(data_path)
+                except Exception:
+                    df = None
+                if df is not None:
+                    if meta["key"]["mtime_ns"] != stat.st_mtime_ns:
+                        meta["key"]["mtime_ns"] = stat.st_mtime_ns
+                        self._write_meta(meta_path, meta)
+                    return df, {"source": "cache", "format": fmt, "seconds": time.perf_counter() - start,
+                                "parse_seconds": meta.get("parse_seconds"), "cache_path": data_path}
+
+        df = reader(source)
+        parse_seconds = time.perf_counter() - start
+        report = {"source": "parsed", "format": None, "seconds": parse_seconds,
+                  "parse_seconds": parse_seconds, "cache_path": None}
+        if self.enabled:
+            report.update(self._store(source, stat, variant, df, parse_seconds))
+        return df, report
+
+    def _store(self, source: str, stat: os.stat_result, variant: str, df: pd.DataFrame,
+               parse_seconds: float) -> Dict:
+        # Mixed-type object columns cannot go to parquet; pickle takes anything
+        for fmt in dict.fromkeys((self.format, "pickle")):
+            data_path, meta_path = self.paths(source, fmt, variant)
+            try:
+                if fmt == "parquet":
+                    _write_atomic(data_path, lambda path: df.to_parquet(path, index=True))
+                else:
+                    _write_atomic(data_path, lambda path: df.to_pickle(path))
+            except Exception:
+                continue
+            self._write_meta(meta_path, {
+                "version": CACHE_VERSION,
+                "key": {
+                    "path": os.path.abspath(source),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": file_digest(source),
+                    "variant": variant,
+                    "format": fmt
+                },
+                "parse_seconds": parse_seconds,
+                "rows": len(df)
+            })
+            return {"format": fmt, "cache_path": data_path}
+        return {}
+
+    def _write_meta(self, meta_path: str, meta: Dict):
+        def write(path: str):
+            with open(path, "w") as f:
+                json.dump(meta, f, indent=2)
+        try:
+            _write_atomic(meta_path, write)
+        except OSError:
+            pass
+
+
+_DEFAULT_CACHE = DatasetCache()
+
+
+def load_table(source: str, reader: Optional[Callable[[str], pd.DataFrame]] = None,
+               variant: str = "", cache: Optional[DatasetCache] = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Load a dataset through the parsed-dataset cache
+
+    Args:
+        source (str): Source file (CSV, Excel or JSON)
+        reader (Callable[[str], pd.DataFrame]): Parser for the source (chosen by extension if None)
+        variant (str): Extra key for readers that parse the same file differently
+        cache (DatasetCache): Cache to use (a shared default if None)
+
+    Returns:
+        Tuple[pd.DataFrame, Dict]: The frame and the load report (see DatasetCache.load)
+    """
+    return (cache or _DEFAULT_CACHE).load(source, reader, variant)
+
+
+def describe_load(report: Dict) -> str:
+    """
+    One-line summary of a load report
+
+    Args:
+        report (Dict): Report from load_table()
+
+    Returns:
+        str: e.g. "from cache (pickle) in 0.002s; a full parse took 0.041s"
+    """
+    if report["source"] == "cache":
+        parse = report.get("parse_seconds")
+        note = f"; a full parse took {parse:.3f}s" if parse is not None else ""
+        return f"from cache ({report['format']}) in {report['seconds']:.3f}s{note}"
+    cached = f", cached as {report['format']}" if report.get("cache_path") else ""
+    return f"parsed in {report['seconds']:.3f}s{cached}"
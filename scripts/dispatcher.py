@@ -0,0 +1,162 @@
+"""
+Concurrent Request Dispatcher
+For Task 05: Descriptive Statistics and Large Language Models
+
+Runs a whole (model x question) matrix of prompts in flight at once using a
+thread pool, while capping how many requests each model has open at a time.
+Results are always returned in the order the jobs were submitted.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class PromptJob:
+    """One cell of the (model x question) test matrix"""
+    model: str
+    question: str
+    prompt: str
+    max_tokens: int = 2000
+    category: Optional[str] = None
+    context: Optional[str] = None
+    instruction: Optional[str] = None
+    answer_id: Optional[str] = None
+    cell_id: Optional[str] = None
+    sample: int = 0
+    n: int = 1
+
+
+class ConcurrentDispatcher:
+    """
+    Dispatch prompt jobs concurrently with a per-model concurrency limit
+    """
+
+    def __init__(self, send_fn: Callable[[PromptJob], Dict],
+                 max_concurrency_per_model: int = 4,
+                 max_workers: Optional[int] = None,
+                 model_concurrency: Optional[Dict[str, int]] = None):
+        """
+        Initialize the dispatcher
+
+        Args:
+            send_fn (Callable): Function that sends one job and returns the API result dict
+            max_concurrency_per_model (int): Maximum in-flight requests per model
+            max_workers (int): Upper bound on pool threads (defaults to one per open slot)
+            model_concurrency (Dict[str, int]): Per-model overrides of max_concurrency_per_model
+        """
+        if max_concurrency_per_model < 1 or any(limit < 1 for limit in (model_concurrency or {}).values()):
+            raise ValueError("max_concurrency_per_model must be at least 1")
+
+        self.send_fn = send_fn
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.max_workers = max_workers
+        self.model_concurrency = dict(model_concurrency or {})
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, model: str) -> int:
+        """
+        Maximum in-flight requests for one model
+
+        Args:
+            model (str): Model identifier
+
+        Returns:
+            int: The model's override, or max_concurrency_per_model
+        """
+        return self.model_concurrency.get(model, self.max_concurrency_per_model)
+
+    def share_limits(self, semaphores: Dict):
+        """
+        Gate models on semaphores held elsewhere, e.g. multiprocessing ones shared by worker processes
+
+        Args:
+            semaphores (Dict): Semaphore by model, replacing this dispatcher's own for those models
+        """
+        with self._lock:
+            self._semaphores.update(semaphores)
+
+    def _semaphore_for(self, model: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if model not in self._semaphores:
+                self._semaphores[model] = threading.BoundedSemaphore(self.limit_for(model))
+            return self._semaphores[model]
+
+    def _run_job(self, job: PromptJob,
+                 on_result: Optional[Callable[[PromptJob, Dict], None]] = None,
+                 skip_fn: Optional[Callable[[PromptJob], Optional[str]]] = None) -> Dict:
+        with self._semaphore_for(job.model):
+            # Checked once a slot is free, so results that landed while waiting count
+            reason = skip_fn(job) if skip_fn is not None else None
+            if reason:
+                result = {"success": False, "skipped": True, "error": reason, "model": job.model}
+            else:
+                try:
+                    result = self.send_fn(job)
+                except Exception as e:
+                    result = {
+                        "success": False,
+                        "error": f"Request failed: {str(e)}",
+                        "model": job.model
+                    }
+        if on_result is not None:
+            on_result(job, result)
+        return result
+
+    def run(self, jobs: List[PromptJob],
+            on_result: Optional[Callable[[PromptJob, Dict], None]] = None,
+            skip_fn: Optional[Callable[[PromptJob], Optional[str]]] = None) -> List[Tuple[PromptJob, Dict]]:
+        """
+        Run all jobs and collect their results
+
+        Args:
+            jobs (List[PromptJob]): Jobs to dispatch
+            on_result (Callable): Called from the worker thread with (job, result) as each job finishes
+            skip_fn (Callable): Returns a reason to skip a job instead of sending it, or None
+
+        Returns:
+            List[Tuple[PromptJob, Dict]]: (job, result) pairs in submission order
+        """
+        if not jobs:
+            return []
+
+        models = {job.model for job in jobs}
+        workers = min(len(jobs), sum(self.limit_for(model) for model in models))
+        if self.max_workers:
+            workers = min(workers, self.max_workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Submit jobs round-robin across models so no single model
+            # monopolises the pool while others wait in the queue.
+            futures = [None] * len(jobs)
+            for index in _interleave_by_model(jobs):
+                futures[index] = executor.submit(self._run_job, jobs[index], on_result, skip_fn)
+
+            return [(job, future.result()) for job, future in zip(jobs, futures)]
+
+
+def _interleave_by_model(jobs: List[PromptJob]) -> List[int]:
+    """
+    Order job indices round-robin by model, keeping each model's own order
+
+    Args:
+        jobs (List[PromptJob]): Jobs to order
+
+    Returns:
+        List[int]: Job indices in submission order
+    """
+    queues = {}
+    for index, job in enumerate(jobs):
+        queues.setdefault(job.model, []).append(index)
+
+    order = []
+    position = 0
+    while len(order) < len(jobs):
+        for indices in queues.values():
+            if position < len(indices):
+                order.append(indices[position])
+        position += 1
+    return order
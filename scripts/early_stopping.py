@@ -0,0 +1,192 @@
+"""
+Adaptive Early Stopping
+For Task 05: Descriptive Statistics and Large Language Models
+
+Keeps running per-model accuracy and latency estimates while the matrix is
+in flight and stops dispatching a model's remaining questions once its
+result is settled. Accuracy is tracked with Wald's sequential probability
+ratio test (SPRT) around a configurable bar:
+
+    H0: accuracy <= min_accuracy - margin   (fail: stop the model)
+    H1: accuracy >= min_accuracy + margin   (pass: optionally stop as well)
+
+With error rates alpha and beta the test needs far fewer questions than a
+fixed-size comparison when a model is clearly good or clearly bad. A model
+can also be stopped once its mean latency is over a ceiling. Wilson score
+intervals are reported alongside for readability.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Optional, Tuple
+
+from dispatcher import PromptJob
+
+FAIL = "fail"
+PASS = "pass"
+SLOW = "slow"
+
+
+@dataclass
+class EarlyStopPolicy:
+    """When to stop sending a model more questions"""
+    min_accuracy: float = 0.5
+    margin: float = 0.15
+    alpha: float = 0.05
+    beta: float = 0.05
+    min_samples: int = 3
+    stop_on_pass: bool = False
+    max_latency: Optional[float] = None
+    confidence: float = 0.95
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion
+
+    Args:
+        successes (int): Correct answers
+        trials (int): Scored answers
+        confidence (float): Two-sided confidence level
+
+    Returns:
+        Tuple[float, float]: (low, high); (0, 1) when there are no trials
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+class _ModelState:
+    def __init__(self):
+        self.scored = 0
+        self.correct = 0
+        self.llr = 0.0
+        self.latency_count = 0
+        self.latency_mean = 0.0
+        self.latency_m2 = 0.0
+        self.decision = None
+        self.skipped = 0
+
+
+class AdaptiveScheduler:
+    """
+    Thread-safe per-model sequential test fed by responses as they arrive
+    """
+
+    def __init__(self, policy: Optional[EarlyStopPolicy] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            policy (EarlyStopPolicy): Bar, error rates and latency ceiling (defaults apply if None)
+        """
+        self.policy = policy or EarlyStopPolicy()
+        p0 = min(max(self.policy.min_accuracy - self.policy.margin, 1e-3), 1 - 1e-3)
+        p1 = min(max(self.policy.min_accuracy + self.policy.margin, 1e-3), 1 - 1e-3)
+        if p1 <= p0:
+            raise ValueError("min_accuracy +/- margin must leave room for a test")
+        self._success_step = math.log(p1 / p0)
+        self._failure_step = math.log((1 - p1) / (1 - p0))
+        self._accept_pass = math.log((1 - self.policy.beta) / self.policy.alpha)
+        self._accept_fail = math.log(self.policy.beta / (1 - self.policy.alpha))
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def _state(self, model: str) -> _ModelState:
+        if model not in self._states:
+            self._states[model] = _ModelState()
+        return self._states[model]
+
+    def record(self, model: str, correct: Optional[bool], latency: Optional[float] = None):
+        """
+        Update a model's estimates with one response
+
+        Args:
+            model (str): Model identifier
+            correct (bool): Whether the answer was right (None if the question is not scored)
+            latency (float): Response time in seconds
+        """
+        policy = self.policy
+        with self._lock:
+            state = self._state(model)
+            if latency is not None:
+                # Welford's online mean and variance
+                state.latency_count += 1
+                delta = latency - state.latency_mean
+                state.latency_mean += delta / state.latency_count
+                state.latency_m2 += delta * (latency - state.latency_mean)
+            if correct is not None:
+                state.scored += 1
+                state.correct += int(correct)
+                state.llr += self._success_step if correct else self._failure_step
+
+            if state.decision is not None:
+                return
+            if state.scored >= policy.min_samples:
+                if state.llr <= self._accept_fail:
+                    state.decision = FAIL
+                elif state.llr >= self._accept_pass and policy.stop_on_pass:
+                    state.decision = PASS
+            if (state.decision is None and policy.max_latency is not None
+                    and state.latency_count >= policy.min_samples
+                    and state.latency_mean > policy.max_latency):
+                state.decision = SLOW
+
+    def skip_reason(self, job: PromptJob) -> Optional[str]:
+        """
+        Dispatcher hook: why a job should not be sent, if its model is settled
+
+        Args:
+            job (PromptJob): Job about to be sent
+
+        Returns:
+            str: Reason for skipping, or None to send the job
+        """
+        with self._lock:
+            state = self._states.get(job.model)
+            if state is None or state.decision is None:
+                return None
+            state.skipped += 1
+            decision = state.decision
+            accuracy = state.correct / state.scored if state.scored else float("nan")
+            mean_latency = state.latency_mean
+
+        if decision == SLOW:
+            return f"Early stop for {job.model}: mean latency {mean_latency:.2f}s over {self.policy.max_latency:.2f}s"
+        bar = "below" if decision == FAIL else "above"
+        return f"Early stop for {job.model}: accuracy {accuracy:.0%} settled {bar} {self.policy.min_accuracy:.0%}"
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Per-model estimates and decisions
+
+        Returns:
+            Dict[str, Dict]: scored, correct, accuracy, Wilson bounds, latency mean/stddev,
+                log-likelihood ratio, decision and skipped requests by model
+        """
+        with self._lock:
+            summary = {}
+            for model, state in sorted(self._states.items()):
+                low, high = wilson_interval(state.correct, state.scored, self.policy.confidence)
+                variance = state.latency_m2 / (state.latency_count - 1) if state.latency_count > 1 else 0.0
+                summary[model] = {
+                    "scored": state.scored,
+                    "correct": state.correct,
+                    "accuracy": state.correct / state.scored if state.scored else None,
+                    "accuracy_low": low,
+                    "accuracy_high": high,
+                    "latency_mean": state.latency_mean if state.latency_count else None,
+                    "latency_stddev": math.sqrt(variance),
+                    "log_likelihood_ratio": state.llr,
+                    "decision": state.decision,
+                    "skipped_requests": state.skipped
+                }
+            return summary
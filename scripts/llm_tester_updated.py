@@ -3,19 +3,43 @@ LLM Testing Framework for Task 05: Descriptive Statistics and Large Language Mod
 Using OpenRouter API to test multiple LLMs with Syracuse Women's Basketball dataset
 """
 
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import sys
 import time
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from datetime import datetime
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from enum import Enum
 
+from dispatcher import ConcurrentDispatcher, PromptJob
+from consistency import consistency_report, expand_samples
+from batching import expand_batch_result, plan_batches
+from answer_key import build_answer_key
+from answer_matching import matcher_for, question_report
+from data_encoder import encode_dataset, token_report
+from early_stopping import AdaptiveScheduler, EarlyStopPolicy
+from metrics import build_metrics, export_metrics
+from model_probe import DEFAULT_BASELINE_PATH, dead_models, load_baseline, recommended_concurrency
+from pricing import DEFAULT_PRICING_PATH, account_costs, load_pricing
+from question_suite import DEFAULT_SUITE_PATH, build_matrix, load_question_suite
+from resilience import (MODEL_UNAVAILABLE_STATUS_CODES, RETRYABLE, ResilienceTracker,
+                        backoff_delay, classify_exception, classify_status)
+from response_cache import ResponseCache
+from response_store import ResponseStore, assign_column, columns_of
+from run_journal import RunJournal, cell_id, sample_key
+from streaming import consume_stream, estimate_usage
+from rate_limiter import ModelRateLimiter, RateLimit, estimate_request_tokens, parse_retry_after
+from token_budget import BudgetExceededError, BudgetPolicy, enforce_budget, get_tokenizer
+
 class LLMProvider(Enum):
     """Available LLM providers through OpenRouter - Optimized for cost efficiency"""
-    # Cheapest options first
+    # Cheapest options first (current input/output rates live in pricing.json)
     MISTRAL_7B = "mistralai/mistral-7b-instruct"  # ~$0.0002 per 1K tokens
     LLAMA_3_70B = "meta-llama/llama-3.3-70b-instruct:free"  # ~$0.0002 per 1K tokens
     GOOGLE_GEMINI_FLASH = "google/gemini-2.5-flash"  # ~$0.0005 per 1K tokens
@@ -25,9 +49,22 @@ class LLMProvider(Enum):
     OPENAI_GPT4 = "openai/gpt-4"                  # ~$0.03 per 1K tokens
     ANTHROPIC_CLAUDE_OPUS = "anthropic/claude-3-opus"     # ~$0.015 per 1K tokens
 
-@dataclass
+# Per-model throughput limits (OpenRouter free-tier models allow ~20 requests/min)
+MODEL_RATE_LIMITS = {
+    LLMProvider.LLAMA_3_70B.value: RateLimit(requests_per_second=20 / 60, tokens_per_minute=100000),
+    LLMProvider.OPENAI_GPT4.value: RateLimit(requests_per_second=2, tokens_per_minute=40000),
+    LLMProvider.ANTHROPIC_CLAUDE_OPUS.value: RateLimit(requests_per_second=2, tokens_per_minute=40000),
+}
+
+# Marks where export_results streams the response rows into the summary
+_RESPONSES_PLACEHOLDER = "\x00responses\x00"
+
+# Slotted records (no per-instance __dict__) where dataclasses support it
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class LLMResponse:
-    """Structure for storing LLM responses"""
+    """Structure for storing LLM responses (timestamp in epoch seconds)"""
     provider: str
     model: str
     prompt: str
@@ -35,25 +72,98 @@ class LLMResponse:
     accuracy_score: Optional[float] = None
     response_time: Optional[float] = None
     tokens_used: Optional[int] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
     cost: Optional[float] = None
-    timestamp: str = None
+    category: Optional[str] = None
+    answer_id: Optional[str] = None
+    sample: int = 0
+    throttle_time: Optional[float] = None
+    cached: bool = False
+    batch_id: Optional[str] = None
+    batch_size: Optional[int] = None
+    time_to_first_token: Optional[float] = None
+    inter_token_latency: Optional[float] = None
+    tokens_per_second: Optional[float] = None
+    stopped_early: bool = False
+    timestamp: Optional[float] = None
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = time.time()
+        elif isinstance(self.timestamp, str):
+            # Records journaled by older versions carry ISO strings
+            self.timestamp = datetime.fromisoformat(self.timestamp).timestamp()
 
 class LLMTester:
     """
     A comprehensive LLM testing framework for sports data analysis
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://openrouter.ai/api/v1"):
+    def __init__(self, api_key: str, base_url: str = "https://openrouter.ai/api/v1",
+                 concurrent: bool = True, max_concurrency_per_model: int = 4,
+                 rate_limits: Optional[Dict[str, RateLimit]] = None,
+                 max_retries: int = 3, pool_size: int = 16,
+                 connect_timeout: float = 10.0, read_timeout: float = 120.0,
+                 use_cache: bool = True, cache_dir: str = "results/llm_cache",
+                 cache_max_bytes: int = 100 * 1024 * 1024,
+                 data_format: str = "csv", token_budget: Optional[int] = None,
+                 batch_size: int = 1, max_batch_tokens: int = 4096,
+                 stream: bool = False, stop_condition: Optional[Callable[[str], bool]] = None,
+                 backoff_base: float = 0.5, backoff_cap: float = 30.0,
+                 breaker_threshold: int = 3, breaker_reset_timeout: Optional[float] = None,
+                 default_rate_limit: Optional[RateLimit] = None,
+                 budget: Optional[BudgetPolicy] = None, tokenizer: str = "auto",
+                 pricing_path: str = DEFAULT_PRICING_PATH,
+                 suite_path: str = DEFAULT_SUITE_PATH,
+                 journal_path: Optional[str] = "results/llm_run_journal.jsonl",
+                 early_stopping: Optional[EarlyStopPolicy] = None,
+                 consistency_samples: int = 1, consistency_temperature: float = 0.7,
+                 max_samples_per_request: int = 16,
+                 baseline_path: Optional[str] = DEFAULT_BASELINE_PATH,
+                 baseline_max_age: Optional[float] = 24 * 3600,
+                 verbose: bool = True):
         """
         Initialize the LLM tester with OpenRouter API credentials
         
         Args:
             api_key (str): OpenRouter API key
             base_url (str): OpenRouter API base URL
+            concurrent (bool): Send the whole question matrix in flight at once
+            max_concurrency_per_model (int): Maximum in-flight requests per model
+            rate_limits (Dict[str, RateLimit]): Per-model limits (defaults to MODEL_RATE_LIMITS)
+            max_retries (int): Retries per request for retryable errors (429, 5xx, timeouts)
+            pool_size (int): Keep-alive connections kept open per host
+            connect_timeout (float): Seconds to wait for a connection to be established
+            read_timeout (float): Seconds to wait for the server to send data
+            use_cache (bool): Serve repeated identical requests from the on-disk cache
+            cache_dir (str): Directory for cached responses
+            cache_max_bytes (int): Size cap for the cache before LRU eviction
+            data_format (str): Encoding for the dataset context ("csv", "markdown", "kv", "verbose")
+            token_budget (int): Optional token budget for the dataset context
+            batch_size (int): Questions packed into one request (1 disables batching)
+            max_batch_tokens (int): Cap on max_tokens for a batched request
+            stream (bool): Stream completions over SSE and record TTFT and throughput
+            stop_condition (Callable[[str], bool]): Stops a streamed generation early when it returns True
+            backoff_base (float): First retry's backoff ceiling in seconds (doubles per attempt)
+            backoff_cap (float): Maximum backoff ceiling in seconds
+            breaker_threshold (int): Consecutive failed requests that trip a model's circuit breaker
+            breaker_reset_timeout (float): Seconds before a tripped model gets a probe request (None: rest of run)
+            default_rate_limit (RateLimit): Limit for models without an entry in rate_limits
+            budget (BudgetPolicy): Per-run and per-model cost/token limits checked before dispatch
+            tokenizer (str): Token counter for the pre-flight projection ("auto", "tiktoken", "heuristic")
+            pricing_path (str): Versioned pricing table with input/output rates per model
+            suite_path (str): Prompt catalog whose test suite section defines the question matrix
+            journal_path (str): Append-only journal of completed requests for resuming (None disables)
+            early_stopping (EarlyStopPolicy): Stop sending a model questions once its accuracy is settled
+                or its latency is over the ceiling (None sends the whole matrix)
+            consistency_samples (int): Completions per (model, question) cell (K); above 1 enables consistency mode
+            consistency_temperature (float): Sampling temperature in consistency mode
+            max_samples_per_request (int): Most completions asked of one request via `n` (models that support it)
+            baseline_path (str): Health probe baseline from test_setup.py --probe; failed models are
+                excluded and concurrency is sized from probe latency (None or a missing file: not used)
+            baseline_max_age (float): Ignore a baseline older than this many seconds (None: any age)
+            verbose (bool): Print one line per response
         """
         self.api_key = api_key
         self.base_url = base_url
@@ -63,40 +173,100 @@ class LLMTester:
             "HTTP-Referer": "https://github.com/your-repo/Task_05_Descriptive_Stats",
             "X-Title": "Task 05 Descriptive Statistics Research"
         }
-        self.responses = []
+        
+        # One pooled session so repeated calls reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = ResponseCache(cache_dir, max_bytes=cache_max_bytes, enabled=use_cache)
+        self.data_format = data_format
+        self.token_budget = token_budget
+        self.data_encoding = {}
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.stream = stream
+        self.stop_condition = stop_condition
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.resilience = ResilienceTracker(breaker_threshold, breaker_reset_timeout)
+        self.budget = budget
+        self.tokenizer_name, self.count_tokens = get_tokenizer(tokenizer)
+        self.budget_report = {}
+        self.pricing = load_pricing(pricing_path)
+        self.suite = load_question_suite(suite_path)
+        self.journal = RunJournal(journal_path) if journal_path else None
+        self.scheduler = AdaptiveScheduler(early_stopping) if early_stopping is not None else None
+        self.consistency_samples = consistency_samples
+        self.consistency_temperature = consistency_temperature
+        self.max_samples_per_request = max_samples_per_request
+        self.consistency = []
+        self.answer_key = {}
+        self.question_accuracy = {}
+        self.cost_summary = {}
+        self.unanswered_usage = []
+        self.verbose = verbose
+        self.metrics = {}
+        self.responses = ResponseStore(LLMResponse)
         self.test_results = {}
+        self.concurrent = concurrent
+        self.rate_limiter = ModelRateLimiter(MODEL_RATE_LIMITS if rate_limits is None else rate_limits,
+                                             default_rate_limit)
         
-    def load_basketball_data(self, data_path: str = "data/syracuse_womens_basketball_2023_24.csv") -> str:
+        # A recent probe baseline rules out dead models and sizes each model's concurrency
+        self.baseline = load_baseline(baseline_path, base_url, baseline_max_age) if baseline_path else None
+        self.excluded_models = dead_models(self.baseline)
+        model_concurrency = {}
+        for model, probe in (self.baseline or {}).get("models", {}).items():
+            if probe["alive"]:
+                model_concurrency[model] = recommended_concurrency(
+                    probe["warm_latency"] or probe["cold_latency"],
+                    self.rate_limiter.limits.get(model, self.rate_limiter.default_limit),
+                    max_concurrency_per_model)
+        self.dispatcher = ConcurrentDispatcher(
+            self._send_job,
+            max_concurrency_per_model=max_concurrency_per_model,
+            model_concurrency=model_concurrency
+        )
+        self.max_retries = max_retries
+        
+    def load_basketball_data(self, data_path: str = "data/syracuse_womens_basketball_2023_24.csv",
+                             data_format: Optional[str] = None,
+                             token_budget: Optional[int] = None) -> str:
         """
         Load basketball data and format it for LLM prompts
         
         Args:
             data_path (str): Path to the basketball dataset
+            data_format (str): "csv", "markdown", "kv" or "verbose" (defaults to self.data_format)
+            token_budget (int): Shrink the table to fit this many tokens (defaults to self.token_budget)
             
         Returns:
             str: Formatted data string for LLM prompts
         """
+        data_format = data_format or self.data_format
+        token_budget = token_budget if token_budget is not None else self.token_budget
+        
         try:
             df = pd.read_csv(data_path)
             
-            # Create a formatted string representation
-            data_str = "Syracuse Women's Basketball 2023-24 Season Statistics:\n\n"
-            data_str += "Team Overview: 24-8 record (13-5 ACC), #20 AP ranking, NCAA tournament second round\n\n"
-            data_str += "Player Statistics:\n"
-            data_str += "-" * 80 + "\n"
+            data_str, report = encode_dataset(df, data_format, token_budget)
+            self.data_encoding = {"selected": report, "tokens_by_format": token_report(df)}
+            self.answer_key = build_answer_key(df)
             
-            for _, row in df.iterrows():
-                data_str += f"Player: {row['Player']}\n"
-                data_str += f"Position: {row['Position']}\n"
-                data_str += f"Games: {row['Games_Played']} (Started: {row['Games_Started']})\n"
-                data_str += f"Minutes: {row['Minutes_Played']}\n"
-                data_str += f"Points: {row['Points_Per_Game']} PPG ({row['Total_Points']} total)\n"
-                data_str += f"Rebounds: {row['Rebounds_Per_Game']} RPG ({row['Total_Rebounds']} total)\n"
-                data_str += f"Assists: {row['Assists']}, Steals: {row['Steals']}, Blocks: {row['Blocks']}, Turnovers: {row['Turnovers']}\n"
-                data_str += f"Shooting: FG {row['Field_Goal_Percentage']:.3f} ({row['Field_Goals_Made']}/{row['Field_Goals_Attempted']}), "
-                data_str += f"3P {row['Three_Point_Percentage']:.3f} ({row['Three_Pointers_Made']}/{row['Three_Pointers_Attempted']}), "
-                data_str += f"FT {row['Free_Throw_Percentage']:.3f} ({row['Free_Throws_Made']}/{row['Free_Throws_Attempted']})\n"
-                data_str += "-" * 80 + "\n"
+            print(f"  Data encoded as {data_format}: ~{report['tokens']:,} tokens")
+            print("  Tokens by format: " + ", ".join(
+                f"{fmt}={tokens:,}" for fmt, tokens in self.data_encoding["tokens_by_format"].items()))
+            if report["dropped_columns"]:
+                print(f"  Dropped to fit budget: {', '.join(report['dropped_columns'])}")
+            if not report["within_budget"]:
+                print(f"  ⚠️ Still over the {token_budget:,}-token budget")
             
             return data_str
             
@@ -104,39 +274,53 @@ class LLMTester:
             print(f"Error loading basketball data: {e}")
             return ""
     
-    def calculate_cost(self, model: str, tokens_used: int) -> float:
+    def calculate_cost(self, model: str, prompt_tokens: int, completion_tokens: int = 0) -> Optional[float]:
         """
         Calculate the cost of API usage based on model and tokens
         
         Args:
             model (str): Model identifier
-            tokens_used (int): Number of tokens used
+            prompt_tokens (int): Input tokens, priced at the model's input rate
+            completion_tokens (int): Output tokens, priced at the model's output rate
             
         Returns:
-            float: Cost in USD
-        """
-        # Cost per 1K tokens (approximate OpenRouter pricing)
-        cost_per_1k = {
-            "mistralai/mistral-7b-instruct": 0.0002,
-            "meta-llama/llama-3.3-70b-instruct:free": 0.0002,
-            "google/gemini-2.5-flash": 0.0005,
-            "openai/gpt-3.5-turbo": 0.0015,
-            "anthropic/claude-3-haiku": 0.0025,
-            "anthropic/claude-3-opus": 0.015,
-            "openai/gpt-4": 0.03
-        }
-        
-        cost_per_token = cost_per_1k.get(model, 0.001) / 1000
-        return tokens_used * cost_per_token
+            float: Cost in USD, or None if the model is missing from the pricing table
+        """
+        return self.pricing.cost(model, prompt_tokens, completion_tokens)
     
-    def send_prompt(self, model: str, prompt: str, max_tokens: int = 2000) -> Dict:
+    def send_prompt(self, model: str, prompt: str, max_tokens: int = 2000,
+                    use_cache: bool = True, stream: Optional[bool] = None,
+                    stop_condition: Optional[Callable[[str], bool]] = None,
+                    n: int = 1, temperature: Optional[float] = None, sample: int = 0) -> Dict:
         """
         Send a prompt to a specific LLM via OpenRouter API
         
+        Identical requests are served from the response cache. Otherwise the
+        call waits for the model's rate limiter. Retryable failures (429, 5xx,
+        timeouts, dropped connections) are retried with jittered exponential
+        backoff; a 429 pauses the whole model for its Retry-After period.
+        Requests to a model whose circuit breaker is open are skipped.
+        
+        In streaming mode the completion is read as server-sent events and the
+        result also carries time_to_first_token, inter_token_latency and
+        tokens_per_second. Generations cut short by the stop condition are
+        not cached.
+        
+        With n above 1 the model is asked for several completions in one
+        request (never streamed) and the result also carries "responses",
+        one text per completion. The sample index only enters the cache
+        key, so repeated samples of one prompt are cached separately.
+        
         Args:
             model (str): Model identifier
             prompt (str): The prompt to send
             max_tokens (int): Maximum tokens for response
+            use_cache (bool): Set to False to bypass the cache for this call
+            stream (bool): Stream this call (defaults to self.stream)
+            stop_condition (Callable[[str], bool]): Early-stop check (defaults to self.stop_condition)
+            n (int): Completions to request
+            temperature (float): Sampling temperature (defaults to 0.1)
+            sample (int): Index of the first sample this call produces
             
         Returns:
             Dict: API response
@@ -150,406 +334,694 @@ class LLMTester:
                 }
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.1  # Low temperature for more consistent responses
+            "temperature": 0.1 if temperature is None else temperature  # Low by default for consistent responses
         }
+        if n > 1:
+            payload["n"] = n
         
-        try:
-            start_time = time.time()
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload
-            )
-            end_time = time.time()
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "success": True,
-                    "response": result["choices"][0]["message"]["content"],
-                    "usage": result.get("usage", {}),
-                    "response_time": end_time - start_time,
-                    "model": model
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"API Error {response.status_code}: {response.text}",
-                    "response_time": end_time - start_time,
-                    "model": model
-                }
-                
-        except Exception as e:
+        stream = (self.stream if stream is None else stream) and n == 1
+        stop_condition = stop_condition or self.stop_condition
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+        
+        url = f"{self.base_url}/chat/completions"
+        cache_key = ResponseCache.make_key(url, dict(payload, sample=sample) if sample else payload)
+        if use_cache:
+            lookup_start = time.time()
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached.update({
+                    "cached": True,
+                    "original_response_time": cached["response_time"],
+                    "response_time": time.time() - lookup_start,
+                    "throttle_time": 0.0
+                })
+                return cached
+        
+        breaker = self.resilience.breaker(model)
+        if not breaker.allow_request():
             return {
                 "success": False,
-                "error": f"Request failed: {str(e)}",
+                "skipped": True,
+                "error": f"Circuit breaker open for {model}, request skipped",
                 "model": model
             }
+        
+        estimated_tokens = estimate_request_tokens(prompt, max_tokens)
+        throttle_time = 0.0
+        
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            throttle_time += self.rate_limiter.acquire(model, estimated_tokens)
+            start_time = time.time()
+            status_code = None
+            
+            try:
+                response = self.session.post(
+                    url,
+                    json=payload,
+                    timeout=self.timeout,
+                    stream=stream
+                )
+                end_time = time.time()
+                status_code = response.status_code
+                
+                if response.status_code == 200 and stream:
+                    streamed = consume_stream(response, start_time, stop_condition)
+                    if not streamed["usage"].get("total_tokens"):
+                        # Cut short before the usage chunk; the prompt was billed all the same
+                        streamed["usage"] = estimate_usage(prompt, streamed["response"], self.count_tokens)
+                    usage = streamed["usage"]
+                    self.rate_limiter.settle(model, estimated_tokens, usage.get("total_tokens", estimated_tokens))
+                    breaker.record_success()
+                    result = dict(streamed, success=True, throttle_time=throttle_time,
+                                  attempts=attempt + 1, model=model)
+                    if use_cache and not streamed["stopped_early"]:
+                        self.cache.put(cache_key, result)
+                    return result
+                elif response.status_code == 200:
+                    result = response.json()
+                    usage = result.get("usage", {})
+                    self.rate_limiter.settle(model, estimated_tokens, usage.get("total_tokens", estimated_tokens))
+                    breaker.record_success()
+                    choices = [choice["message"]["content"] for choice in result["choices"]]
+                    result = {
+                        "success": True,
+                        "response": choices[0],
+                        "usage": usage,
+                        "response_time": end_time - start_time,
+                        "throttle_time": throttle_time,
+                        "attempts": attempt + 1,
+                        "model": model
+                    }
+                    if n > 1:
+                        result["responses"] = choices
+                    if use_cache:
+                        self.cache.put(cache_key, result)
+                    return result
+                
+                # Nothing was generated, so give the reserved tokens back
+                self.rate_limiter.settle(model, estimated_tokens, 0)
+                kind = classify_status(response.status_code)
+                error = f"API Error {response.status_code}: {response.text}"
+                
+                if response.status_code == 429 and retries_left:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    delay = retry_after if retry_after is not None else backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+                    # Pause the whole model so concurrent calls back off too
+                    self.rate_limiter.pause(model, delay)
+                    self.resilience.record_error(model, kind, retried=True, delay=delay)
+                    response.close()
+                    continue
+                response.close()
+                
+            except Exception as e:
+                end_time = time.time()
+                kind = classify_exception(e)
+                error = f"Request failed: {str(e)}"
+            
+            if kind == RETRYABLE and retries_left:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+                self.resilience.record_error(model, kind, retried=True, delay=delay)
+                time.sleep(delay)
+                continue
+            break
+        
+        self.resilience.record_error(model, kind, retried=False)
+        breaker.record_failure(trip=status_code in MODEL_UNAVAILABLE_STATUS_CODES)
+        return {
+            "success": False,
+            "error": error,
+            "error_kind": kind,
+            "response_time": end_time - start_time,
+            "throttle_time": throttle_time,
+            "attempts": attempt + 1,
+            "model": model
+        }
+    
+    def _send_job(self, job: PromptJob) -> Dict:
+        # Consistency mode samples at a higher temperature so repeated answers can differ
+        temperature = self.consistency_temperature if self.consistency_samples > 1 else None
+        return self.send_prompt(job.model, job.prompt, max_tokens=job.max_tokens,
+                                n=job.n, temperature=temperature, sample=job.sample)
+    
+    def connection_stats(self) -> Dict:
+        """
+        Report how many connections the session opened versus requests sent
+        
+        Returns:
+            Dict: Connections opened, requests sent and requests that reused a connection
+        """
+        connections = 0
+        requests_sent = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+        
+        return {
+            "connections_opened": connections,
+            "requests_sent": requests_sent,
+            "reused_connections": max(0, requests_sent - connections)
+        }
     
-    def test_basic_questions(self, data_str: str) -> List[LLMResponse]:
+    def close(self):
         """
-        Test basic questions with multiple LLMs
+        Close the pooled HTTP session and the run journal
+        """
+        self.session.close()
+        if self.journal is not None:
+            self.journal.close()
+    
+    def question_jobs(self, data_str: str, tiers: Optional[List[str]] = None) -> List[PromptJob]:
+        """
+        Build the (model x question) matrix from the question suite
         
         Args:
             data_str (str): Formatted basketball data
+            tiers (List[str]): Only include these tiers, e.g. ["basic"] (default: all)
             
         Returns:
-            List[LLMResponse]: List of responses from different LLMs
+            List[PromptJob]: Jobs in catalog tier order
         """
-        basic_questions = [
-            {
-                "question": "How many players are on the Syracuse Women's Basketball team?",
-                "expected": "11 players",
-                "category": "basic_count"
-            },
-            {
-                "question": "How many games did the team play this season?",
-                "expected": "32 games",
-                "category": "basic_count"
-            },
-            {
-                "question": "Who is the leading scorer (highest points per game)?",
-                "expected": "Dyaisha Fair",
-                "category": "basic_ranking"
-            },
-            {
-                "question": "What position does the leading scorer play?",
-                "expected": "Guard (G)",
-                "category": "basic_position"
-            },
-            {
-                "question": "What was the team's overall record?",
-                "expected": "24-8",
-                "category": "basic_record"
-            }
-        ]
-        
-        models_to_test = [
-            LLMProvider.MISTRAL_7B.value,           # Cheapest: ~$0.0002 per 1K tokens
-            LLMProvider.LLAMA_3_70B.value,          # Cheapest: ~$0.0002 per 1K tokens
-            LLMProvider.GOOGLE_GEMINI_FLASH.value   # Very cheap: ~$0.0005 per 1K tokens
+        return build_matrix(self.suite, data_str, tiers)
+
+    def preflight(self, jobs: List[PromptJob]) -> List[PromptJob]:
+        """
+        Project the cost of a job matrix before sending it and apply the budget
+
+        Prompt tokens are counted locally and every reply is assumed to use
+        its full max_tokens (scaled by the policy's completion_ratio).
+
+        Args:
+            jobs (List[PromptJob]): Planned jobs
+
+        Returns:
+            List[PromptJob]: Jobs to send, with over-budget models downgraded
+
+        Raises:
+            BudgetExceededError: If the projection cannot be brought within budget
+        """
+        policy = self.budget or BudgetPolicy()
+        # Unpriced models project as free; they are reported and never used as a fallback
+        cost_fn = lambda model, prompt_tokens, completion_tokens: (
+            self.calculate_cost(model, prompt_tokens, completion_tokens) or 0.0)
+        models_by_price = sorted((p.value for p in LLMProvider
+                                  if self.pricing.rates(p.value) is not None and p.value not in self.excluded_models),
+                                 key=lambda m: cost_fn(m, 1000, 1000))
+
+        jobs, self.budget_report = enforce_budget(jobs, policy, self.count_tokens, cost_fn, models_by_price)
+        self.budget_report["tokenizer"] = self.tokenizer_name
+        self.budget_report["unpriced_models"] = sorted(
+            {job.model for job in jobs if self.pricing.rates(job.model) is None})
+
+        projection = self.budget_report["projection"]
+        print(f"  Projected: {len(jobs)} requests, {projection['total_tokens']:,} tokens, "
+              f"${projection['total_cost']:.4f} (tokenizer: {self.tokenizer_name})")
+        if self.budget_report["unpriced_models"]:
+            print(f"  ⚠️ No pricing for: {', '.join(self.budget_report['unpriced_models'])}")
+        for downgrade in self.budget_report["downgrades"]:
+            print(f"  ⬇️ Over budget: moved {downgrade['requests']} requests from "
+                  f"{downgrade['from']} to {downgrade['to']}")
+        return jobs
+
+    def _make_responses(self, job: PromptJob, result: Dict) -> List[LLMResponse]:
+        # A request with n > 1 returns several completions; its usage is split evenly between them
+        usage = result.get("usage") or {}
+        texts = result.get("responses") or [result["response"]]
+        share = lambda total, i: None if total is None else total // len(texts) + (i < total % len(texts))
+        return [
+            LLMResponse(
+                provider=job.model.split('/')[0],
+                model=job.model,
+                prompt=job.question,
+                response=text,
+                response_time=result["response_time"],
+                tokens_used=share(usage.get("total_tokens", 0), i),
+                prompt_tokens=share(usage.get("prompt_tokens"), i),
+                completion_tokens=share(usage.get("completion_tokens"), i),
+                category=job.category,
+                answer_id=job.answer_id,
+                sample=job.sample + i,
+                throttle_time=result.get("throttle_time"),
+                cached=result.get("cached", False),
+                batch_id=result.get("batch_id"),
+                batch_size=result.get("batch_size"),
+                time_to_first_token=result.get("time_to_first_token"),
+                inter_token_latency=result.get("inter_token_latency"),
+                tokens_per_second=result.get("tokens_per_second"),
+                stopped_early=result.get("stopped_early", False)
+            )
+            for i, text in enumerate(texts)
         ]
+    
+    def _observe(self, response: LLMResponse):
+        # Feed the early-stopping scheduler; correctness uses the same 0.5 cut as evaluate_accuracy
+        if self.scheduler is None:
+            return
+        correct = None
+        if response.answer_id is not None and self.answer_key:
+            accuracy = matcher_for(self.answer_key).score([response.response], [response.answer_id])["accuracy"][0]
+            if accuracy == accuracy:  # NaN: no answer key entry for this question
+                correct = bool(accuracy > 0.5)
+        self.scheduler.record(response.model, correct, response.response_time)
+    
+    def dispatch_outcomes(self, jobs: List[PromptJob]) -> List[Tuple[PromptJob, Dict, List[LLMResponse]]]:
+        """
+        Send prompt jobs and pair each job with its API result and priced responses
         
-        responses = []
+        In concurrent mode the whole batch is in flight at once, limited to
+        max_concurrency_per_model open requests per model. With batch_size
+        above 1, questions sharing a model and context are packed into one
+        request and the reply is split back per question. Each successful
+        response is appended to the run journal as soon as it lands.
         
-        for model in models_to_test:
-            print(f"\nTesting {model} with basic questions...")
+        Args:
+            jobs (List[PromptJob]): Jobs to send
             
-            for q in basic_questions:
-                full_prompt = f"{data_str}\n\nQuestion: {q['question']}\n\nPlease provide a clear, concise answer based on the data provided."
-                
-                result = self.send_prompt(model, full_prompt)
-                
-                if result["success"]:
-                    tokens_used = result["usage"].get("total_tokens", 0) if "usage" in result else 0
-                    cost = self.calculate_cost(model, tokens_used)
-                    
-                    response = LLMResponse(
-                        provider=model.split('/')[0],
-                        model=model,
-                        prompt=q['question'],
-                        response=result["response"],
-                        response_time=result["response_time"],
-                        tokens_used=tokens_used,
-                        cost=cost
-                    )
-                    responses.append(response)
-                    print(f"✓ {q['question'][:50]}... - {result['response_time']:.2f}s - ${cost:.4f}")
+        Returns:
+            List[Tuple[PromptJob, Dict, List[LLMResponse]]]: (job, result, responses) in job order;
+                responses is empty for failed or skipped jobs
+        """
+        batches = plan_batches(jobs, max(1, self.batch_size), self.max_batch_tokens)
+        batch_for = {id(batch.job): batch for batch in batches}
+        member_outcomes = {}
+        skip_fn = self.scheduler.skip_reason if self.scheduler is not None else None
+        
+        def land(batch_job: PromptJob, result: Dict):
+            # Split a batched reply back per question; journal and score each answer as it arrives
+            for member, member_result in expand_batch_result(batch_for[id(batch_job)], result):
+                member_responses = self._make_responses(member, member_result) if member_result["success"] else []
+                for response in member_responses:
+                    if self.journal is not None:
+                        self.journal.append(sample_key(member.cell_id or cell_id(member), response.sample),
+                                            asdict(response))
+                    self._observe(response)
+                member_outcomes[id(member)] = (member_result, member_responses)
+        
+        if self.concurrent:
+            self.dispatcher.run([batch.job for batch in batches], on_result=land, skip_fn=skip_fn)
+        else:
+            for batch in batches:
+                reason = skip_fn(batch.job) if skip_fn is not None else None
+                if reason:
+                    land(batch.job, {"success": False, "skipped": True, "error": reason,
+                                     "model": batch.job.model})
                 else:
-                    print(f"✗ Error with {model}: {result['error']}")
-                
-                time.sleep(1)  # Rate limiting
+                    land(batch.job, self._send_job(batch.job))
         
-        return responses
+        outcomes = [(job,) + member_outcomes[id(job)] for job in jobs]
+        
+        # Price the whole batch in one vectorized pass
+        account_costs([response for _, _, member_responses in outcomes for response in member_responses],
+                      self.pricing)
+        return outcomes
     
-    def test_intermediate_questions(self, data_str: str) -> List[LLMResponse]:
+    def print_outcomes(self, outcomes: List[Tuple[PromptJob, Dict, List[LLMResponse]]]):
         """
-        Test intermediate questions requiring analysis
+        Print one line per job
         
         Args:
-            data_str (str): Formatted basketball data
-            
-        Returns:
-            List[LLMResponse]: List of responses from different LLMs
+            outcomes (List[Tuple[PromptJob, Dict, List[LLMResponse]]]): Output of dispatch_outcomes()
         """
-        intermediate_questions = [
-            {
-                "question": "Who are the top 3 scorers by points per game? List them in order.",
-                "category": "ranking_analysis"
-            },
-            {
-                "question": "Which position (Guard, Forward, Center) has the highest average points per game?",
-                "category": "position_analysis"
-            },
-            {
-                "question": "Who has the most rebounds per game and what is their position?",
-                "category": "statistical_analysis"
-            },
-            {
-                "question": "Which player has the highest field goal percentage (minimum 50 attempts)?",
-                "category": "efficiency_analysis"
-            }
-        ]
-        
-        models_to_test = [
-            LLMProvider.MISTRAL_7B.value,           # Cheapest: ~$0.0002 per 1K tokens
-            LLMProvider.GOOGLE_GEMINI_FLASH.value,  # Very cheap: ~$0.0005 per 1K tokens
-            LLMProvider.OPENAI_GPT35.value          # Affordable: ~$0.0015 per 1K tokens
-        ]
+        for job, result, member_responses in outcomes:
+            if member_responses:
+                response = member_responses[0]
+                cached_note = " (cached)" if response.cached else ""
+                if len(member_responses) > 1:
+                    cached_note += f" (x{len(member_responses)} samples)"
+                if response.time_to_first_token is not None:
+                    cached_note += f" (TTFT {response.time_to_first_token:.2f}s)"
+                costs = [r.cost for r in member_responses if r.cost is not None]
+                cost_note = f"${sum(costs):.4f}" if costs else "unpriced"
+                print(f"✓ [{job.model}] {job.question[:50]}... - {result['response_time']:.2f}s{cached_note} - {cost_note}")
+            elif result.get("skipped"):
+                print(f"⏭️ Skipped [{job.model}] {job.question[:50]}... - {result['error']}")
+            else:
+                print(f"✗ Error with {job.model}: {result['error']}")
+    
+    def run_jobs(self, jobs: List[PromptJob]) -> List[LLMResponse]:
+        """
+        Send a batch of prompt jobs and collect successful responses
         
-        responses = []
+        See dispatch_outcomes() for how jobs are sent.
         
-        for model in models_to_test:
-            print(f"\nTesting {model} with intermediate questions...")
+        Args:
+            jobs (List[PromptJob]): Jobs to send
             
-            for q in intermediate_questions:
-                full_prompt = f"{data_str}\n\nQuestion: {q['question']}\n\nPlease analyze the data and provide a detailed answer with reasoning."
-                
-                result = self.send_prompt(model, full_prompt, max_tokens=1000)
-                
-                if result["success"]:
-                    tokens_used = result["usage"].get("total_tokens", 0) if "usage" in result else 0
-                    cost = self.calculate_cost(model, tokens_used)
-                    
-                    response = LLMResponse(
-                        provider=model.split('/')[0],
-                        model=model,
-                        prompt=q['question'],
-                        response=result["response"],
-                        response_time=result["response_time"],
-                        tokens_used=tokens_used,
-                        cost=cost
-                    )
-                    responses.append(response)
-                    print(f"✓ {q['question'][:50]}... - {result['response_time']:.2f}s - ${cost:.4f}")
-                else:
-                    print(f"✗ Error with {model}: {result['error']}")
-                
-                time.sleep(1)
+        Returns:
+            List[LLMResponse]: Successful responses in job order
+        """
+        outcomes = self.dispatch_outcomes(jobs)
+        self.record_unanswered(outcomes)
+        if self.verbose:
+            self.print_outcomes(outcomes)
+        return [response for _, _, member_responses in outcomes for response in member_responses]
+    
+    def record_unanswered(self, outcomes: List[Tuple[PromptJob, Dict, List[LLMResponse]]]):
+        """
+        Keep the usage of billed requests that produced no response (a batch reply with no answer found)
         
-        return responses
+        Args:
+            outcomes (List[Tuple[PromptJob, Dict, List[LLMResponse]]]): Output of dispatch_outcomes()
+        """
+        for job, result, member_responses in outcomes:
+            usage = result.get("usage")
+            if not member_responses and usage:
+                self.unanswered_usage.append({"model": job.model, "prompt_tokens": usage.get("prompt_tokens", 0),
+                                              "completion_tokens": usage.get("completion_tokens", 0),
+                                              "total_tokens": usage.get("total_tokens", 0)})
     
-    def test_advanced_questions(self, data_str: str) -> List[LLMResponse]:
+    def account_unanswered(self):
+        """
+        Add the cost and tokens of unanswered but billed requests to the cost summary
         """
-        Test advanced questions requiring complex analysis
+        tokens, cost = 0, 0.0
+        for usage in self.unanswered_usage:
+            usage_cost = self.calculate_cost(usage["model"], usage["prompt_tokens"], usage["completion_tokens"])
+            tokens += usage["total_tokens"]
+            cost += usage_cost or 0.0
+            if usage_cost is not None:
+                by_model = self.cost_summary["by_model"]
+                by_model[usage["model"]] = (by_model.get(usage["model"]) or 0.0) + usage_cost
+        self.cost_summary["total_cost"] += cost
+        self.cost_summary["unanswered_tokens"] = tokens
+        self.cost_summary["unanswered_cost"] = cost
+    
+    def test_questions(self, data_str: str, tiers: Optional[List[str]] = None) -> List[LLMResponse]:
+        """
+        Test the question suite (or some of its tiers) with every listed model
         
         Args:
             data_str (str): Formatted basketball data
+            tiers (List[str]): Only run these tiers (default: all)
             
         Returns:
             List[LLMResponse]: List of responses from different LLMs
         """
-        advanced_questions = [
-            {
-                "question": "Define a methodology to identify the 'most improved player' for this team. What metrics would you use and who would you select?",
-                "category": "methodology_development"
-            },
-            {
-                "question": "As a coach, if you wanted to win 2 more games next season, should you focus on improving offense or defense? Justify your answer using the data.",
-                "category": "strategic_analysis"
-            },
-            {
-                "question": "Which ONE player should you work with most closely to be a 'game changer' and why? What specific aspects should you focus on?",
-                "category": "coaching_decision"
-            }
-        ]
-        
-        models_to_test = [
-            LLMProvider.MISTRAL_7B.value,           # Cheapest: ~$0.0002 per 1K tokens
-            LLMProvider.GOOGLE_GEMINI_FLASH.value,  # Very cheap: ~$0.0005 per 1K tokens
-            LLMProvider.OPENAI_GPT35.value          # Affordable: ~$0.0015 per 1K tokens
-        ]
-        
-        responses = []
-        
-        for model in models_to_test:
-            print(f"\nTesting {model} with advanced questions...")
-            
-            for q in advanced_questions:
-                full_prompt = f"{data_str}\n\nQuestion: {q['question']}\n\nPlease provide a comprehensive analysis with clear reasoning and methodology."
-                
-                result = self.send_prompt(model, full_prompt, max_tokens=1500)
-                
-                if result["success"]:
-                    tokens_used = result["usage"].get("total_tokens", 0) if "usage" in result else 0
-                    cost = self.calculate_cost(model, tokens_used)
-                    
-                    response = LLMResponse(
-                        provider=model.split('/')[0],
-                        model=model,
-                        prompt=q['question'],
-                        response=result["response"],
-                        response_time=result["response_time"],
-                        tokens_used=tokens_used,
-                        cost=cost
-                    )
-                    responses.append(response)
-                    print(f"✓ {q['question'][:50]}... - {result['response_time']:.2f}s - ${cost:.4f}")
-                else:
-                    print(f"✗ Error with {model}: {result['error']}")
-                
-                time.sleep(1)
-        
-        return responses
+        return self.run_jobs(self.question_jobs(data_str, tiers))
     
-    def evaluate_accuracy(self, responses: List[LLMResponse]) -> Dict:
+    def evaluate_accuracy(self, responses: List[LLMResponse],
+                          scores: Optional[Dict[str, np.ndarray]] = None) -> Dict:
         """
         Evaluate accuracy of responses against expected answers
         
         Args:
-            responses (List[LLMResponse]): List of responses to evaluate
+            responses (ResponseStore | List[LLMResponse]): Responses to evaluate
+            scores (Dict[str, np.ndarray]): Precomputed AnswerMatcher.score() output for these
+                responses, e.g. merged from worker processes (scored here if None)
             
         Returns:
             Dict: Accuracy evaluation results
         """
-        # Define expected answers for basic questions
-        expected_answers = {
-            "How many players are on the Syracuse Women's Basketball team?": "11",
-            "How many games did the team play this season?": "32",
-            "Who is the leading scorer (highest points per game)?": "Dyaisha Fair",
-            "What position does the leading scorer play?": "Guard",
-            "What was the team's overall record?": "24-8"
-        }
+        # Score every response against the dataset-derived answer key in one pass
+        if scores is None:
+            columns = columns_of(responses, ["model", "answer_id", "response"])
+            scores = matcher_for(self.answer_key).score(list(columns["response"]), list(columns["answer_id"]))
+        else:
+            columns = columns_of(responses, ["model", "answer_id"])
+        answer_ids = list(columns["answer_id"])
+        self.question_accuracy = question_report(answer_ids, scores)
+        assign_column(responses, "accuracy_score", scores["accuracy"])
         
-        evaluation_results = {}
+        # Per-model tallies; NaN means no answer key entry for the question
+        accuracy = scores["accuracy"]
+        scored = ~np.isnan(accuracy)
+        codes, models = pd.factorize(pd.Series(columns["model"], dtype=object)[scored])
+        totals = np.bincount(codes, minlength=len(models))
+        correct = np.bincount(codes, weights=accuracy[scored] > 0.5, minlength=len(models))
+        return {
+            model: {"correct": int(correct[i]), "total": int(totals[i]), "accuracy": correct[i] / totals[i]}
+            for i, model in enumerate(models)
+        }
+    
+    def consistency_report(self, responses: List[LLMResponse]) -> List[Dict]:
+        """
+        Agreement, answer entropy and latency variance per (model, question) cell
         
-        for response in responses:
-            if response.prompt in expected_answers:
-                expected = expected_answers[response.prompt].lower()
-                actual = response.response.lower()
-                
-                # Simple keyword matching for accuracy
-                if expected in actual:
-                    accuracy = 1.0
-                elif any(word in actual for word in expected.split()):
-                    accuracy = 0.7
-                else:
-                    accuracy = 0.0
-                
-                response.accuracy_score = accuracy
-                
-                if response.model not in evaluation_results:
-                    evaluation_results[response.model] = {"correct": 0, "total": 0, "accuracy": 0.0}
-                
-                evaluation_results[response.model]["total"] += 1
-                if accuracy > 0.5:
-                    evaluation_results[response.model]["correct"] += 1
-        
-        # Calculate overall accuracy for each model
-        for model in evaluation_results:
-            if evaluation_results[model]["total"] > 0:
-                evaluation_results[model]["accuracy"] = (
-                    evaluation_results[model]["correct"] / evaluation_results[model]["total"]
-                )
+        Args:
+            responses (ResponseStore | List[LLMResponse]): Responses, several samples per cell
+            
+        Returns:
+            List[Dict]: One entry per cell (see consistency.consistency_report)
+        """
+        columns = columns_of(responses, ["model", "prompt", "response", "answer_id", "response_time",
+                                         "accuracy_score"])
+        matcher = matcher_for(self.answer_key)
+        return consistency_report(
+            columns["model"], columns["prompt"],
+            matcher.extract(list(columns["response"]), list(columns["answer_id"])),
+            columns["response_time"], columns["accuracy_score"])
+    
+    def models_tested(self) -> List[str]:
+        """
+        Models with at least one collected response
         
-        return evaluation_results
+        Returns:
+            List[str]: Model identifiers, sorted
+        """
+        return sorted(m for m in set(columns_of(self.responses, ["model"])["model"]) if m is not None)
     
     def export_results(self, filename: str = "results/llm_testing_results.json"):
         """
         Export all testing results to JSON file
         
+        Response rows are written one at a time from the columnar store rather
+        than built into a list first.
+        
         Args:
             filename (str): Output filename
         """
-        # Convert responses to dictionaries
-        response_data = []
-        for response in self.responses:
-            response_data.append({
-                "provider": response.provider,
-                "model": response.model,
-                "prompt": response.prompt,
-                "response": response.response,
-                "accuracy_score": response.accuracy_score,
-                "response_time": response.response_time,
-                "tokens_used": response.tokens_used,
-                "cost": response.cost,
-                "timestamp": response.timestamp
-            })
-        
         # Create results summary
         results_summary = {
             "test_date": datetime.now().isoformat(),
             "dataset": "Syracuse Women's Basketball 2023-24",
             "total_responses": len(self.responses),
-            "models_tested": list(set([r.model for r in self.responses])),
-            "responses": response_data,
-            "evaluation": self.test_results
+            "models_tested": self.models_tested(),
+            "responses": _RESPONSES_PLACEHOLDER,
+            "evaluation": self.test_results,
+            "answer_key": self.answer_key,
+            "early_stopping": self.scheduler.summary() if self.scheduler is not None else None,
+            "health_probe": {
+                "probed_at": self.baseline["probed_at"],
+                "excluded_models": self.excluded_models,
+                "concurrency": self.dispatcher.model_concurrency
+            } if self.baseline else None,
+            "consistency": self.consistency,
+            "question_accuracy": self.question_accuracy,
+            "rate_limiting": self.rate_limiter.stats(),
+            "connections": self.connection_stats(),
+            "cache": self.cache.stats(),
+            "data_encoding": self.data_encoding,
+            "resilience": self.resilience.summary(),
+            "budget": self.budget_report,
+            "pricing": dict(self.pricing.summary(), **self.cost_summary),
+            "metrics": self.metrics
         }
         
         # Ensure results directory exists
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
+        # Responses stream straight from the store into the placeholder's spot
+        head, tail = json.dumps(results_summary, indent=2).split(json.dumps(_RESPONSES_PLACEHOLDER), 1)
         with open(filename, 'w') as f:
-            json.dump(results_summary, f, indent=2)
+            f.write(head)
+            self.responses.write_json_array(f)
+            f.write(tail)
         
         print(f"\nResults exported to {filename}")
     
-    def run_comprehensive_test(self):
+    def run_comprehensive_test(self, data_path: str = "data/syracuse_womens_basketball_2023_24.csv",
+                               results_path: str = "results/llm_testing_results.json",
+                               metrics_path: Optional[str] = None, resume: bool = False):
         """
         Run comprehensive testing across all question types and models
+        
+        Args:
+            data_path (str): Path to the basketball dataset
+            results_path (str): Where to write the JSON results
+            metrics_path (str): Where to write the standalone metrics file
+                (defaults to llm_metrics.json next to results_path)
+            resume (bool): Restore cells already in the run journal and only send the rest
         """
         print("🏀 Syracuse Women's Basketball LLM Testing Framework")
         print("=" * 60)
         
         # Load basketball data
         print("\n1. Loading basketball dataset...")
-        data_str = self.load_basketball_data()
+        data_str = self.load_basketball_data(data_path)
         if not data_str:
             print("❌ Failed to load basketball data")
             return
         
         print("✅ Basketball data loaded successfully")
-        
-        # Test basic questions
-        print("\n2. Testing basic questions...")
-        basic_responses = self.test_basic_questions(data_str)
-        self.responses.extend(basic_responses)
-        
-        # Test intermediate questions
-        print("\n3. Testing intermediate questions...")
-        intermediate_responses = self.test_intermediate_questions(data_str)
-        self.responses.extend(intermediate_responses)
-        
-        # Test advanced questions
-        print("\n4. Testing advanced questions...")
-        advanced_responses = self.test_advanced_questions(data_str)
-        self.responses.extend(advanced_responses)
+
+        jobs = self.question_jobs(data_str)
+        if self.excluded_models:
+            jobs = [job for job in jobs if job.model not in self.excluded_models]
+            print(f"  Excluded after failing the health probe ({self.baseline['probed_at']}): "
+                  f"{', '.join(self.excluded_models)}")
+        for job in jobs:
+            # Fix each cell's id before pre-flight can move it to a cheaper model
+            job.cell_id = cell_id(job)
+        jobs = expand_samples(jobs, self.consistency_samples, max_n=self.max_samples_per_request)
+        if self.journal is not None and resume:
+            completed = self.journal.load()
+            response_fields = {f.name for f in fields(LLMResponse)}
+            restored, remaining = [], []
+            for job in jobs:
+                keys = [sample_key(job.cell_id, sample) for sample in range(job.sample, job.sample + job.n)]
+                if all(key in completed for key in keys):
+                    restored.extend(LLMResponse(**{k: v for k, v in completed[key].items() if k in response_fields})
+                                    for key in keys)
+                else:
+                    remaining.append(job)
+            jobs = remaining
+            self.responses.extend(restored)
+            for response in restored:
+                self._observe(response)
+            print(f"  Resuming from {self.journal.path}: {len(restored)} responses restored, "
+                  f"{len(jobs)} requests left")
+        elif self.journal is not None:
+            self.journal.reset()
+        elif resume:
+            print("  ⚠️ No run journal configured; running the full matrix")
+
+        # Project the cost of the whole matrix before anything is sent
+        print("\n   Pre-flight cost projection...")
+        try:
+            jobs = self.preflight(jobs)
+        except BudgetExceededError as e:
+            print(f"❌ Aborting before dispatch: {e}")
+            return
+
+        tier_names = ", ".join(tier.name for tier in self.suite)
+        if self.concurrent:
+            # Dispatch the whole (model x question) matrix at once
+            print(f"\n2-4. Testing {len(jobs)} prompts ({tier_names}) concurrently...")
+        else:
+            print(f"\n2-4. Testing {len(jobs)} prompts ({tier_names})...")
+        self.responses.extend(self.run_jobs(jobs))
         
         # Evaluate accuracy
         print("\n5. Evaluating accuracy...")
         self.test_results = self.evaluate_accuracy(self.responses)
+        if self.consistency_samples > 1:
+            self.consistency = self.consistency_report(self.responses)
+        
+        # Price all responses in one pass, then aggregate latency, token and cost distributions
+        self.cost_summary = account_costs(self.responses, self.pricing)
+        self.account_unanswered()
+        self.metrics = build_metrics(self.responses)
         
         # Export results
         print("\n6. Exporting results...")
-        self.export_results()
+        self.export_results(results_path)
+        metrics_path = metrics_path or os.path.join(os.path.dirname(results_path), "llm_metrics.json")
+        export_metrics(self.metrics, metrics_path)
+        print(f"Metrics exported to {metrics_path}")
         
         # Print summary
         print("\n" + "=" * 60)
         print("📊 TESTING SUMMARY")
         print("=" * 60)
         
-        total_cost = sum(r.cost for r in self.responses if r.cost is not None)
-        total_tokens = sum(r.tokens_used for r in self.responses if r.tokens_used is not None)
+        total_cost = self.cost_summary["total_cost"]
+        total_tokens = int(np.nansum(np.asarray(columns_of(self.responses, ["tokens_used"])["tokens_used"], dtype=float)))
+        total_tokens += self.cost_summary["unanswered_tokens"]
         
         print(f"\n💰 COST SUMMARY:")
         print(f"  Total Cost: ${total_cost:.4f}")
         print(f"  Total Tokens: {total_tokens:,}")
-        print(f"  Average Cost per Response: ${total_cost/len(self.responses):.4f}")
+        if self.cost_summary["unanswered_tokens"]:
+            print(f"  Billed Without an Answer: {self.cost_summary['unanswered_tokens']:,} tokens, "
+                  f"${self.cost_summary['unanswered_cost']:.4f} (batch replies that could not be split)")
+        if len(self.responses):
+            print(f"  Average Cost per Response: ${total_cost/len(self.responses):.4f}")
+        if self.budget_report:
+            print(f"  Projected Cost (pre-flight): ${self.budget_report['projection']['total_cost']:.4f}")
+        print(f"  Pricing Table: {self.pricing.version}")
+        if self.cost_summary["unknown_models"]:
+            print(f"  ⚠️ Not priced (missing from pricing table): {', '.join(self.cost_summary['unknown_models'])}")
         
         print(f"\n📈 ACCURACY BY MODEL:")
         for model, results in self.test_results.items():
             print(f"\n{model}:")
             print(f"  Accuracy: {results['accuracy']:.1%} ({results['correct']}/{results['total']})")
+
+        print(f"\n🎯 ACCURACY BY QUESTION (accuracy / precision / recall):")
+        for answer_id, report in self.question_accuracy.items():
+            precision = f"{report['precision']:.1%}" if report["precision"] is not None else "n/a"
+            print(f"  {answer_id}: {report['accuracy']:.1%} / {precision} / {report['recall']:.1%} "
+                  f"({report['responses']} responses)")
+
+        if self.consistency:
+            print(f"\n🔁 CONSISTENCY ({self.consistency_samples} samples per cell, "
+                  f"temperature {self.consistency_temperature}):")
+            report = pd.DataFrame(self.consistency)
+            for model, cells in report.groupby("model", sort=True):
+                print(f"  {model}: mean agreement {cells['agreement'].mean():.0%}, "
+                      f"mean entropy {cells['entropy'].mean():.2f} bits, "
+                      f"{(cells['agreement'] < 1).sum()}/{len(cells)} questions with disagreeing samples")
+
+        if self.scheduler is not None:
+            print(f"\n🚦 EARLY STOPPING (accuracy bar {self.scheduler.policy.min_accuracy:.0%}):")
+            for model, state in self.scheduler.summary().items():
+                accuracy = f"{state['accuracy']:.0%}" if state["accuracy"] is not None else "n/a"
+                print(f"  {model}: {accuracy} of {state['scored']} scored "
+                      f"({self.scheduler.policy.confidence:.0%} CI {state['accuracy_low']:.0%}-{state['accuracy_high']:.0%}), "
+                      f"{state['decision'] or 'undecided'}, {state['skipped_requests']} requests skipped")
+
+        print(f"\n⏱️ LATENCY BY MODEL (p50 / p90 / p99 / max):")
+        for model, model_metrics in self.metrics["by_model"].items():
+            latency = model_metrics["response_time"]
+            if latency["count"]:
+                print(f"  {model}: {latency['p50']:.2f}s / {latency['p90']:.2f}s / "
+                      f"{latency['p99']:.2f}s / {latency['max']:.2f}s (stddev {latency['stddev']:.2f}s)")
+        
+        print(f"\n⏱️ RATE LIMITING:")
+        for model, stats in self.rate_limiter.stats().items():
+            print(f"  {model}: {stats['throttled_requests']}/{stats['requests']} requests throttled, "
+                  f"{stats['throttle_time']:.2f}s waiting, {stats['retry_after_events']} Retry-After pauses")
+        
+        connections = self.connection_stats()
+        print(f"\n🔌 CONNECTIONS:")
+        print(f"  {connections['connections_opened']} opened for {connections['requests_sent']} requests "
+              f"({connections['reused_connections']} reused a keep-alive connection)")
+        
+        cache_stats = self.cache.stats()
+        print(f"\n🗄️ RESPONSE CACHE:")
+        if cache_stats["enabled"]:
+            print(f"  {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                  f"({cache_stats['hit_rate']:.1%} hit rate), {cache_stats['evictions']} evictions")
+        else:
+            print("  Bypassed")
+        
+        print(f"\n🛡️ RESILIENCE:")
+        for model, stats in self.resilience.summary().items():
+            print(f"  {model}: {stats['retries']} retries, {stats['retryable_errors']} retryable / "
+                  f"{stats['fatal_errors']} fatal errors, breaker {stats['breaker_state']} "
+                  f"({stats['breaker_trips']} trips, {stats['skipped_requests']} skipped)")
         
         print(f"\n📊 RESPONSE SUMMARY:")
         print(f"  Total responses collected: {len(self.responses)}")
-        print(f"  Models tested: {len(set(r.model for r in self.responses))}")
-        print("  Results saved to results/llm_testing_results.json")
+        print(f"  Models tested: {len(self.models_tested())}")
+        print(f"  Results saved to {results_path}")
 
 def main():
     """
     Main function to run LLM testing
     """
+    parser = argparse.ArgumentParser(description="Test LLMs on the Syracuse Women's Basketball dataset")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip requests already recorded in the run journal")
+    parser.add_argument("--journal", default="results/llm_run_journal.jsonl",
+                        help="Append-only journal of completed requests")
+    args = parser.parse_args()
+    
     # Get API key from environment variable
     api_key = os.getenv("OPENROUTER_API_KEY")
     
@@ -559,10 +1031,15 @@ def main():
         return
     
     # Initialize tester
-    tester = LLMTester(api_key)
+    tester = LLMTester(api_key, journal_path=args.journal)
     
     # Run comprehensive test
-    tester.run_comprehensive_test()
+    try:
+        tester.run_comprehensive_test(resume=args.resume)
+    except KeyboardInterrupt:
+        print(f"\n⏹️ Interrupted; completed requests are saved in {args.journal}. Rerun with --resume to continue.")
+    finally:
+        tester.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Latency, Token and Cost Metrics
+For Task 05: Descriptive Statistics and Large Language Models
+
+Aggregates LLM responses into per-model and per-category distributions
+(p50/p90/p99, max, standard deviation and fixed-bucket histograms). Metrics
+are written to a standalone JSON file so runs can be compared.
+
+Usage:
+    python3 scripts/metrics.py results/llm_metrics_old.json results/llm_metrics.json
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from response_store import columns_of
+
+# Fixed histogram bucket upper bounds so histograms line up across runs
+RESPONSE_TIME_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, float("inf")]
+TOKEN_BUCKETS = [250, 500, 1000, 2000, 4000, 8000, float("inf")]
+COST_BUCKETS = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, float("inf")]
+
+METRIC_COLUMNS = {
+    "response_time": RESPONSE_TIME_BUCKETS,
+    "tokens_used": TOKEN_BUCKETS,
+    "cost": COST_BUCKETS,
+    "time_to_first_token": RESPONSE_TIME_BUCKETS,
+}
+
+
+def summarize(values: np.ndarray, buckets: Optional[List[float]] = None) -> Dict:
+    """
+    Distribution summary of one metric
+
+    Args:
+        values (np.ndarray): Observations (NaNs are ignored)
+        buckets (List[float]): Histogram bucket upper bounds
+
+    Returns:
+        Dict: Count, mean, stddev, min, p50, p90, p99, max and histogram
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return {"count": 0}
+
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    summary = {
+        "count": int(values.size),
+        "mean": float(values.mean()),
+        "stddev": float(values.std(ddof=1)) if values.size > 1 else 0.0,
+        "min": float(values.min()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(values.max())
+    }
+    if buckets:
+        counts = np.bincount(np.searchsorted(buckets, values, side="left"), minlength=len(buckets))
+        summary["histogram"] = {
+            (f">{buckets[i - 1]:g}" if bound == float("inf") else f"<={bound:g}"): int(count)
+            for i, (bound, count) in enumerate(zip(buckets, counts))
+        }
+    return summary
+
+
+def _group_metrics(frame: pd.DataFrame, key) -> Dict:
+    grouped = {}
+    for name, group in frame.groupby(key, sort=True, dropna=False):
+        label = "|".join(str(n) for n in name) if isinstance(name, tuple) else str(name)
+        grouped[label] = {
+            column: summarize(group[column].to_numpy(dtype=float), buckets)
+            for column, buckets in METRIC_COLUMNS.items()
+        }
+    return grouped
+
+
+def build_metrics(responses: List) -> Dict:
+    """
+    Aggregate responses into per-model, per-category and per-cell distributions
+
+    Cached responses count towards token and cost metrics but not latency.
+
+    Args:
+        responses (ResponseStore | List[LLMResponse]): Collected responses
+
+    Returns:
+        Dict: Metrics document (overall, by_model, by_category, by_model_category)
+    """
+    columns = columns_of(responses, ["model", "category", "cached", *METRIC_COLUMNS])
+    frame = pd.DataFrame({
+        "model": pd.Series(columns["model"], dtype=object),
+        "category": pd.Series(columns["category"], dtype=object).fillna("uncategorized"),
+        **{column: pd.to_numeric(pd.Series(columns[column], dtype=object), errors="coerce")
+           for column in METRIC_COLUMNS}
+    })
+    # Cache hits would drag latency percentiles towards zero
+    cached = np.asarray(columns["cached"], dtype=object).astype(bool) if len(frame) else np.zeros(0, dtype=bool)
+    frame.loc[cached, ["response_time", "time_to_first_token"]] = np.nan
+
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "total_responses": len(frame),
+        "overall": {column: summarize(frame[column].to_numpy(dtype=float), buckets)
+                    for column, buckets in METRIC_COLUMNS.items()},
+        "by_model": _group_metrics(frame, "model") if len(frame) else {},
+        "by_category": _group_metrics(frame, "category") if len(frame) else {},
+        "by_model_category": _group_metrics(frame, ["model", "category"]) if len(frame) else {}
+    }
+
+
+def export_metrics(metrics: Dict, filename: str = "results/llm_metrics.json"):
+    """
+    Write a metrics document to JSON
+
+    Args:
+        metrics (Dict): Output of build_metrics()
+        filename (str): Output filename
+    """
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(filename, "w") as f:
+        json.dump(metrics, f, indent=2)
+
+
+def compare_metrics(baseline: Dict, current: Dict, metric: str = "response_time") -> Dict:
+    """
+    Compare one metric's percentiles per model between two runs
+
+    Args:
+        baseline (Dict): Earlier metrics document
+        current (Dict): Later metrics document
+        metric (str): Metric to compare
+
+    Returns:
+        Dict: Per model, the baseline and current value and change for p50/p90/p99/max
+    """
+    comparison = {}
+    for model in sorted(set(baseline.get("by_model", {})) | set(current.get("by_model", {}))):
+        before = baseline.get("by_model", {}).get(model, {}).get(metric, {})
+        after = current.get("by_model", {}).get(model, {}).get(metric, {})
+        comparison[model] = {}
+        for stat in ("p50", "p90", "p99", "max"):
+            old, new = before.get(stat), after.get(stat)
+            comparison[model][stat] = {
+                "baseline": old,
+                "current": new,
+                "change": (new - old) if old is not None and new is not None else None,
+                "change_pct": ((new - old) / old) if old and new is not None else None
+            }
+    return comparison
+
+
+def main():
+    """
+    Compare two metrics files from the command line
+    """
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python3 scripts/metrics.py BASELINE.json CURRENT.json [metric]")
+        return
+
+    with open(sys.argv[1]) as f:
+        baseline = json.load(f)
+    with open(sys.argv[2]) as f:
+        current = json.load(f)
+    metric = sys.argv[3] if len(sys.argv) == 4 else "response_time"
+
+    print(f"📈 {metric} comparison: {sys.argv[1]} -> {sys.argv[2]}")
+    for model, stats in compare_metrics(baseline, current, metric).items():
+        print(f"\n{model}:")
+        for stat, values in stats.items():
+            if values["change"] is None:
+                print(f"  {stat}: {values['baseline']} -> {values['current']}")
+            else:
+                pct = f" ({values['change_pct']:+.1%})" if values["change_pct"] is not None else ""
+                print(f"  {stat}: {values['baseline']:.4g} -> {values['current']:.4g}{pct}")
+
+
+if __name__ == "__main__":
+    main()
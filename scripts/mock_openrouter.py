@@ -0,0 +1,288 @@
+"""
+Local Mock OpenRouter Server
+For Task 05: Descriptive Statistics and Large Language Models
+
+A stand-in for the OpenRouter /chat/completions endpoint, so the tester's own
+overhead can be benchmarked offline without spending money. It supports
+configurable latency distributions, error rates, streaming (SSE), several
+choices per request (`n`) and token usage reporting.
+
+Usage:
+    python3 scripts/mock_openrouter.py --port 8008 --latency lognormal --latency-mean 0.5
+    # then point LLMTester at base_url="http://127.0.0.1:8008/api/v1"
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from data_encoder import estimate_tokens
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+_BATCH_QUESTION = re.compile(r"^Question (\d+):", re.MULTILINE)
+
+
+class MockConfig:
+    """Behaviour of the mock endpoint"""
+
+    def __init__(self, latency: str = "lognormal", latency_mean: float = 0.5,
+                 latency_spread: float = 0.5, error_rate: float = 0.0,
+                 error_status: int = 502, rate_limit_rate: float = 0.0,
+                 completion_tokens: int = 60, stream_tokens_per_second: float = 200.0,
+                 seed: Optional[int] = None):
+        """
+        Initialize the mock configuration
+
+        Args:
+            latency (str): "fixed", "uniform", "normal" or "lognormal"
+            latency_mean (float): Mean (median for lognormal) time to respond in seconds
+            latency_spread (float): Half-width (uniform), std dev (normal) or sigma (lognormal)
+            error_rate (float): Fraction of requests answered with error_status
+            error_status (int): HTTP status used for injected errors
+            rate_limit_rate (float): Fraction of requests answered with 429 and Retry-After
+            completion_tokens (int): Completion tokens per answer (capped by max_tokens)
+            stream_tokens_per_second (float): Token rate when streaming
+            seed (int): Random seed for reproducible runs
+        """
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{latency}', expected one of {LATENCY_DISTRIBUTIONS}")
+
+        self.latency = latency
+        self.latency_mean = latency_mean
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit_rate = rate_limit_rate
+        self.completion_tokens = completion_tokens
+        self.stream_tokens_per_second = stream_tokens_per_second
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample_latency(self) -> float:
+        """
+        Draw one response latency
+
+        Returns:
+            float: Seconds before the first byte is sent
+        """
+        with self._lock:
+            if self.latency == "fixed":
+                value = self.latency_mean
+            elif self.latency == "uniform":
+                value = self._rng.uniform(self.latency_mean - self.latency_spread,
+                                          self.latency_mean + self.latency_spread)
+            elif self.latency == "normal":
+                value = self._rng.gauss(self.latency_mean, self.latency_spread)
+            else:
+                value = self._rng.lognormvariate(math.log(max(self.latency_mean, 1e-6)), self.latency_spread)
+        return max(0.0, value)
+
+    def sample_outcome(self) -> str:
+        """
+        Decide whether a request succeeds, errors or is rate limited
+
+        Returns:
+            str: "ok", "error" or "rate_limited"
+        """
+        with self._lock:
+            draw = self._rng.random()
+        if draw < self.rate_limit_rate:
+            return "rate_limited"
+        if draw < self.rate_limit_rate + self.error_rate:
+            return "error"
+        return "ok"
+
+
+def _mock_answer(prompt: str, completion_tokens: int) -> str:
+    """Build a reply, with one numbered section per question for batched prompts"""
+    filler = " ".join(["mock"] * max(1, completion_tokens - 4))
+    questions = _BATCH_QUESTION.findall(prompt)
+    if len(questions) > 1:
+        per_answer = " ".join(["mock"] * max(1, completion_tokens // len(questions)))
+        return "\n".join(f"### Answer {n}\n{per_answer}" for n in questions)
+    return f"Mock answer: {filler}"
+
+
+class MockOpenRouterHandler(BaseHTTPRequestHandler):
+    """Request handler implementing POST .../chat/completions"""
+
+    protocol_version = "HTTP/1.1"
+    config = MockConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_chunk(self, text: str):
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON"}})
+            return
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"No route for {self.path}"}})
+            return
+
+        config = self.config
+        time.sleep(config.sample_latency())
+
+        outcome = config.sample_outcome()
+        if outcome == "rate_limited":
+            self._send_json(429, {"error": {"message": "Rate limit exceeded"}}, {"Retry-After": "1"})
+            return
+        if outcome == "error":
+            self._send_json(config.error_status, {"error": {"message": "Injected mock error"}})
+            return
+
+        prompt = " ".join(m.get("content", "") for m in payload.get("messages", []))
+        completion_tokens = min(config.completion_tokens, payload.get("max_tokens") or config.completion_tokens)
+        answer = _mock_answer(prompt, completion_tokens)
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(answer)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+        model = payload.get("model", "mock/model")
+
+        if not payload.get("stream"):
+            choices = max(1, int(payload.get("n") or 1))
+            usage["completion_tokens"] *= choices
+            usage["total_tokens"] = prompt_tokens + usage["completion_tokens"]
+            self._send_json(200, {
+                "id": f"mock-{time.time_ns()}",
+                "model": model,
+                "choices": [{"index": i, "message": {"role": "assistant", "content": answer},
+                             "finish_reason": "stop"} for i in range(choices)],
+                "usage": usage
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            delay = 1.0 / config.stream_tokens_per_second if config.stream_tokens_per_second > 0 else 0.0
+            for word in re.findall(r"\S+\s*", answer):
+                event = {"model": model, "choices": [{"index": 0, "delta": {"content": word}}]}
+                self._send_chunk(f"data: {json.dumps(event)}\n\n")
+                if delay:
+                    time.sleep(delay)
+            self._send_chunk(f"data: {json.dumps({'model': model, 'choices': [], 'usage': usage})}\n\n")
+            self._send_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client cancelled the stream early
+            self.close_connection = True
+
+
+class _QuietThreadingHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that ignores clients hanging up on keep-alive sockets"""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+
+class MockOpenRouterServer:
+    """
+    Threaded mock server that can run in the background of a benchmark
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (port 0 picks a free port)
+
+        Args:
+            config (MockConfig): Endpoint behaviour
+            host (str): Interface to bind
+            port (int): Port to bind
+        """
+        handler = type("ConfiguredMockHandler", (MockOpenRouterHandler,), {"config": config or MockConfig()})
+        self.httpd = _QuietThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to LLMTester"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def start(self) -> "MockOpenRouterServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    """
+    Run the mock server in the foreground
+    """
+    parser = argparse.ArgumentParser(description="Local mock of the OpenRouter chat completions API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8008)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-mean", type=float, default=0.5)
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--completion-tokens", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = MockConfig(latency=args.latency, latency_mean=args.latency_mean,
+                        latency_spread=args.latency_spread, error_rate=args.error_rate,
+                        rate_limit_rate=args.rate_limit_rate,
+                        completion_tokens=args.completion_tokens, seed=args.seed)
+    server = MockOpenRouterServer(config, args.host, args.port)
+    print(f"🧪 Mock OpenRouter listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
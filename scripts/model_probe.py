@@ -0,0 +1,203 @@
+"""
+Model Health Probe and Latency Baseline
+For Task 05: Descriptive Statistics and Large Language Models
+
+Sends every model a tiny streamed prompt twice, with all models probed in
+parallel and a short timeout. The first call runs on a fresh connection and
+measures the cold path (connection setup plus any provider warm-up). The
+second call reuses the connection and measures the warm path. Each call
+records total latency and time-to-first-token (TTFT).
+
+The results are written to a baseline file (results/model_baseline.json).
+LLMTester reads it before a run:
+    - models that failed the probe are left out of the matrix, so nothing is
+      spent on them
+    - each model's concurrency limit is sized from its warm latency and rate
+      limit (Little's law: requests in flight = request rate x latency)
+"""
+
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from rate_limiter import RateLimit
+from streaming import consume_stream
+
+DEFAULT_BASELINE_PATH = "results/model_baseline.json"
+PROBE_PROMPT = "Reply with the single word OK."
+
+
+def _probe_call(session: requests.Session, url: str, model: str,
+                timeout: Tuple[float, float]) -> Dict:
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": PROBE_PROMPT}],
+        "max_tokens": 5,
+        "temperature": 0,
+        "stream": True,
+        "stream_options": {"include_usage": True}
+    }
+    start_time = time.time()
+    try:
+        response = session.post(url, json=payload, timeout=timeout, stream=True)
+    except Exception as e:
+        return {"status": None, "latency": time.time() - start_time, "ttft": None, "error": f"Request failed: {e}"}
+    if response.status_code != 200:
+        error = f"API Error {response.status_code}: {response.text[:200]}"
+        response.close()
+        return {"status": response.status_code, "latency": time.time() - start_time, "ttft": None, "error": error}
+    try:
+        streamed = consume_stream(response, start_time)
+    except Exception as e:
+        return {"status": 200, "latency": time.time() - start_time, "ttft": None, "error": f"Stream failed: {e}"}
+    return {"status": 200, "latency": streamed["response_time"], "ttft": streamed["time_to_first_token"],
+            "error": None}
+
+
+def probe_model(model: str, api_key: str, base_url: str = "https://openrouter.ai/api/v1",
+                timeout: Tuple[float, float] = (3.0, 10.0)) -> Dict:
+    """
+    Probe one model with a cold and a warm request
+
+    Args:
+        model (str): Model identifier
+        api_key (str): OpenRouter API key
+        base_url (str): OpenRouter API base URL
+        timeout (Tuple[float, float]): (connect, read) timeout in seconds per call
+
+    Returns:
+        Dict: alive, status, error, cold/warm latency and cold/warm TTFT (None where not measured)
+    """
+    url = f"{base_url}/chat/completions"
+    with requests.Session() as session:
+        session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+        cold = _probe_call(session, url, model, timeout)
+        warm = _probe_call(session, url, model, timeout) if cold["status"] == 200 and cold["error"] is None else None
+
+    return {
+        # 429 means the model is up but throttled, so it still counts as alive
+        "alive": cold["status"] == 429 or (cold["status"] == 200 and cold["error"] is None),
+        "status": cold["status"],
+        "error": cold["error"] or (warm["error"] if warm else None),
+        "cold_latency": cold["latency"] if cold["error"] is None else None,
+        "cold_ttft": cold["ttft"],
+        "warm_latency": warm["latency"] if warm and warm["error"] is None else None,
+        "warm_ttft": warm["ttft"] if warm else None
+    }
+
+
+def probe_models(models: Iterable[str], api_key: str, base_url: str = "https://openrouter.ai/api/v1",
+                 timeout: Tuple[float, float] = (3.0, 10.0)) -> Dict[str, Dict]:
+    """
+    Probe every model at once
+
+    Args:
+        models (Iterable[str]): Model identifiers
+        api_key (str): OpenRouter API key
+        base_url (str): OpenRouter API base URL
+        timeout (Tuple[float, float]): (connect, read) timeout in seconds per call
+
+    Returns:
+        Dict[str, Dict]: probe_model() result by model, in the order given
+    """
+    models = list(dict.fromkeys(models))
+    if not models:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        results = executor.map(lambda model: probe_model(model, api_key, base_url, timeout), models)
+        return dict(zip(models, results))
+
+
+def recommended_concurrency(latency: Optional[float], limit: Optional[RateLimit], ceiling: int,
+                            headroom: float = 2.0) -> int:
+    """
+    In-flight requests needed to keep a model at its rate limit
+
+    Args:
+        latency (float): Probe latency in seconds (None if unknown)
+        limit (RateLimit): The model's rate limit (None if unlimited)
+        ceiling (int): Upper bound (the tester's max_concurrency_per_model)
+        headroom (float): Multiplier on the probe latency; real prompts are far longer than the probe
+
+    Returns:
+        int: Concurrency between 1 and ceiling
+    """
+    if latency is None or limit is None:
+        return ceiling
+    return max(1, min(ceiling, math.ceil(limit.requests_per_second * latency * headroom)))
+
+
+def write_baseline(probes: Dict[str, Dict], path: str = DEFAULT_BASELINE_PATH,
+                   base_url: str = "https://openrouter.ai/api/v1") -> str:
+    """
+    Save probe results as the latency baseline
+
+    Args:
+        probes (Dict[str, Dict]): probe_models() output
+        path (str): Baseline file
+        base_url (str): Endpoint that was probed
+
+    Returns:
+        str: The path written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "probed_at": datetime.now().isoformat(),
+            "base_url": base_url,
+            "models": probes
+        }, f, indent=2)
+    return path
+
+
+def load_baseline(path: str = DEFAULT_BASELINE_PATH, base_url: Optional[str] = None,
+                  max_age: Optional[float] = 24 * 3600) -> Optional[Dict]:
+    """
+    Read a baseline if there is a usable one
+
+    Args:
+        path (str): Baseline file
+        base_url (str): Only accept a baseline probed against this endpoint
+        max_age (float): Ignore baselines older than this many seconds (None: any age)
+
+    Returns:
+        Dict: The baseline, or None if missing, unreadable, stale or for another endpoint
+    """
+    try:
+        with open(path) as f:
+            baseline = json.load(f)
+        probed_at = datetime.fromisoformat(baseline["probed_at"])
+    except (OSError, ValueError, KeyError):
+        return None
+    if base_url is not None and baseline.get("base_url") != base_url:
+        return None
+    if max_age is not None and (datetime.now() - probed_at).total_seconds() > max_age:
+        return None
+    return baseline
+
+
+def dead_models(baseline: Optional[Dict]) -> List[str]:
+    """
+    Models that failed their probe
+
+    Args:
+        baseline (Dict): load_baseline() output
+
+    Returns:
+        List[str]: Model identifiers, in baseline order
+    """
+    if not baseline:
+        return []
+    return [model for model, probe in baseline["models"].items() if not probe["alive"]]
@@ -0,0 +1,188 @@
+"""
+Fuzzy Player-Name Index
+For Task 05: Descriptive Statistics and Large Language Models
+
+Resolves player mentions in LLM responses ("D. Fair", "Dyaisha",
+"Alyssa Lathem") to roster entries with a confidence score. Lookups try,
+in order: the exact normalized name, initial plus last name, a unique first
+or last name, and finally trigram similarity (Dice coefficient) over an
+inverted trigram index. Candidate counting is a single numpy bincount over
+the matching posting lists, so lookups stay sub-millisecond for rosters of
+tens of thousands of players.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, replace
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Confidence for lookups that do not compare spellings
+INITIAL_LAST_CONFIDENCE = 0.95
+SINGLE_NAME_CONFIDENCE = 0.75
+# A lone name opening a sentence is capitalized anyway ("Fair question!"), so it
+# stays below the answer matcher's default fuzzy_confidence of 0.7
+SENTENCE_START_CONFIDENCE = 0.5
+
+# Capitalized words or initials ("D."), optionally followed by a number ("Player 4")
+_NAME_WORD = r"[A-Z](?:\.|[\w'’-]*)"
+_CANDIDATE_SPAN = re.compile(r"\b%s(?:\s+(?:%s|\d+\b)){0,2}" % (_NAME_WORD, _NAME_WORD))
+_SENTENCE_END = re.compile(r"(?:^|[.!?])[\s\"'“‘(\[*-]*$")
+
+
+@dataclass
+class NameMatch:
+    """A roster entry resolved from a mention"""
+    name: str
+    confidence: float
+    method: str
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for comparison (accents stripped, lower case, punctuation removed)
+
+    Args:
+        name (str): Raw name or mention
+
+    Returns:
+        str: Normalized name
+    """
+    decomposed = unicodedata.normalize("NFKD", str(name))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w\s]|_", " ", stripped.lower()).split())
+
+
+def _trigrams(normalized: str) -> List[str]:
+    padded = f"  {normalized} "
+    return sorted({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+class NameIndex:
+    """
+    Roster name index with exact, initial, single-name and trigram lookups
+    """
+
+    def __init__(self, names: Iterable[str], min_confidence: float = 0.6):
+        """
+        Build the index
+
+        Args:
+            names (Iterable[str]): Roster names (duplicates are collapsed)
+            min_confidence (float): Lowest trigram similarity accepted as a match
+        """
+        self.names = list(dict.fromkeys(n for n in names if isinstance(n, str) and n.strip()))
+        self.min_confidence = min_confidence
+        self._exact = {}
+        self._single = {}
+        self._initial_last = {}
+        postings = {}
+        gram_counts = []
+
+        for i, name in enumerate(self.names):
+            normalized = normalize_name(name)
+            self._exact.setdefault(normalized, i)
+            tokens = normalized.split()
+            for token in {tokens[0], tokens[-1]}:
+                self._single.setdefault(token, set()).add(i)
+            if len(tokens) > 1:
+                self._initial_last.setdefault(f"{tokens[0][0]} {tokens[-1]}", set()).add(i)
+            grams = _trigrams(normalized)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = np.asarray(gram_counts, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_analyzer(cls, analyzer, **kwargs) -> "NameIndex":
+        """
+        Build the index from the Player column of a loaded BasketballAnalyzer
+
+        Args:
+            analyzer (BasketballAnalyzer): Analyzer with data loaded
+            **kwargs: Passed through to NameIndex
+
+        Returns:
+            NameIndex: The index
+        """
+        return cls(analyzer.data["Player"].dropna().tolist(), **kwargs)
+
+    def resolve(self, mention: str) -> Optional[NameMatch]:
+        """
+        Resolve a mention to a roster entry
+
+        Args:
+            mention (str): Name as written in a response
+
+        Returns:
+            NameMatch: Best roster entry and confidence, or None if nothing is close enough
+        """
+        normalized = normalize_name(mention)
+        if not normalized or not self.names:
+            return None
+        if normalized in self._exact:
+            return NameMatch(self.names[self._exact[normalized]], 1.0, "exact")
+
+        tokens = normalized.split()
+        if len(tokens) == 2 and len(tokens[0]) == 1:
+            ids = self._initial_last.get(normalized, ())
+            if len(ids) == 1:
+                return NameMatch(self.names[next(iter(ids))], INITIAL_LAST_CONFIDENCE, "initial")
+        if len(tokens) == 1:
+            ids = self._single.get(normalized, ())
+            if len(ids) == 1:
+                return NameMatch(self.names[next(iter(ids))], SINGLE_NAME_CONFIDENCE, "single_name")
+
+        grams = _trigrams(normalized)
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not hits:
+            return None
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.names))
+        dice = 2.0 * shared / (len(grams) + self._gram_counts)
+        best = int(np.argmax(dice))
+        # A tie for the best score means the mention does not identify one player
+        if dice[best] < self.min_confidence or np.count_nonzero(dice == dice[best]) > 1:
+            return None
+        return NameMatch(self.names[best], float(dice[best]), "trigram")
+
+    def find_mentions(self, text: str, min_confidence: Optional[float] = None) -> List[Tuple[int, int, NameMatch]]:
+        """
+        Find and resolve every player mention in a text
+
+        Capitalized runs of up to three words are candidates; a run that does
+        not resolve as a whole is retried word by word. A single first or last
+        name at the start of a sentence drops to SENTENCE_START_CONFIDENCE.
+
+        Args:
+            text (str): Response text
+            min_confidence (float): Drop matches below this confidence
+
+        Returns:
+            List[Tuple[int, int, NameMatch]]: (start, end, match) in text order
+        """
+        threshold = self.min_confidence if min_confidence is None else min_confidence
+        mentions = []
+        for span in _CANDIDATE_SPAN.finditer(text):
+            match = self._resolve_at(text, span.start(), span.group())
+            if match is not None and match.confidence >= threshold:
+                mentions.append((span.start(), span.end(), match))
+                continue
+            if " " not in span.group().strip():
+                continue
+            for word in re.finditer(r"\S+", span.group()):
+                match = self._resolve_at(text, span.start() + word.start(), word.group())
+                if match is not None and match.confidence >= threshold:
+                    mentions.append((span.start() + word.start(), span.start() + word.end(), match))
+        return mentions
+
+    def _resolve_at(self, text: str, start: int, mention: str) -> Optional[NameMatch]:
+        match = self.resolve(mention)
+        if match is not None and match.method == "single_name" and _SENTENCE_END.search(text, 0, start):
+            return replace(match, confidence=SENTENCE_START_CONFIDENCE)
+        return match
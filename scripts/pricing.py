@@ -0,0 +1,156 @@
+"""
+Model Pricing and Cost Accounting
+For Task 05: Descriptive Statistics and Large Language Models
+
+Loads the versioned pricing table (scripts/pricing.json) once and prices
+prompt and completion tokens at their separate rates. Costs for a whole set
+of responses are computed in one vectorized pass. Models missing from the
+table get no cost and are reported, rather than priced with a guess.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from response_store import assign_column, columns_of
+
+DEFAULT_PRICING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pricing.json")
+
+
+class PricingTable:
+    """
+    Per-model input (prompt) and output (completion) token rates
+    """
+
+    def __init__(self, table: Dict):
+        """
+        Initialize from a parsed pricing document
+
+        Args:
+            table (Dict): {"version", "unit_tokens", "models": {model: {"input", "output"}}}
+        """
+        self.version = table.get("version", "unversioned")
+        self.unit_tokens = table.get("unit_tokens", 1000)
+        self.models = table.get("models", {})
+        self.unknown_models = set()
+
+    def rates(self, model: str) -> Optional[tuple]:
+        """
+        Per-token rates for a model
+
+        Args:
+            model (str): Model identifier
+
+        Returns:
+            tuple: (input rate, output rate) per token, or None if the model is not priced
+        """
+        entry = self.models.get(model)
+        if entry is None:
+            return None
+        return entry["input"] / self.unit_tokens, entry["output"] / self.unit_tokens
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """
+        Cost of one request
+
+        Args:
+            model (str): Model identifier
+            prompt_tokens (int): Input tokens
+            completion_tokens (int): Output tokens
+
+        Returns:
+            float: Cost in USD, or None if the model is not priced
+        """
+        rates = self.rates(model)
+        if rates is None:
+            self.unknown_models.add(model)
+            return None
+        return (prompt_tokens or 0) * rates[0] + (completion_tokens or 0) * rates[1]
+
+    def costs(self, models: Sequence[str], prompt_tokens: Sequence, completion_tokens: Sequence) -> np.ndarray:
+        """
+        Costs of many requests in one vectorized pass
+
+        Args:
+            models (Sequence[str]): Model per request
+            prompt_tokens (Sequence): Input tokens per request (None counts as 0)
+            completion_tokens (Sequence): Output tokens per request (None counts as 0)
+
+        Returns:
+            np.ndarray: Cost in USD per request, NaN for models that are not priced
+        """
+        codes, uniques = pd.factorize(pd.Series(models, dtype=object))
+        if len(uniques) == 0:
+            return np.zeros(0)
+
+        input_rates = np.full(len(uniques), np.nan)
+        output_rates = np.full(len(uniques), np.nan)
+        for i, model in enumerate(uniques):
+            rates = self.rates(model)
+            if rates is None:
+                self.unknown_models.add(model)
+            else:
+                input_rates[i], output_rates[i] = rates
+
+        prompt = pd.to_numeric(pd.Series(prompt_tokens), errors="coerce").fillna(0).to_numpy(dtype=float)
+        completion = pd.to_numeric(pd.Series(completion_tokens), errors="coerce").fillna(0).to_numpy(dtype=float)
+        return prompt * input_rates[codes] + completion * output_rates[codes]
+
+    def summary(self) -> Dict:
+        """
+        Pricing information for the run summary
+
+        Returns:
+            Dict: Table version and models that could not be priced
+        """
+        return {"version": self.version, "unknown_models": sorted(self.unknown_models)}
+
+
+@lru_cache(maxsize=None)
+def _read_table(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+def load_pricing(path: str = DEFAULT_PRICING_PATH) -> PricingTable:
+    """
+    Load a pricing table (the file is read once per process)
+
+    Args:
+        path (str): Pricing JSON path
+
+    Returns:
+        PricingTable: Table with its own unknown-model report
+    """
+    return PricingTable(json.loads(_read_table(os.path.abspath(path))))
+
+
+def account_costs(responses: List, pricing: PricingTable) -> Dict:
+    """
+    Price every response in one pass and set its cost
+
+    Args:
+        responses (ResponseStore | List[LLMResponse]): Responses with prompt_tokens and completion_tokens set
+        pricing (PricingTable): Pricing table
+
+    Returns:
+        Dict: Total cost, per-model cost and models that could not be priced
+    """
+    columns = columns_of(responses, ["model", "prompt_tokens", "completion_tokens"])
+    models = list(columns["model"])
+    costs = pricing.costs(models, columns["prompt_tokens"], columns["completion_tokens"])
+    assign_column(responses, "cost", costs)
+
+    by_model = {}
+    if len(responses):
+        totals = pd.Series(costs).groupby(pd.Series(models, dtype=object)).sum(min_count=1)
+        by_model = {model: None if np.isnan(cost) else float(cost) for model, cost in totals.items()}
+    return {
+        "total_cost": float(np.nansum(costs)),
+        "by_model": by_model,
+        "unknown_models": sorted({m for m in models if pricing.rates(m) is None})
+    }
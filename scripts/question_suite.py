@@ -0,0 +1,184 @@
+"""
+Data-Driven Question Suite
+For Task 05: Descriptive Statistics and Large Language Models
+
+Parses the "Automated Test Suite" section of prompts/basketball_prompts.md
+into question tiers and expands them into the (model x question) test
+matrix. Each tier lists the models it runs against, the completion token
+limit and the instruction appended to every prompt, followed by a markdown
+table of questions:
+
+    ### Tier: basic
+    - **Models:** mistralai/mistral-7b-instruct, google/gemini-2.5-flash
+    - **Max Tokens:** 2000
+    - **Instruction:** Please provide a clear, concise answer based on the data provided.
+
+    | ID | Category | Question | Expected |
+    |----|----------|----------|----------|
+    | B-1 | basic_count | How many players are on the team? | player_count |
+
+"Expected" is an answer id from answer_key.py, or "-" for questions that
+are not scored automatically. Adding a question or model is an edit to the
+catalog; the tester picks it up on the next run.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from dispatcher import PromptJob
+
+DEFAULT_SUITE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  os.pardir, "prompts", "basketball_prompts.md")
+SUITE_HEADING = "## Automated Test Suite"
+
+_TIER_HEADING = re.compile(r"^###\s+Tier:\s*(?P<name>\S+)\s*$")
+_SETTING = re.compile(r"^-\s+\*\*(?P<key>[^*:]+):\*\*\s*(?P<value>.*)$")
+_TABLE_COLUMNS = ["id", "category", "question", "expected"]
+
+
+@dataclass
+class SuiteQuestion:
+    """One question row of the catalog"""
+    id: str
+    category: str
+    question: str
+    answer_id: Optional[str] = None
+
+
+@dataclass
+class SuiteTier:
+    """A question tier and the models it runs against"""
+    name: str
+    models: List[str]
+    max_tokens: int
+    instruction: str
+    questions: List[SuiteQuestion] = field(default_factory=list)
+
+
+def _table_cells(line: str) -> List[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def _finish_tier(tier: Dict, path: str) -> SuiteTier:
+    missing = [key for key in ("models", "max tokens", "instruction") if key not in tier["settings"]]
+    if missing:
+        raise ValueError(f"{path}: tier '{tier['name']}' is missing {', '.join(missing)}")
+    settings = tier["settings"]
+    try:
+        max_tokens = int(settings["max tokens"])
+    except ValueError:
+        raise ValueError(f"{path}: tier '{tier['name']}' has a non-integer max tokens "
+                         f"value: {settings['max tokens']!r}")
+    models = [m.strip() for m in settings["models"].split(",") if m.strip()]
+    if not models:
+        raise ValueError(f"{path}: tier '{tier['name']}' lists no models")
+    return SuiteTier(tier["name"], models, max_tokens, settings["instruction"], tier["questions"])
+
+
+def parse_question_suite(text: str, path: str = "<catalog>") -> List[SuiteTier]:
+    """
+    Parse the test suite section of a prompt catalog
+
+    Args:
+        text (str): Markdown catalog
+        path (str): Source name used in error messages
+
+    Returns:
+        List[SuiteTier]: Tiers in catalog order
+
+    Raises:
+        ValueError: If the section is missing or malformed
+    """
+    lines = text.splitlines()
+    try:
+        start = next(i for i, line in enumerate(lines) if line.strip() == SUITE_HEADING)
+    except StopIteration:
+        raise ValueError(f"{path}: no '{SUITE_HEADING}' section")
+
+    tiers = []
+    current = None
+    seen_ids = set()
+    for number, line in enumerate(lines[start + 1:], start + 2):
+        stripped = line.strip()
+        if stripped.startswith("## "):
+            break
+        heading = _TIER_HEADING.match(stripped)
+        if heading:
+            if current is not None:
+                tiers.append(_finish_tier(current, path))
+            current = {"name": heading.group("name"), "settings": {}, "questions": []}
+            continue
+        if current is None:
+            continue
+        setting = _SETTING.match(stripped)
+        if setting:
+            current["settings"][setting.group("key").strip().lower()] = setting.group("value").strip()
+            continue
+        if not stripped.startswith("|"):
+            continue
+
+        cells = _table_cells(stripped)
+        if [c.lower() for c in cells] == _TABLE_COLUMNS or set("".join(cells)) <= set("-: "):
+            continue
+        if len(cells) != len(_TABLE_COLUMNS):
+            raise ValueError(f"{path}:{number}: expected {len(_TABLE_COLUMNS)} columns, got {len(cells)}")
+        question_id, category, question, expected = cells
+        if question_id in seen_ids:
+            raise ValueError(f"{path}:{number}: duplicate question id '{question_id}'")
+        seen_ids.add(question_id)
+        current["questions"].append(SuiteQuestion(question_id, category, question,
+                                                  None if expected in ("", "-") else expected))
+
+    if current is not None:
+        tiers.append(_finish_tier(current, path))
+    if not tiers:
+        raise ValueError(f"{path}: '{SUITE_HEADING}' defines no tiers")
+    return tiers
+
+
+def load_question_suite(path: str = DEFAULT_SUITE_PATH) -> List[SuiteTier]:
+    """
+    Load the question suite from a prompt catalog file
+
+    Args:
+        path (str): Markdown prompt catalog
+
+    Returns:
+        List[SuiteTier]: Tiers in catalog order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_question_suite(f.read(), path)
+
+
+def build_matrix(tiers: Iterable[SuiteTier], data_str: str,
+                 tier_names: Optional[Iterable[str]] = None) -> List[PromptJob]:
+    """
+    Expand tiers into the (model x question) job matrix
+
+    Args:
+        tiers (Iterable[SuiteTier]): Parsed suite
+        data_str (str): Formatted basketball data used as every prompt's context
+        tier_names (Iterable[str]): Only include these tiers (default: all)
+
+    Returns:
+        List[PromptJob]: Jobs in tier, model, question order
+    """
+    selected = set(tier_names) if tier_names is not None else None
+    return [
+        PromptJob(
+            model=model,
+            question=q.question,
+            prompt=f"{data_str}\n\nQuestion: {q.question}\n\n{tier.instruction}",
+            max_tokens=tier.max_tokens,
+            category=q.category,
+            answer_id=q.answer_id,
+            context=data_str,
+            instruction=tier.instruction
+        )
+        for tier in tiers
+        if selected is None or tier.name in selected
+        for model in tier.models
+        for q in tier.questions
+    ]
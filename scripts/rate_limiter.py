@@ -0,0 +1,225 @@
+"""
+Per-Model Rate Limiter
+For Task 05: Descriptive Statistics and Large Language Models
+
+Token-bucket rate limiting for LLM API calls. Every model gets two buckets,
+one for requests per second and one for tokens per minute, so each model
+is driven at its own allowed throughput instead of a flat sleep between calls.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+@dataclass
+class RateLimit:
+    """Allowed throughput for one model"""
+    requests_per_second: float = 5.0
+    tokens_per_minute: float = 200000.0
+    burst_requests: Optional[float] = None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that hands out reservations
+
+    A reservation is taken immediately and may drive the bucket negative;
+    the caller then waits for the returned delay. This keeps concurrent
+    callers in first-come, first-served order without polling.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket
+
+        Args:
+            rate (float): Refill rate in units per second
+            capacity (float): Maximum number of units the bucket can hold
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.blocked_until = 0.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Reserve units from the bucket
+
+        Args:
+            amount (float): Units to take
+
+        Returns:
+            float: Seconds the caller must wait before using the reservation
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now, 0.0)
+
+    def refund(self, amount: float):
+        """
+        Return units to the bucket (negative amounts charge extra)
+
+        Args:
+            amount (float): Units to give back
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def block_for(self, seconds: float):
+        """
+        Stop handing out reservations for a while (e.g. after a 429)
+
+        Args:
+            seconds (float): How long to block
+        """
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class ModelRateLimiter:
+    """
+    Request and token buckets for each model, plus throttling statistics
+    """
+
+    def __init__(self, limits: Optional[Dict[str, RateLimit]] = None,
+                 default_limit: Optional[RateLimit] = None):
+        """
+        Initialize the limiter
+
+        Args:
+            limits (Dict[str, RateLimit]): Per-model limits
+            default_limit (RateLimit): Limit for models not listed in limits
+        """
+        self.limits = dict(limits or {})
+        self.default_limit = default_limit or RateLimit()
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _buckets_for(self, model: str):
+        with self._lock:
+            if model not in self._buckets:
+                limit = self.limits.get(model, self.default_limit)
+                burst = limit.burst_requests or max(1.0, limit.requests_per_second)
+                self._buckets[model] = (
+                    TokenBucket(limit.requests_per_second, burst),
+                    TokenBucket(limit.tokens_per_minute / 60.0, limit.tokens_per_minute)
+                )
+                self._stats[model] = {"requests": 0, "throttled_requests": 0,
+                                      "throttle_time": 0.0, "retry_after_events": 0}
+            return self._buckets[model]
+
+    def acquire(self, model: str, tokens: int = 0) -> float:
+        """
+        Block until the model has capacity for one request of the given size
+
+        Args:
+            model (str): Model identifier
+            tokens (int): Estimated tokens the request will consume
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        request_bucket, token_bucket = self._buckets_for(model)
+        wait = max(request_bucket.reserve(1.0), token_bucket.reserve(tokens) if tokens else 0.0)
+        if wait > 0:
+            time.sleep(wait)
+
+        with self._lock:
+            stats = self._stats[model]
+            stats["requests"] += 1
+            if wait > 0:
+                stats["throttled_requests"] += 1
+                stats["throttle_time"] += wait
+        return wait
+
+    def settle(self, model: str, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the token bucket once the real usage is known
+
+        Args:
+            model (str): Model identifier
+            estimated_tokens (int): Tokens reserved in acquire()
+            actual_tokens (int): Tokens reported by the API
+        """
+        _, token_bucket = self._buckets_for(model)
+        token_bucket.refund(estimated_tokens - actual_tokens)
+
+    def pause(self, model: str, seconds: float):
+        """
+        Pause all requests to a model, e.g. to honour a Retry-After header
+
+        Args:
+            model (str): Model identifier
+            seconds (float): Pause length
+        """
+        for bucket in self._buckets_for(model):
+            bucket.block_for(seconds)
+        with self._lock:
+            self._stats[model]["retry_after_events"] += 1
+
+    def stats(self) -> Dict:
+        """
+        Throttling statistics per model
+
+        Returns:
+            Dict: Requests, throttled requests and total wait per model
+        """
+        with self._lock:
+            return {model: dict(stats) for model, stats in self._stats.items()}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def estimate_request_tokens(prompt: str, max_tokens: int) -> int:
+    """
+    Rough upper bound on the tokens a request will consume
+
+    Args:
+        prompt (str): Prompt text
+        max_tokens (int): Completion token limit
+
+    Returns:
+        int: Estimated prompt tokens (about 4 characters each) plus max_tokens
+    """
+    return len(prompt) // 4 + max_tokens
@@ -0,0 +1,217 @@
+"""
+Retry, Backoff and Circuit Breaking
+For Task 05: Descriptive Statistics and Large Language Models
+
+Classifies API failures as retryable or fatal, computes jittered exponential
+backoff delays, and keeps a circuit breaker per model. Once a model fails
+repeatedly, its remaining questions are skipped instead of sent.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+RETRYABLE = "retryable"
+FATAL = "fatal"
+
+# Transient server-side or throttling conditions worth another attempt
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524, 529}
+
+# The model itself cannot be used, so there is no point asking it anything else
+MODEL_UNAVAILABLE_STATUS_CODES = {403, 404}
+
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def classify_status(status_code: int) -> str:
+    """
+    Classify an HTTP error status
+
+    Args:
+        status_code (int): HTTP status code
+
+    Returns:
+        str: RETRYABLE or FATAL
+    """
+    return RETRYABLE if status_code in RETRYABLE_STATUS_CODES else FATAL
+
+
+def classify_exception(error: Exception) -> str:
+    """
+    Classify an exception raised while sending or reading a request
+
+    Args:
+        error (Exception): The exception
+
+    Returns:
+        str: RETRYABLE or FATAL
+    """
+    return RETRYABLE if isinstance(error, RETRYABLE_EXCEPTIONS) else FATAL
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0,
+                  rng: Optional[random.Random] = None) -> float:
+    """
+    Exponential backoff with full jitter
+
+    Args:
+        attempt (int): Zero-based retry number
+        base (float): Delay ceiling for the first retry in seconds
+        cap (float): Maximum delay ceiling in seconds
+        rng (random.Random): Optional random source
+
+    Returns:
+        float: Seconds to sleep, uniform in [0, min(cap, base * 2 ** attempt)]
+    """
+    return (rng or random).uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one model
+
+    The breaker opens after failure_threshold consecutive failed requests
+    (or immediately for a model-unavailable error). While open, requests are
+    refused. After reset_timeout seconds one probe request is let through
+    (half-open); its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: Optional[float] = None):
+        """
+        Initialize the breaker
+
+        Args:
+            failure_threshold (int): Consecutive failures that trip the breaker
+            reset_timeout (float): Seconds before a probe is allowed (None keeps it open for the run)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trips = 0
+        self.skipped = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent
+
+        Returns:
+            bool: True if the request may go ahead
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (self.state == self.OPEN and self.reset_timeout is not None and
+                    time.monotonic() - self.opened_at >= self.reset_timeout):
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.skipped += 1
+            return False
+
+    def record_success(self):
+        """Record a successful request and close the breaker"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, trip: bool = False):
+        """
+        Record a request that failed after all retries
+
+        Args:
+            trip (bool): Open the breaker immediately regardless of the count
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state != self.OPEN and (trip or self.state == self.HALF_OPEN or
+                                            self.consecutive_failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.trips += 1
+
+
+class ResilienceTracker:
+    """
+    Circuit breakers and retry/error counters for every model
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: Optional[float] = None):
+        """
+        Initialize the tracker
+
+        Args:
+            failure_threshold (int): Consecutive failures that trip a model's breaker
+            reset_timeout (float): Seconds before an open breaker allows a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        """
+        Get (or create) the breaker for a model
+
+        Args:
+            model (str): Model identifier
+
+        Returns:
+            CircuitBreaker: The model's breaker
+        """
+        with self._lock:
+            if model not in self._breakers:
+                self._breakers[model] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._counters[model] = {"retries": 0, "retryable_errors": 0, "fatal_errors": 0,
+                                         "backoff_time": 0.0}
+            return self._breakers[model]
+
+    def record_error(self, model: str, kind: str, retried: bool, delay: float = 0.0):
+        """
+        Count one failed attempt
+
+        Args:
+            model (str): Model identifier
+            kind (str): RETRYABLE or FATAL
+            retried (bool): Whether another attempt follows
+            delay (float): Backoff slept before the next attempt
+        """
+        self.breaker(model)
+        with self._lock:
+            counters = self._counters[model]
+            counters["retryable_errors" if kind == RETRYABLE else "fatal_errors"] += 1
+            if retried:
+                counters["retries"] += 1
+                counters["backoff_time"] += delay
+
+    def summary(self) -> Dict:
+        """
+        Resilience statistics for the run summary
+
+        Returns:
+            Dict: Per-model retries, errors, breaker state, trips and skipped requests
+        """
+        with self._lock:
+            return {
+                model: dict(self._counters[model], breaker_state=breaker.state,
+                            breaker_trips=breaker.trips, skipped_requests=breaker.skipped)
+                for model, breaker in self._breakers.items()
+            }
@@ -0,0 +1,167 @@
+"""
+On-Disk LLM Response Cache
+For Task 05: Descriptive Statistics and Large Language Models
+
+Content-addressed cache for successful LLM API calls. Each entry is stored
+as one JSON file named after the SHA-256 of the full request (endpoint and
+payload), so re-running the tests with unchanged prompts costs nothing.
+Least recently used entries are evicted once the size cap is reached.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """
+    Persistent, size-capped LRU cache of API results keyed by request hash
+    """
+
+    def __init__(self, cache_dir: str = "results/llm_cache",
+                 max_entries: int = 10000, max_bytes: int = 100 * 1024 * 1024,
+                 enabled: bool = True):
+        """
+        Initialize the cache and index any entries already on disk
+
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            max_entries (int): Maximum number of cached responses
+            max_bytes (int): Maximum total size of the cache on disk
+            enabled (bool): Set to False to bypass the cache entirely
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._index = OrderedDict()  # key -> size in bytes, oldest access first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self._load_index()
+
+    def _load_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, name[:-5], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict) -> str:
+        """
+        Hash a request into a cache key
+
+        Args:
+            endpoint (str): Request URL
+            payload (Dict): JSON request body
+
+        Returns:
+            str: Hex SHA-256 of the canonical request
+        """
+        canonical = json.dumps({"endpoint": endpoint, "payload": payload},
+                               sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result
+
+        Args:
+            key (str): Cache key from make_key()
+
+        Returns:
+            Optional[Dict]: Cached result, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+            self._index.move_to_end(key)
+
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+            os.utime(self._path(key))  # mtime records recency across runs
+        except (OSError, ValueError):
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, result: Dict):
+        """
+        Store a result and evict least recently used entries over the cap
+
+        Args:
+            key (str): Cache key from make_key()
+            result (Dict): Successful API result to cache
+        """
+        if not self.enabled:
+            return
+
+        data = json.dumps(result)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        size = len(data.encode("utf-8"))
+
+        with self._lock:
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+            self.writes += 1
+
+            while self._index and (len(self._index) > self.max_entries or
+                                   self._total_bytes > self.max_bytes):
+                old_key, old_size = self._index.popitem(last=False)
+                self._total_bytes -= old_size
+                self.evictions += 1
+                try:
+                    os.remove(self._path(old_key))
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict:
+        """
+        Cache hit/miss statistics
+
+        Returns:
+            Dict: Hits, misses, hit rate, writes, evictions, entries and size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "size_bytes": self._total_bytes
+            }
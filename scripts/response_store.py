@@ -0,0 +1,334 @@
+"""
+Columnar Response Store
+For Task 05: Descriptive Statistics and Large Language Models
+
+Holds LLM responses column by column instead of as one object per response:
+    - repeated strings (model, provider, question, category, ...) are interned
+      and stored as int32 codes into a shared pool
+    - numbers live in typed arrays, with NaN standing in for None
+    - response text is UTF-8 in one append-only blob, addressed by offsets
+At hundreds of thousands of responses this is a fraction of the memory of a
+list of records, per-model aggregation is a bincount over the codes, and
+export streams rows straight out of the columns in chunks.
+
+Records go in and come out as the record type the store was created with
+(LLMResponse); columns it does not declare are kept as plain lists.
+"""
+
+import array
+import json
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+import pandas as pd
+
+INTERNED_COLUMNS = ("provider", "model", "prompt", "category", "answer_id", "batch_id")
+TEXT_COLUMNS = ("response",)
+FLAG_COLUMNS = ("cached", "stopped_early")
+INTEGER_COLUMNS = ("sample",)
+# Float64 so None can be NaN; counts are materialized back to int, timestamps (epoch seconds) to ISO
+COUNT_COLUMNS = ("tokens_used", "prompt_tokens", "completion_tokens", "batch_size")
+FLOAT_COLUMNS = ("accuracy_score", "response_time", "cost", "throttle_time", "time_to_first_token",
+                 "inter_token_latency", "tokens_per_second", "timestamp") + COUNT_COLUMNS
+TIMESTAMP_COLUMN = "timestamp"
+
+_KINDS = dict([(name, "interned") for name in INTERNED_COLUMNS] + [(name, "text") for name in TEXT_COLUMNS] +
+              [(name, "flag") for name in FLAG_COLUMNS] + [(name, "integer") for name in INTEGER_COLUMNS] +
+              [(name, "float") for name in FLOAT_COLUMNS])
+_TYPECODES = {"interned": "i", "flag": "b", "integer": "q", "float": "d"}
+
+
+class ResponseStore:
+    """
+    Append-only columnar store of response records
+    """
+
+    def __init__(self, record_type: type, records: Iterable = ()):
+        """
+        Create an empty store (optionally filled from records)
+
+        Args:
+            record_type (type): Dataclass the records are built from (LLMResponse)
+            records (Iterable): Records to add
+        """
+        self.record_type = record_type
+        self.columns = [f.name for f in fields(record_type)]
+        self._kinds = {}
+        self._data = {}
+        self._pool = []
+        self._pool_index = {}
+        self._blob = bytearray()
+        self._offsets = {}
+        for name in self.columns:
+            # Anything that is not a declared column stays a plain list
+            kind = self._kinds[name] = _KINDS.get(name, "object")
+            if kind == "text":
+                self._offsets[name] = array.array("q", [0])
+            elif kind == "object":
+                self._data[name] = []
+            else:
+                self._data[name] = array.array(_TYPECODES[kind])
+        self._length = 0
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self._pool_index.get(value)
+        if code is None:
+            code = self._pool_index[value] = len(self._pool)
+            self._pool.append(value)
+        return code
+
+    def append(self, record):
+        """
+        Add one record
+
+        Args:
+            record: Instance of the record type
+        """
+        for name in self.columns:
+            value = getattr(record, name)
+            kind = self._kinds[name]
+            if kind == "interned":
+                self._data[name].append(self._intern(value))
+            elif kind == "text":
+                self._blob += (value or "").encode("utf-8")
+                self._offsets[name].append(len(self._blob))
+            elif kind == "flag":
+                self._data[name].append(bool(value))
+            elif kind == "integer":
+                self._data[name].append(int(value or 0))
+            elif kind == "object":
+                self._data[name].append(value)
+            elif name == TIMESTAMP_COLUMN and isinstance(value, str):
+                self._data[name].append(datetime.fromisoformat(value).timestamp())
+            else:
+                self._data[name].append(np.nan if value is None else float(value))
+        self._length += 1
+
+    def extend(self, records: Iterable):
+        """
+        Add many records
+
+        Args:
+            records (Iterable): Instances of the record type
+        """
+        for record in records:
+            self.append(record)
+
+    def codes(self, name: str) -> np.ndarray:
+        """
+        Interned codes of a string column (-1 for None)
+
+        Args:
+            name (str): Interned column
+
+        Returns:
+            np.ndarray: int32 codes into pool()
+        """
+        # Copied: a live view into the array would block further appends
+        return np.frombuffer(self._data[name], dtype=np.int32).copy() if self._length else np.zeros(0, dtype=np.int32)
+
+    def pool(self) -> List[str]:
+        """
+        Interned strings, indexed by code
+
+        Returns:
+            List[str]: String pool shared by all interned columns
+        """
+        return self._pool
+
+    def column(self, name: str) -> Any:
+        """
+        One column as an array
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            np.ndarray: float/bool/int array for numeric columns, object array for
+                interned columns, list of str for text columns
+        """
+        kind = self._kinds[name]
+        if kind == "text":
+            offsets = self._offsets[name]
+            blob = self._blob
+            return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(self._length)]
+        if kind == "interned":
+            lookup = np.array(self._pool + [None], dtype=object)
+            return lookup[self.codes(name)]
+        if kind == "object":
+            return np.array(self._data[name], dtype=object)
+        dtype = {"flag": np.int8, "integer": np.int64, "float": np.float64}[kind]
+        values = np.frombuffer(self._data[name], dtype=dtype).copy() if self._length else np.zeros(0, dtype=dtype)
+        return values.astype(bool) if kind == "flag" else values
+
+    def set_column(self, name: str, values: Sequence):
+        """
+        Overwrite a numeric column (e.g. cost or accuracy_score after scoring)
+
+        Args:
+            name (str): Float column
+            values (Sequence): One value per row (None or NaN for missing)
+        """
+        if self._kinds[name] != "float":
+            raise ValueError(f"Only float columns can be overwritten, not {name!r}")
+        values = np.asarray(pd.to_numeric(pd.Series(values, dtype=object), errors="coerce"), dtype=np.float64)
+        if len(values) != self._length:
+            raise ValueError(f"Expected {self._length} values for {name!r}, got {len(values)}")
+        self._data[name] = array.array("d", values.tobytes())
+
+    def frame(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Columns as a DataFrame, with interned columns as categoricals
+
+        Args:
+            columns (Sequence[str]): Columns to include (default: all but text)
+
+        Returns:
+            pd.DataFrame: One row per record
+        """
+        columns = columns or [c for c in self.columns if self._kinds[c] != "text"]
+        data = {}
+        for name in columns:
+            if self._kinds[name] == "interned":
+                data[name] = pd.Categorical.from_codes(
+                    self.codes(name), categories=pd.Index(self._pool, dtype=object)).remove_unused_categories() \
+                    if self._pool else pd.Categorical([None] * self._length)
+            else:
+                data[name] = self.column(name)
+        return pd.DataFrame(data)
+
+    def aggregate(self, by: str = "model", values: Sequence[str] = ("response_time", "tokens_used", "cost")) -> Dict:
+        """
+        Per-group count and sums/means of numeric columns, vectorized over codes
+
+        Args:
+            by (str): Interned column to group by
+            values (Sequence[str]): Float columns to aggregate
+
+        Returns:
+            Dict: {group: {"responses": n, "<col>_total": sum, "<col>_mean": mean}}
+        """
+        codes = self.codes(by)
+        present = codes >= 0
+        size = len(self._pool)
+        counts = np.bincount(codes[present], minlength=size)
+        summary = {self._pool[c]: {"responses": int(counts[c])} for c in np.flatnonzero(counts)}
+        for name in values:
+            column = self.column(name)
+            valid = present & ~np.isnan(column)
+            totals = np.bincount(codes[valid], weights=column[valid], minlength=size)
+            seen = np.bincount(codes[valid], minlength=size)
+            for code in np.flatnonzero(counts):
+                group = summary[self._pool[code]]
+                group[f"{name}_total"] = float(totals[code])
+                group[f"{name}_mean"] = float(totals[code] / seen[code]) if seen[code] else None
+        return summary
+
+    def _decoded(self, name: str, start: int, stop: int) -> List:
+        kind = self._kinds[name]
+        if kind == "text":
+            offsets = self._offsets[name]
+            return [self._blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(start, stop)]
+        if kind == "interned":
+            pool = self._pool
+            return [pool[c] if c >= 0 else None for c in self._data[name][start:stop]]
+        if kind == "object":
+            return self._data[name][start:stop]
+        if kind == "flag":
+            return [bool(v) for v in self._data[name][start:stop]]
+        if kind == "integer":
+            return list(self._data[name][start:stop])
+        values = [None if v != v else v for v in self._data[name][start:stop]]
+        if name in COUNT_COLUMNS:
+            return [None if v is None else int(v) for v in values]
+        if name == TIMESTAMP_COLUMN:
+            return [None if v is None else datetime.fromtimestamp(v).isoformat() for v in values]
+        return values
+
+    def iter_rows(self, columns: Optional[Sequence[str]] = None, chunk_size: int = 10000) -> Iterator[Dict]:
+        """
+        Stream rows as plain dicts, decoding one chunk of rows at a time
+
+        Args:
+            columns (Sequence[str]): Columns to include (default: all)
+            chunk_size (int): Rows decoded per chunk
+
+        Yields:
+            Dict: One record's values (timestamps as ISO strings)
+        """
+        columns = list(columns or self.columns)
+        for start in range(0, self._length, chunk_size):
+            stop = min(start + chunk_size, self._length)
+            decoded = [self._decoded(name, start, stop) for name in columns]
+            for values in zip(*decoded):
+                yield dict(zip(columns, values))
+
+    def __iter__(self) -> Iterator:
+        for row in self.iter_rows():
+            yield self.record_type(**row)
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("response index out of range")
+        row = {name: self._decoded(name, index, index + 1)[0] for name in self.columns}
+        return self.record_type(**row)
+
+    def write_json_array(self, f: TextIO, columns: Optional[Sequence[str]] = None, indent: str = "    "):
+        """
+        Stream every row to an open file as a JSON array
+
+        Args:
+            f (TextIO): Output file
+            columns (Sequence[str]): Columns to include (default: all)
+            indent (str): Prefix for each row's line
+        """
+        f.write("[")
+        separator = "\n"
+        for row in self.iter_rows(columns):
+            f.write(separator + indent + json.dumps(row, ensure_ascii=False))
+            separator = ",\n"
+        if self._length:
+            f.write("\n" + indent[:-2])
+        f.write("]")
+
+
+def columns_of(responses, names: Sequence[str]) -> Dict[str, Any]:
+    """
+    Read columns from a ResponseStore, or gather them from a list of records
+
+    Args:
+        responses (ResponseStore | List): Responses
+        names (Sequence[str]): Attribute names
+
+    Returns:
+        Dict[str, Any]: Column per name (array from a store, list from records)
+    """
+    if isinstance(responses, ResponseStore):
+        return {name: responses.column(name) for name in names}
+    return {name: [getattr(r, name, None) for r in responses] for name in names}
+
+
+def assign_column(responses, name: str, values: Sequence):
+    """
+    Write a column back to a ResponseStore, or set the attribute on each record
+
+    Args:
+        responses (ResponseStore | List): Responses
+        name (str): Attribute name
+        values (Sequence): One value per response (NaN is stored as None on records)
+    """
+    if isinstance(responses, ResponseStore):
+        responses.set_column(name, values)
+        return
+    for response, value in zip(responses, values):
+        setattr(response, name, None if value is None or value != value else value)
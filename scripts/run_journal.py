@@ -0,0 +1,146 @@
+"""
+Append-Only Run Journal
+For Task 05: Descriptive Statistics and Large Language Models
+
+Records every completed request as one JSON line the moment it lands, so a
+crash or Ctrl-C part-way through a run loses nothing that was already paid
+for. Each line holds the matrix cell id and the response record:
+
+    {"cell": "<sha256>", "response": {...LLMResponse fields...}}
+
+A resumed run loads the journal, restores those responses and only sends
+the cells that are missing. Repeated samples of a cell are keyed
+"<cell>#<sample>". Cell ids hash the model, max_tokens and the full
+prompt (dataset context included), so a changed dataset, question or token
+limit is a new cell rather than a stale hit.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict
+
+from dispatcher import PromptJob
+
+
+def cell_id(job: PromptJob) -> str:
+    """
+    Stable id of a matrix cell
+
+    Args:
+        job (PromptJob): Planned job
+
+    Returns:
+        str: SHA-256 hex digest of the model, max_tokens and prompt
+    """
+    canonical = json.dumps([job.model, job.max_tokens, job.prompt], ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def sample_key(cell: str, sample: int = 0) -> str:
+    """
+    Journal key of one sample of a cell (consistency mode asks each cell K times)
+
+    Args:
+        cell (str): Cell id
+        sample (int): Sample index
+
+    Returns:
+        str: The cell id for the first sample, "<cell>#<sample>" for the rest
+    """
+    return cell if sample == 0 else f"{cell}#{sample}"
+
+
+class RunJournal:
+    """
+    Thread-safe append-only JSONL journal of completed requests
+    """
+
+    def __init__(self, path: str = "results/llm_run_journal.jsonl", fsync: bool = False):
+        """
+        Initialize the journal (the file is opened on first write)
+
+        Args:
+            path (str): Journal file
+            fsync (bool): Force each record to disk (survives power loss, not just crashes)
+        """
+        self.path = path
+        self.fsync = fsync
+        self._file = None
+        self._lock = threading.Lock()
+        self.appended = 0
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Read the completed cells recorded so far
+
+        A torn final line (the process died mid-write) is ignored.
+
+        Returns:
+            Dict[str, Dict]: Response record by cell id (the latest record wins)
+        """
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and "cell" in entry and "response" in entry:
+                    completed[entry["cell"]] = entry["response"]
+        return completed
+
+    def reset(self):
+        """
+        Start a fresh journal, discarding earlier records
+        """
+        with self._lock:
+            self._close_file()
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            open(self.path, "w", encoding="utf-8").close()
+
+    def append(self, cell: str, response: Dict):
+        """
+        Record one completed request
+
+        Args:
+            cell (str): Matrix cell id
+            response (Dict): Response record
+        """
+        line = json.dumps({"cell": cell, "response": response}, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if self._file.tell() and not self._ends_with_newline():
+                    # Terminate a line torn by a crash so the next record stays parseable
+                    self._file.write("\n")
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.appended += 1
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """
+        Close the journal file
+        """
+        with self._lock:
+            self._close_file()
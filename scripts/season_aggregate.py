@@ -0,0 +1,306 @@
+"""
+Mergeable Season Aggregates
+For Task 05: Descriptive Statistics and Large Language Models
+
+Everything BasketballAnalyzer reports can be built from a small partial
+aggregate per chunk of rows, and two partials merge into one:
+    - column sums and the Games_Played maximum (team totals)
+    - the top k candidate rows of every ranking, with their row positions
+      so ties break the way DataFrame.nlargest would on the whole file
+    - per-position row counts, column sums/non-null counts and best scorer
+    - sums and counts of the derived efficiency metrics
+
+An in-memory frame is a single chunk. A file of any size can be read in
+bounded chunks (pd.read_csv(chunksize=...)) and merged as it goes, so
+memory grows with the chunk size rather than the file size.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data_schema import to_float64
+
+SUM_COLUMNS = ("Total_Points", "Total_Rebounds", "Assists", "Steals", "Blocks", "Turnovers",
+               "Field_Goals_Attempted", "Field_Goals_Made", "Three_Pointers_Attempted",
+               "Three_Pointers_Made", "Free_Throws_Attempted", "Free_Throws_Made")
+
+# Output name -> (columns kept, metric, optional (filter column, minimum), k, largest?)
+RANKINGS = {
+    "top_scorers": (["Player", "Points_Per_Game", "Total_Points"], "Points_Per_Game", None, 5, True),
+    "top_rebounders": (["Player", "Rebounds_Per_Game", "Total_Rebounds"], "Rebounds_Per_Game", None, 5, True),
+    "top_assists": (["Player", "Assists"], "Assists", None, 5, True),
+    "top_steals": (["Player", "Steals"], "Steals", None, 5, True),
+    "top_blocks": (["Player", "Blocks"], "Blocks", None, 5, True),
+    "most_efficient_shooters": (["Player", "Field_Goal_Percentage", "Field_Goals_Made", "Field_Goals_Attempted"],
+                                "Field_Goal_Percentage", ("Field_Goals_Attempted", 50), 5, True),
+    "best_3pt_shooters": (["Player", "Three_Point_Percentage", "Three_Pointers_Made", "Three_Pointers_Attempted"],
+                          "Three_Point_Percentage", ("Three_Pointers_Attempted", 20), 5, True),
+    "most_efficient_players": (["Player", "efficiency_per_minute", "efficiency_rating", "minutes_per_game"],
+                               "efficiency_per_minute", ("minutes_per_game", 10), 5, True),
+    "improvement_candidates": (["Player", "efficiency_per_minute", "minutes_per_game", "Points_Per_Game"],
+                               "efficiency_per_minute", ("minutes_per_game", 15), 3, False)
+}
+
+# Position table: column -> aggregations, in BasketballAnalyzer.position_analysis order
+POSITION_AGGREGATIONS = {
+    "Points_Per_Game": ["mean", "sum"],
+    "Rebounds_Per_Game": ["mean", "sum"],
+    "Assists": ["mean", "sum"],
+    "Steals": ["mean", "sum"],
+    "Blocks": ["mean", "sum"],
+    "Field_Goal_Percentage": ["mean"],
+    "Three_Point_Percentage": ["mean"],
+    "Free_Throw_Percentage": ["mean"]
+}
+
+EFFICIENCY_COLUMNS = ("efficiency_rating", "efficiency_per_minute")
+SAMPLE_ROWS = 5
+_ROW = "_row"
+
+
+def efficiency_columns(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    Derived efficiency metrics for each row
+
+    Args:
+        df (pd.DataFrame): Player rows
+
+    Returns:
+        Dict[str, pd.Series]: efficiency_rating, minutes_per_game and efficiency_per_minute
+    """
+    games = df['Games_Played']
+    rating = (
+        df['Points_Per_Game'] +
+        df['Rebounds_Per_Game'] * 1.2 +
+        df['Assists'] / games * 2 +
+        df['Steals'] / games * 2 +
+        df['Blocks'] / games * 2 -
+        df['Turnovers'] / games
+    )
+    minutes = df['Minutes_Played'] / games
+    return {"efficiency_rating": rating, "minutes_per_game": minutes, "efficiency_per_minute": rating / minutes}
+
+
+def _top(frame: pd.DataFrame, metric: str, k: int, largest: bool) -> pd.DataFrame:
+    # Rows are in file order, so keep="first" breaks ties as it would on the whole file
+    return frame.nlargest(k, metric) if largest else frame.nsmallest(k, metric)
+
+
+class SeasonAggregate:
+    """
+    Partial aggregate of player rows that merges with other partials
+    """
+
+    def __init__(self):
+        """
+        Create an empty aggregate
+        """
+        self.rows = 0
+        self.columns = []
+        self.sample = pd.DataFrame()
+        self.sums = {column: 0 for column in SUM_COLUMNS}
+        self.games_played_max = np.nan
+        self.rankings = {}
+        self.position_first_row = {}
+        self.position_counts = {}
+        self.position_sums = {}
+        self.position_values = {}
+        self.best_by_position = {}
+        self.efficiency_sums = {column: 0.0 for column in EFFICIENCY_COLUMNS}
+        self.efficiency_counts = {column: 0 for column in EFFICIENCY_COLUMNS}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, row_offset: int = 0) -> "SeasonAggregate":
+        """
+        Aggregate one chunk of rows
+
+        Args:
+            df (pd.DataFrame): Player rows (inferred or schema dtypes)
+            row_offset (int): Position of the chunk's first row in the whole input
+
+        Returns:
+            SeasonAggregate: The chunk's partial aggregate
+        """
+        aggregate = cls()
+        df = to_float64(df)
+        aggregate.rows = len(df)
+        aggregate.columns = list(df.columns)
+        aggregate.sample = df.head(SAMPLE_ROWS).copy() if row_offset == 0 else pd.DataFrame()
+        if df.empty:
+            return aggregate
+
+        for column in SUM_COLUMNS:
+            aggregate.sums[column] = df[column].sum()
+        aggregate.games_played_max = df['Games_Played'].max()
+
+        derived = efficiency_columns(df)
+        frame = df.assign(**derived, **{_ROW: np.arange(row_offset, row_offset + len(df))})
+        for name, (columns, metric, minimum, k, largest) in RANKINGS.items():
+            candidates = frame if minimum is None else frame[frame[minimum[0]] >= minimum[1]]
+            aggregate.rankings[name] = _top(candidates, metric, k, largest)[columns + [_ROW]]
+
+        for column in EFFICIENCY_COLUMNS:
+            values = derived[column]
+            aggregate.efficiency_sums[column] = values.sum()
+            aggregate.efficiency_counts[column] = int(values.notna().sum())
+
+        grouped = frame.groupby('Position', sort=False, observed=True)
+        aggregate.position_first_row = grouped[_ROW].min().to_dict()
+        aggregate.position_counts = grouped.size().to_dict()
+        columns = list(POSITION_AGGREGATIONS)
+        aggregate.position_sums = grouped[columns].sum().to_dict('index')
+        aggregate.position_values = grouped[columns].count().to_dict('index')
+        best = frame.loc[frame['Points_Per_Game'].notna()]
+        best = best.loc[best.groupby('Position', sort=False, observed=True)['Points_Per_Game'].idxmax()]
+        aggregate.best_by_position = {}
+        for position in range(len(best)):
+            row = best.iloc[position]
+            aggregate.best_by_position[row['Position']] = {
+                "Player": row['Player'], "Points_Per_Game": row['Points_Per_Game'],
+                "Total_Points": row['Total_Points'], _ROW: row[_ROW]}
+        return aggregate
+
+    def merge(self, other: "SeasonAggregate") -> "SeasonAggregate":
+        """
+        Fold another partial aggregate into this one
+
+        Args:
+            other (SeasonAggregate): Aggregate of other rows (any order; row positions decide ties)
+
+        Returns:
+            SeasonAggregate: self
+        """
+        if other.rows == 0:
+            return self
+        if self.rows == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+
+        self.rows += other.rows
+        if not len(self.sample):
+            self.sample = other.sample
+        for column in SUM_COLUMNS:
+            self.sums[column] = self.sums[column] + other.sums[column]
+        self.games_played_max = np.fmax(self.games_played_max, other.games_played_max)
+
+        for name, (columns, metric, _, k, largest) in RANKINGS.items():
+            candidates = pd.concat([self.rankings[name], other.rankings[name]]).sort_values(_ROW, kind="stable")
+            self.rankings[name] = _top(candidates, metric, k, largest)
+
+        for column in EFFICIENCY_COLUMNS:
+            self.efficiency_sums[column] += other.efficiency_sums[column]
+            self.efficiency_counts[column] += other.efficiency_counts[column]
+
+        for position, first_row in other.position_first_row.items():
+            if position not in self.position_counts:
+                self.position_first_row[position] = first_row
+                self.position_counts[position] = 0
+                self.position_sums[position] = {column: 0 for column in POSITION_AGGREGATIONS}
+                self.position_values[position] = {column: 0 for column in POSITION_AGGREGATIONS}
+            self.position_first_row[position] = min(self.position_first_row[position], first_row)
+            self.position_counts[position] += other.position_counts[position]
+            for column in POSITION_AGGREGATIONS:
+                self.position_sums[position][column] += other.position_sums[position][column]
+                self.position_values[position][column] += other.position_values[position][column]
+        for position, best in other.best_by_position.items():
+            current = self.best_by_position.get(position)
+            if current is None or best["Points_Per_Game"] > current["Points_Per_Game"] or \
+                    (best["Points_Per_Game"] == current["Points_Per_Game"] and best[_ROW] < current[_ROW]):
+                self.best_by_position[position] = best
+        return self
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame]) -> Tuple["SeasonAggregate", int]:
+        """
+        Aggregate a stream of chunks, keeping only one chunk in memory at a time
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Consecutive chunks of the input
+
+        Returns:
+            Tuple[SeasonAggregate, int]: The merged aggregate and the number of chunks read
+        """
+        aggregate = cls()
+        count = 0
+        for chunk in chunks:
+            aggregate.merge(cls.from_frame(chunk, aggregate.rows))
+            count += 1
+        return aggregate, count
+
+    def ranking(self, name: str) -> pd.DataFrame:
+        """
+        A ranking's rows, best first
+
+        Args:
+            name (str): Key of RANKINGS
+
+        Returns:
+            pd.DataFrame: The ranking's columns
+        """
+        return self.rankings[name].drop(columns=_ROW) if name in self.rankings else \
+            pd.DataFrame(columns=RANKINGS[name][0])
+
+    def mean(self, column: str) -> float:
+        """
+        Mean of a derived efficiency column over all rows (NaN skipped)
+
+        Args:
+            column (str): efficiency_rating or efficiency_per_minute
+
+        Returns:
+            float: Mean, or NaN with no values
+        """
+        count = self.efficiency_counts[column]
+        return self.efficiency_sums[column] / count if count else np.nan
+
+    def position_table(self) -> pd.DataFrame:
+        """
+        Per-position means and sums, as DataFrame.groupby('Position').agg(...) would give
+
+        Returns:
+            pd.DataFrame: Positions (sorted) by "<column>_<mean|sum>"
+        """
+        positions = sorted(self.position_counts)
+        columns = list(POSITION_AGGREGATIONS)
+        sums = pd.DataFrame.from_dict(self.position_sums, orient='index').reindex(index=positions, columns=columns)
+        counts = pd.DataFrame.from_dict(self.position_values, orient='index').reindex(index=positions, columns=columns)
+        # 0 / 0 is NaN, matching the mean of a position with no values
+        means = sums / counts
+        table = pd.DataFrame({f"{column}_{aggregation}": (means if aggregation == "mean" else sums)[column]
+                              for column, aggregations in POSITION_AGGREGATIONS.items()
+                              for aggregation in aggregations})
+        table.index.name = 'Position'
+        return table
+
+    def positions(self) -> List:
+        """
+        Positions in order of first appearance
+
+        Returns:
+            List: Position values
+        """
+        return sorted(self.position_first_row, key=self.position_first_row.get)
+
+    def position_count_series(self) -> pd.Series:
+        """
+        Rows per position, most common first (ties in order of first appearance)
+
+        Returns:
+            pd.Series: Counts by position
+        """
+        positions = self.positions()
+        counts = pd.Series([self.position_counts[p] for p in positions],
+                           index=pd.Index(positions, name='Position'), name='count')
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def best_players(self) -> Dict[str, Dict]:
+        """
+        Highest Points_Per_Game row per position, positions in order of first appearance
+
+        Returns:
+            Dict[str, Dict]: Player, Points_Per_Game and Total_Points by position
+        """
+        return {position: {key: value for key, value in self.best_by_position[position].items() if key != _ROW}
+                for position in self.positions() if position in self.best_by_position}
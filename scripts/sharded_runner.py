@@ -0,0 +1,285 @@
+"""
+Sharded Multi-Process Runner
+For Task 05: Descriptive Statistics and Large Language Models
+
+Splits the (model x question x sample) matrix into shards and runs them on
+a pool of worker processes. There are several shards per worker, all
+waiting in the pool's one work queue, so a worker that finishes early
+picks up the next shard instead of sitting idle behind a slow model.
+
+Every job goes to the shard picked by a hash of its cell id and sample
+index, so the split is the same on every run and on every machine. When
+batching is on, the hash uses the batch grouping key instead, so each
+batch stays whole. Each worker sends its shard and scores the answers,
+then returns its partial responses and score arrays. Every response is also
+forwarded to the parent as it lands and written to the run journal right
+away, so an interrupted run keeps everything already paid for. The parent
+puts the shard results back in job order. The responses,
+accuracy tallies and per-question report come out the same as a
+single-process run.
+
+Rate limits are divided across the workers. Per-model concurrency is
+enforced with one semaphore per model shared by every worker process, so
+the pool as a whole never has more requests in flight for a model than a
+single process would. Together these keep the pool within the provider
+limits. Rate limiting, cache, connection and resilience counters stay with
+the workers and are not merged into the parent's export.
+
+Usage:
+    python3 scripts/sharded_runner.py --workers 4 [--resume]
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from answer_matching import matcher_for
+from dispatcher import PromptJob
+from llm_tester_updated import MODEL_RATE_LIMITS, LLMResponse, LLMTester
+from rate_limiter import RateLimit
+from response_store import columns_of
+from run_journal import cell_id
+
+# The worker process's own tester, built once by _init_worker
+_worker_tester = None
+
+
+def shard_key(job: PromptJob, batched: bool = False) -> str:
+    """
+    Key that decides which shard a job runs in
+
+    Args:
+        job (PromptJob): Planned job
+        batched (bool): Keep jobs that plan_batches() would pack together in one shard
+
+    Returns:
+        str: The cell id and sample, or the batch grouping key
+    """
+    if batched and job.context is not None and job.n == 1:
+        return "\x00".join([job.model, job.instruction or "", str(job.sample), job.context])
+    return f"{job.cell_id or cell_id(job)}#{job.sample}"
+
+
+def shard_jobs(jobs: List[PromptJob], num_shards: int, batched: bool = False) -> List[List[int]]:
+    """
+    Split jobs deterministically into shards
+
+    Args:
+        jobs (List[PromptJob]): Jobs to split
+        num_shards (int): Number of shards
+        batched (bool): Keep batchable jobs together (see shard_key)
+
+    Returns:
+        List[List[int]]: Job indexes per shard, in job order
+    """
+    shards = [[] for _ in range(max(1, num_shards))]
+    for index, job in enumerate(jobs):
+        digest = hashlib.sha256(shard_key(job, batched).encode("utf-8")).digest()
+        shards[int.from_bytes(digest[:8], "big") % len(shards)].append(index)
+    return shards
+
+
+def _split_limit(limit: RateLimit, workers: int) -> RateLimit:
+    return replace(limit, requests_per_second=limit.requests_per_second / workers,
+                   tokens_per_minute=limit.tokens_per_minute / workers,
+                   burst_requests=limit.burst_requests / workers if limit.burst_requests else None)
+
+
+class _ForwardingJournal:
+    """Worker-side stand-in for RunJournal that sends each record to the parent's journal"""
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    def append(self, cell: str, response: Dict):
+        self.queue.put((cell, response))
+
+    def close(self):
+        pass
+
+
+def _init_worker(tester_kwargs: Dict, answer_key: Dict, semaphores: Dict, journal_queue):
+    global _worker_tester
+    _worker_tester = LLMTester(**tester_kwargs)
+    _worker_tester.answer_key = answer_key
+    _worker_tester.dispatcher.share_limits(semaphores)
+    if journal_queue is not None:
+        _worker_tester.journal = _ForwardingJournal(journal_queue)
+
+
+def _run_shard(shard: int, jobs: List[PromptJob]) -> Tuple[int, List[Tuple[Dict, List[LLMResponse]]], Dict]:
+    outcomes = _worker_tester.dispatch_outcomes(jobs)
+    responses = [response for _, _, member_responses in outcomes for response in member_responses]
+    columns = columns_of(responses, ["response", "answer_id"])
+    scores = matcher_for(_worker_tester.answer_key).score(columns["response"], columns["answer_id"])
+    return shard, [(result, member_responses) for _, result, member_responses in outcomes], scores
+
+
+class ShardedTester(LLMTester):
+    """
+    LLMTester that runs its question matrix on a pool of worker processes
+    """
+
+    def __init__(self, api_key: str, workers: int = 4, shards_per_worker: int = 4, **kwargs):
+        """
+        Initialize the sharded tester
+
+        Args:
+            api_key (str): OpenRouter API key
+            workers (int): Worker processes
+            shards_per_worker (int): Shards queued per worker (more shards balance uneven models better)
+            **kwargs: Passed through to LLMTester (and to each worker's tester)
+        """
+        if kwargs.get("early_stopping") is not None:
+            raise ValueError("Early stopping needs every result in one process; use LLMTester instead")
+        super().__init__(api_key, **kwargs)
+        self.workers = max(1, workers)
+        self.shards_per_worker = max(1, shards_per_worker)
+        self._new_scores = None
+
+        rate_limits = kwargs.get("rate_limits")
+        rate_limits = MODEL_RATE_LIMITS if rate_limits is None else rate_limits
+        self._worker_kwargs = dict(
+            kwargs, api_key=api_key, journal_path=None, verbose=False,
+            rate_limits={model: _split_limit(limit, self.workers) for model, limit in rate_limits.items()},
+            default_rate_limit=_split_limit(kwargs.get("default_rate_limit") or RateLimit(), self.workers))
+
+    def run_jobs(self, jobs: List[PromptJob]) -> List[LLMResponse]:
+        """
+        Send a batch of prompt jobs across the worker pool and collect successful responses
+
+        Args:
+            jobs (List[PromptJob]): Jobs to send
+
+        Returns:
+            List[LLMResponse]: Successful responses in job order, as a single process would return them
+        """
+        if not jobs:
+            self._new_scores = None
+            return []
+        shards = [shard for shard in shard_jobs(jobs, self.workers * self.shards_per_worker, self.batch_size > 1)
+                  if shard]
+        outcomes = [None] * len(jobs)
+        shard_scores = [None] * len(shards)
+
+        # Each model's in-flight limit is shared by the whole pool, not granted per worker
+        context = multiprocessing.get_context("spawn")
+        semaphores = {model: context.BoundedSemaphore(self.dispatcher.limit_for(model))
+                      for model in {job.model for job in jobs}}
+        # Workers forward each response as it lands; one thread here appends them to the journal
+        journal_queue = context.Queue() if self.journal is not None else None
+        writer = None
+        if journal_queue is not None:
+            writer = threading.Thread(target=self._write_journal, args=(journal_queue,), daemon=True)
+            writer.start()
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(shards)) or 1,
+                                     mp_context=context,
+                                     initializer=_init_worker,
+                                     initargs=(self._worker_kwargs, self.answer_key, semaphores,
+                                               journal_queue)) as pool:
+                futures = [pool.submit(_run_shard, shard, [jobs[index] for index in indexes])
+                           for shard, indexes in enumerate(shards)]
+                for done, future in enumerate(as_completed(futures), 1):
+                    shard, shard_outcomes, scores = future.result()
+                    shard_scores[shard] = scores
+                    for index, (result, member_responses) in zip(shards[shard], shard_outcomes):
+                        outcomes[index] = (jobs[index], result, member_responses)
+                    if self.verbose:
+                        print(f"  Shard {done}/{len(shards)} done: {len(shard_outcomes)} requests")
+        finally:
+            # Also on Ctrl-C or a failed shard: whatever the workers sent is journaled before returning
+            if writer is not None:
+                journal_queue.put(None)
+                writer.join(timeout=30)
+
+        self.record_unanswered(outcomes)
+        if self.verbose:
+            self.print_outcomes(outcomes)
+
+        # Put each shard's scores back in job order alongside its responses
+        slices = [None] * len(jobs)
+        for shard, indexes in enumerate(shards):
+            start = 0
+            for index in indexes:
+                count = len(outcomes[index][2])
+                slices[index] = (shard, start, count)
+                start += count
+        self._new_scores = {
+            name: np.concatenate([shard_scores[shard][name][start:start + count] for shard, start, count in slices])
+            if slices else np.zeros(0)
+            for name in ("accuracy", "precision", "recall")
+        }
+        return [response for _, _, member_responses in outcomes for response in member_responses]
+
+    def _write_journal(self, journal_queue):
+        """
+        Append records forwarded by the workers to the run journal until a None arrives
+
+        Args:
+            journal_queue (multiprocessing.Queue): (sample key, response record) pairs
+        """
+        for record in iter(journal_queue.get, None):
+            self.journal.append(*record)
+
+    def evaluate_accuracy(self, responses: List[LLMResponse],
+                          scores: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+        """
+        Evaluate accuracy using the scores merged from the workers
+
+        Responses restored from the journal come first and are scored here.
+
+        Args:
+            responses (ResponseStore | List[LLMResponse]): Responses to evaluate
+            scores (Dict[str, np.ndarray]): Precomputed scores (merged worker scores if None)
+
+        Returns:
+            Dict: Accuracy evaluation results
+        """
+        if scores is None and self._new_scores is not None:
+            restored = len(responses) - len(self._new_scores["accuracy"])
+            columns = columns_of(responses, ["response", "answer_id"])
+            head = matcher_for(self.answer_key).score(list(columns["response"])[:restored],
+                                                      list(columns["answer_id"])[:restored])
+            scores = {name: np.concatenate([head[name], self._new_scores[name]]) for name in self._new_scores}
+        return super().evaluate_accuracy(responses, scores)
+
+
+def main():
+    """
+    Main function to run sharded LLM testing
+    """
+    parser = argparse.ArgumentParser(description="Test LLMs on the basketball dataset across worker processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Worker processes")
+    parser.add_argument("--shards-per-worker", type=int, default=4, help="Shards queued per worker")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip requests already recorded in the run journal")
+    parser.add_argument("--journal", default="results/llm_run_journal.jsonl",
+                        help="Append-only journal of completed requests")
+    args = parser.parse_args()
+
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        print("❌ Please set OPENROUTER_API_KEY environment variable")
+        print("You can get an API key from: https://openrouter.ai/")
+        return
+
+    tester = ShardedTester(api_key, workers=args.workers, shards_per_worker=args.shards_per_worker,
+                           journal_path=args.journal)
+    try:
+        tester.run_comprehensive_test(resume=args.resume)
+    except KeyboardInterrupt:
+        print(f"\n⏹️ Interrupted; completed requests are saved in {args.journal}. Rerun with --resume to continue.")
+    finally:
+        tester.close()
+
+
+if __name__ == "__main__":
+    main()
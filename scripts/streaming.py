@@ -0,0 +1,157 @@
+"""
+Streaming (SSE) Response Handling
+For Task 05: Descriptive Statistics and Large Language Models
+
+Consumes OpenAI-compatible server-sent event streams from OpenRouter one
+chunk at a time. It records time-to-first-token, inter-token latency and
+decode throughput, and can stop a generation early once a stop condition
+is met.
+"""
+
+import json
+import re
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from data_encoder import estimate_tokens
+
+
+def iter_sse_events(lines: Iterable) -> Iterator[Dict]:
+    """
+    Parse server-sent event lines into JSON payloads
+
+    Comment lines (such as OpenRouter's ": OPENROUTER PROCESSING" keep-alives)
+    and blank separators are skipped. Iteration stops at "data: [DONE]".
+
+    Args:
+        lines (Iterable): Raw lines (bytes or str) from the HTTP response
+
+    Yields:
+        Dict: Decoded event payload
+    """
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return
+        try:
+            yield json.loads(data)
+        except ValueError:
+            continue
+
+
+def consume_stream(response, start_time: float,
+                   stop_condition: Optional[Callable[[str], bool]] = None) -> Dict:
+    """
+    Read a streaming completion and measure its timing
+
+    Args:
+        response: requests.Response opened with stream=True
+        start_time (float): time.time() when the request was sent
+        stop_condition (Callable[[str], bool]): Called with the text so far; True stops the stream
+
+    Returns:
+        Dict: Text, usage, total time, TTFT, inter-token latency, throughput and stop flag
+    """
+    pieces = []
+    usage = {}
+    first_token_time = None
+    last_token_time = None
+    stopped_early = False
+
+    try:
+        for event in iter_sse_events(response.iter_lines()):
+            if event.get("error"):
+                raise RuntimeError(f"Stream error: {event['error']}")
+            if event.get("usage"):
+                usage = event["usage"]
+
+            for choice in event.get("choices", []):
+                content = (choice.get("delta") or {}).get("content")
+                if not content:
+                    continue
+                now = time.time()
+                if first_token_time is None:
+                    first_token_time = now
+                last_token_time = now
+                pieces.append(content)
+
+            if stop_condition and pieces and stop_condition("".join(pieces)):
+                stopped_early = True
+                break
+    finally:
+        # Closing mid-stream drops the connection, which cancels the generation
+        response.close()
+
+    end_time = time.time()
+    text = "".join(pieces)
+    completion_tokens = usage.get("completion_tokens") if not stopped_early else None
+    if not completion_tokens:
+        completion_tokens = estimate_tokens(text)
+
+    decode_time = (last_token_time - first_token_time) if first_token_time else 0.0
+    return {
+        "response": text,
+        "usage": usage,
+        "response_time": end_time - start_time,
+        "time_to_first_token": first_token_time - start_time if first_token_time else None,
+        "inter_token_latency": decode_time / (completion_tokens - 1) if completion_tokens > 1 else None,
+        "tokens_per_second": completion_tokens / decode_time if decode_time > 0 else None,
+        "stopped_early": stopped_early
+    }
+
+
+def estimate_usage(prompt: str, text: str,
+                   count_tokens: Callable[[str], int] = estimate_tokens) -> Dict:
+    """
+    Usage for a stream that ended before its final usage chunk
+
+    The prompt is billed in full even when the generation is cut short.
+
+    Args:
+        prompt (str): Prompt that was sent
+        text (str): Text streamed before the stream ended
+        count_tokens (Callable[[str], int]): Token counter (the pre-flight tokenizer)
+
+    Returns:
+        Dict: Estimated prompt, completion and total tokens, flagged "estimated"
+    """
+    prompt_tokens = count_tokens(prompt)
+    completion_tokens = count_tokens(text)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "estimated": True
+    }
+
+
+def stop_after_tokens(limit: int) -> Callable[[str], bool]:
+    """
+    Stop condition that fires once the estimated output reaches a token count
+
+    Args:
+        limit (int): Estimated completion tokens to allow
+
+    Returns:
+        Callable[[str], bool]: Stop condition
+    """
+    return lambda text: estimate_tokens(text) >= limit
+
+
+def stop_on_pattern(pattern: str) -> Callable[[str], bool]:
+    """
+    Stop condition that fires once the output matches a regular expression
+
+    Args:
+        pattern (str): Regular expression to search for
+
+    Returns:
+        Callable[[str], bool]: Stop condition
+    """
+    compiled = re.compile(pattern)
+    return lambda text: compiled.search(text) is not None
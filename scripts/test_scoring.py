@@ -0,0 +1,93 @@
+"""
+Offline checks for response scoring and the sharded runner
+
+Run with: python -m pytest scripts/test_scoring.py
+No API key or dataset is needed; the answer key is built by hand.
+"""
+
+import math
+
+from answer_matching import AnswerMatcher
+from name_index import NameIndex
+from rate_limiter import RateLimit
+from sharded_runner import ShardedTester
+
+PLAYERS = ["Dyaisha Fair", "Georgia Woolley", "Alaina Rice", "Alyssa Latham"]
+
+ANSWER_KEY = {
+    "fingerprint": "test",
+    "answers": {
+        "leading_scorer": {"answer": "Dyaisha Fair", "kind": "name", "items": ["Dyaisha Fair"],
+                           "aliases": {}, "value": None},
+        "top_fg_percentage": {"answer": "Alyssa Latham", "kind": "name", "items": ["Alyssa Latham"],
+                              "aliases": {}, "value": None},
+        "top_position_ppg": {"answer": "Forward", "kind": "name", "items": ["Forward"],
+                             "aliases": {"Forward": ["F"]}, "value": None}
+    },
+    "entities": {
+        "player": PLAYERS,
+        "position": {"Guard": ["G"], "Forward": ["F"], "Center": ["C"]}
+    }
+}
+
+
+def score_one(text, answer_id):
+    scores = AnswerMatcher(ANSWER_KEY).score([text], [answer_id])
+    return {name: float(values[0]) for name, values in scores.items()}
+
+
+def test_right_answer_scores_one():
+    assert score_one("Dyaisha Fair led the team in scoring.", "leading_scorer")["accuracy"] == 1.0
+
+
+def test_right_name_plus_wrong_name_scores_below_one():
+    scores = score_one("Georgia Woolley is the leading scorer, well ahead of Dyaisha Fair.", "leading_scorer")
+    assert scores["recall"] == 1.0
+    assert scores["accuracy"] < 1.0
+
+    scores = score_one("Dyaisha Fair, not Alyssa Latham", "top_fg_percentage")
+    assert scores["recall"] == 1.0
+    assert scores["accuracy"] < 1.0
+
+
+def test_listing_every_option_scores_below_one():
+    scores = score_one("Guard, Forward and Center all matter; Forwards lead.", "top_position_ppg")
+    assert scores["recall"] == 1.0
+    assert math.isclose(scores["precision"], 1 / 3)
+    assert scores["accuracy"] < 1.0
+
+
+def test_plural_positions_match():
+    scores = score_one("Forwards score the most; guards score less.", "top_position_ppg")
+    assert scores["recall"] == 1.0
+    assert scores["precision"] == 0.5
+
+    assert score_one("Forwards score the most.", "top_position_ppg")["accuracy"] == 1.0
+
+
+def test_plural_player_names_do_not_match_exactly():
+    _, found = AnswerMatcher(ANSWER_KEY).scan_entities(["The Dyaisha Fairs of this league are rare."])
+    assert found.size == 0
+
+
+def test_sentence_initial_word_is_not_a_player():
+    scores = score_one("Fair question! The leading scorer is Georgia Woolley.", "leading_scorer")
+    assert scores["recall"] == 0.0
+    assert scores["accuracy"] == 0.0
+
+
+def test_single_name_mid_sentence_still_resolves():
+    assert score_one("The leading scorer was Fair, by a distance.", "leading_scorer")["accuracy"] == 1.0
+    mentions = NameIndex(PLAYERS).find_mentions("Fair question! Ask Woolley.")
+    assert [match.name for _, _, match in mentions] == ["Georgia Woolley"]
+
+
+def test_sharded_workers_split_the_default_rate_limit():
+    tester = ShardedTester("test-key", workers=4, journal_path=None)
+    default = tester._worker_kwargs["default_rate_limit"]
+    assert math.isclose(default.requests_per_second, RateLimit().requests_per_second / 4)
+    assert math.isclose(default.tokens_per_minute, RateLimit().tokens_per_minute / 4)
+
+    tester = ShardedTester("test-key", workers=4, journal_path=None,
+                           default_rate_limit=RateLimit(requests_per_second=8.0))
+    assert math.isclose(tester._worker_kwargs["default_rate_limit"].requests_per_second, 2.0)
@@ -1,7 +1,11 @@
 """
 Simple test script to verify OpenRouter API setup
+
+With --probe, every model in LLMProvider is probed concurrently instead and
+a latency baseline is written for llm_tester_updated.py to use.
 """
 
+import argparse
 import os
 import requests
 import json
@@ -23,10 +27,13 @@ def test_openrouter_setup():
     print(f"✅ API Key found: {api_key[:10]}...")
     
     # Test API connectivity
-    headers = {
+    session = requests.Session()
+    session.headers.update({
         "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
     
     # Simple test prompt
     test_payload = {
@@ -42,11 +49,10 @@ def test_openrouter_setup():
     
     try:
         print("🔄 Testing API connection...")
-        response = requests.post(
+        response = session.post(
             "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
             json=test_payload,
-            timeout=30
+            timeout=(10, 30)
         )
         
         if response.status_code == 200:
@@ -63,6 +69,8 @@ def test_openrouter_setup():
     except Exception as e:
         print(f"❌ Connection error: {e}")
         return False
+    finally:
+        session.close()
 
 def test_basketball_data():
     """
@@ -83,10 +91,65 @@ def test_basketball_data():
         print(f"❌ Basketball data loading failed: {e}")
         return False
 
+def probe_all_models(base_url="https://openrouter.ai/api/v1", timeout=10.0,
+                     baseline_path="results/model_baseline.json"):
+    """
+    Probe every LLMProvider model concurrently and write the latency baseline
+    
+    Args:
+        base_url (str): OpenRouter API base URL
+        timeout (float): Read timeout per probe request in seconds
+        baseline_path (str): Where to write the baseline
+        
+    Returns:
+        bool: True if at least one model answered
+    """
+    print("🩺 Probing Model Health")
+    print("=" * 40)
+    
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        print("❌ OPENROUTER_API_KEY not found in environment variables")
+        print("Please set it with: export OPENROUTER_API_KEY='your-key-here'")
+        return False
+    
+    from llm_tester_updated import LLMProvider
+    from model_probe import probe_models, write_baseline
+    
+    models = [provider.value for provider in LLMProvider]
+    print(f"🔄 Probing {len(models)} models (timeout {timeout:.0f}s)...")
+    probes = probe_models(models, api_key, base_url, timeout=(min(timeout, 5.0), timeout))
+    
+    seconds = lambda value: f"{value:.2f}s" if value is not None else "-"
+    print(f"\n{'Model':<42} {'Cold':>7} {'Warm':>7} {'TTFT cold':>10} {'TTFT warm':>10}")
+    for model, probe in probes.items():
+        if probe["alive"]:
+            print(f"✅ {model:<40} {seconds(probe['cold_latency']):>7} {seconds(probe['warm_latency']):>7} "
+                  f"{seconds(probe['cold_ttft']):>10} {seconds(probe['warm_ttft']):>10}")
+        else:
+            print(f"❌ {model:<40} {probe['error']}")
+    
+    write_baseline(probes, baseline_path, base_url)
+    alive = sum(probe["alive"] for probe in probes.values())
+    print(f"\n{alive}/{len(probes)} models answered; baseline saved to {baseline_path}")
+    return alive > 0
+
 def main():
     """
     Run all setup tests
     """
+    parser = argparse.ArgumentParser(description="Verify the LLM testing setup")
+    parser.add_argument("--probe", action="store_true",
+                        help="Probe every model concurrently and write a latency baseline")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request probe timeout in seconds")
+    parser.add_argument("--baseline", default="results/model_baseline.json", help="Baseline file to write")
+    parser.add_argument("--base-url", default="https://openrouter.ai/api/v1", help="OpenRouter API base URL")
+    args = parser.parse_args()
+    
+    if args.probe:
+        probe_all_models(args.base_url, args.timeout, args.baseline)
+        return
+    
     print("🚀 Task 05: LLM Testing Setup Verification")
     print("=" * 50)
     
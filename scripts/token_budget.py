@@ -0,0 +1,229 @@
+"""
+Pre-Flight Token Counting and Budget Enforcement
+For Task 05: Descriptive Statistics and Large Language Models
+
+Counts prompt tokens locally before anything is sent, projects the cost of
+the whole (model x question) matrix, and enforces per-run and per-model
+dollar or token budgets by downgrading models to cheaper ones or aborting.
+
+Tokenizers are pluggable: tiktoken is used when installed, with a fast
+regex heuristic as the fallback.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from data_encoder import estimate_tokens
+from dispatcher import PromptJob
+
+_TOKENIZERS = {"heuristic": estimate_tokens}
+
+
+class BudgetExceededError(Exception):
+    """Raised when the projected cost of a run cannot be brought within budget"""
+
+
+def register_tokenizer(name: str, count_fn: Callable[[str], int]):
+    """
+    Register a token counting function
+
+    Args:
+        name (str): Name used with get_tokenizer()
+        count_fn (Callable[[str], int]): Returns the token count of a string
+    """
+    _TOKENIZERS[name] = count_fn
+
+
+def get_tokenizer(name: str = "auto") -> Tuple[str, Callable[[str], int]]:
+    """
+    Look up a token counter
+
+    "auto" uses tiktoken's cl100k_base encoding if tiktoken is installed and
+    falls back to the heuristic otherwise.
+
+    Args:
+        name (str): "auto", "heuristic", "tiktoken" or a registered name
+
+    Returns:
+        Tuple[str, Callable[[str], int]]: Resolved tokenizer name and counting function
+    """
+    if name in ("auto", "tiktoken") and "tiktoken" not in _TOKENIZERS:
+        try:
+            import tiktoken
+            encoding = tiktoken.get_encoding("cl100k_base")
+            register_tokenizer("tiktoken", lambda text: len(encoding.encode(text, disallowed_special=())))
+        except Exception:
+            if name == "tiktoken":
+                raise ValueError("tiktoken is not installed (pip install tiktoken)")
+
+    if name == "auto":
+        name = "tiktoken" if "tiktoken" in _TOKENIZERS else "heuristic"
+    if name not in _TOKENIZERS:
+        raise ValueError(f"Unknown tokenizer '{name}', registered: {sorted(_TOKENIZERS)}")
+    return name, _TOKENIZERS[name]
+
+
+@dataclass
+class BudgetPolicy:
+    """
+    Limits for one run
+
+    Any limit left as None is not enforced. Model limits apply to each
+    model separately. on_exceed is "abort" (refuse to run) or "downgrade"
+    (move over-budget models' questions to cheaper models first).
+    """
+    max_run_cost: Optional[float] = None
+    max_run_tokens: Optional[int] = None
+    max_model_cost: Optional[float] = None
+    max_model_tokens: Optional[int] = None
+    model_cost_limits: Dict[str, float] = field(default_factory=dict)
+    on_exceed: str = "downgrade"
+    completion_ratio: float = 1.0
+
+
+def project_jobs(jobs: List[PromptJob], count_tokens: Callable[[str], int],
+                 cost_fn: Callable[[str, int, int], float],
+                 completion_ratio: float = 1.0) -> List[Dict]:
+    """
+    Project tokens and cost for each job before sending it
+
+    Args:
+        jobs (List[PromptJob]): Jobs to project
+        count_tokens (Callable[[str], int]): Token counter
+        cost_fn (Callable[[str, int, int], float]): (model, prompt_tokens, completion_tokens) -> USD
+        completion_ratio (float): Fraction of max_tokens expected in the reply (1.0 is worst case)
+
+    Returns:
+        List[Dict]: Per-job model, prompt tokens, completion tokens, total tokens and cost
+    """
+    prompt_counts = {}
+    projections = []
+    for job in jobs:
+        if job.prompt not in prompt_counts:
+            prompt_counts[job.prompt] = count_tokens(job.prompt)
+        prompt_tokens = prompt_counts[job.prompt]
+        completion_tokens = int(job.max_tokens * completion_ratio) * job.n
+        projections.append({
+            "model": job.model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cost": cost_fn(job.model, prompt_tokens, completion_tokens)
+        })
+    return projections
+
+
+def summarize_projection(projections: List[Dict]) -> Dict:
+    """
+    Total projected tokens and cost for the run and per model
+
+    Args:
+        projections (List[Dict]): Output of project_jobs()
+
+    Returns:
+        Dict: {"total_tokens", "total_cost", "by_model": {model: {"requests", "tokens", "cost"}}}
+    """
+    by_model = {}
+    for p in projections:
+        entry = by_model.setdefault(p["model"], {"requests": 0, "tokens": 0, "cost": 0.0})
+        entry["requests"] += 1
+        entry["tokens"] += p["total_tokens"]
+        entry["cost"] += p["cost"]
+    return {
+        "total_tokens": sum(e["tokens"] for e in by_model.values()),
+        "total_cost": sum(e["cost"] for e in by_model.values()),
+        "by_model": by_model
+    }
+
+
+def _model_over_budget(model: str, entry: Dict, policy: BudgetPolicy) -> bool:
+    cost_limit = policy.model_cost_limits.get(model, policy.max_model_cost)
+    if cost_limit is not None and entry["cost"] > cost_limit:
+        return True
+    return policy.max_model_tokens is not None and entry["tokens"] > policy.max_model_tokens
+
+
+def _run_over_budget(summary: Dict, policy: BudgetPolicy) -> bool:
+    if policy.max_run_cost is not None and summary["total_cost"] > policy.max_run_cost:
+        return True
+    return policy.max_run_tokens is not None and summary["total_tokens"] > policy.max_run_tokens
+
+
+def _token_overrun(summary: Dict, policy: BudgetPolicy) -> Optional[str]:
+    # Token counts do not depend on the model, so no downgrade can fix these
+    if policy.max_run_tokens is not None and summary["total_tokens"] > policy.max_run_tokens:
+        return f"Projected {summary['total_tokens']:,} tokens exceeds max_run_tokens ({policy.max_run_tokens:,})"
+    over = [m for m, e in summary["by_model"].items()
+            if policy.max_model_tokens is not None and e["tokens"] > policy.max_model_tokens]
+    if over:
+        return f"Projected tokens for {', '.join(over)} exceed max_model_tokens ({policy.max_model_tokens:,})"
+    return None
+
+
+def enforce_budget(jobs: List[PromptJob], policy: BudgetPolicy,
+                   count_tokens: Callable[[str], int],
+                   cost_fn: Callable[[str, int, int], float],
+                   models_by_price: List[str]) -> Tuple[List[PromptJob], Dict]:
+    """
+    Check the projected cost of a run against a budget and fix it if allowed
+
+    In "downgrade" mode, the most expensive over-budget model's questions
+    are moved to the next strictly cheaper model in models_by_price. This
+    repeats until every limit holds or no cheaper model is left. Token
+    limits are checked first: a cheaper model sends the same tokens, so a
+    token overrun is an error in either mode.
+
+    Args:
+        jobs (List[PromptJob]): Planned jobs
+        policy (BudgetPolicy): Budget limits
+        count_tokens (Callable[[str], int]): Token counter
+        cost_fn (Callable[[str, int, int], float]): (model, prompt_tokens, completion_tokens) -> USD
+        models_by_price (List[str]): Candidate models, cheapest first
+
+    Returns:
+        Tuple[List[PromptJob], Dict]: Jobs to run and a report with the projection and any downgrades
+
+    Raises:
+        BudgetExceededError: If the run cannot be brought within budget
+    """
+    downgrades = []
+    original = summarize_projection(project_jobs(jobs, count_tokens, cost_fn, policy.completion_ratio))
+    token_error = _token_overrun(original, policy)
+    if token_error:
+        raise BudgetExceededError(f"{token_error}; switching to cheaper models does not reduce tokens")
+
+    while True:
+        summary = summarize_projection(project_jobs(jobs, count_tokens, cost_fn, policy.completion_ratio))
+        over_models = [m for m, e in summary["by_model"].items() if _model_over_budget(m, e, policy)]
+        run_over = _run_over_budget(summary, policy)
+        if not over_models and not run_over:
+            break
+
+        if policy.on_exceed != "downgrade":
+            raise BudgetExceededError(
+                f"Projected ${summary['total_cost']:.4f} / {summary['total_tokens']:,} tokens exceeds budget"
+                + (f" (over-budget models: {', '.join(over_models)})" if over_models else ""))
+
+        # Downgrade the most expensive offending model (any model if only the run total is over)
+        candidates = over_models or list(summary["by_model"])
+        model = max(candidates, key=lambda m: summary["by_model"][m]["cost"])
+        unit_cost = cost_fn(model, 1000, 1000)
+        cheaper = [m for m in models_by_price if cost_fn(m, 1000, 1000) < unit_cost]
+        target = None
+        for candidate in reversed(cheaper):
+            moved = [replace(job, model=candidate) if job.model == model else job for job in jobs]
+            moved_summary = summarize_projection(project_jobs(moved, count_tokens, cost_fn, policy.completion_ratio))
+            # Skip fallbacks that the moved questions would push over their own limit
+            if not _model_over_budget(candidate, moved_summary["by_model"][candidate], policy):
+                target = candidate
+                break
+        if target is None:
+            raise BudgetExceededError(
+                f"Projected ${summary['total_cost']:.4f} exceeds budget and {model} has no cheaper "
+                f"fallback with room left")
+
+        jobs = moved
+        downgrades.append({"from": model, "to": target,
+                           "requests": summary["by_model"][model]["requests"]})
+
+    return jobs, {"original_projection": original, "projection": summary, "downgrades": downgrades}